@@ -47,7 +47,32 @@ END //
 DELIMITER ;
 
 -- =============================================
--- 2. Trigger: Update Product Stock and Sales Stats
+-- 2. Trigger: Assign Transaction Numbers
+-- =============================================
+-- Generates transaction_number server-side when the INSERT omits it.
+-- UUID_SHORT() is monotonically increasing per server, so the suffix is
+-- unique without referencing the not-yet-assigned sale_id (reading
+-- LAST_INSERT_ID() inside the same INSERT's VALUES returns the previous
+-- statement's id, not this row's).
+DELIMITER //
+
+CREATE TRIGGER before_sale_insert
+BEFORE INSERT ON sales
+FOR EACH ROW
+BEGIN
+    IF NEW.transaction_number IS NULL OR NEW.transaction_number = '' THEN
+        SET NEW.transaction_number = CONCAT(
+            'TRX',
+            DATE_FORMAT(CURDATE(), '%Y%m%d'),
+            LPAD(UUID_SHORT() MOD 100000000, 8, '0')
+        );
+    END IF;
+END //
+
+DELIMITER ;
+
+-- =============================================
+-- 3. Trigger: Update Product Stock and Sales Stats
 -- =============================================
 DELIMITER //
 
@@ -97,7 +122,7 @@ END //
 DELIMITER ;
 
 -- =============================================
--- 3. Stored Procedure: Generate Sales Report
+-- 4. Stored Procedure: Generate Sales Report
 -- =============================================
 DELIMITER //
 
@@ -0,0 +1,98 @@
+-- =============================================
+-- Materialized Summary Tables
+-- =============================================
+-- MySQL has no materialized views, so the sales_summary aggregation used
+-- by the sales performance analysis is materialized into a rollup table
+-- refreshed by a stored procedure and a nightly event. Interactive
+-- queries then filter the precomputed daily rows instead of re-scanning
+-- the full sales table.
+
+USE sales_manager;
+
+CREATE TABLE IF NOT EXISTS mv_sales_summary_daily (
+    employee_id INT NOT NULL,
+    category_id INT NOT NULL,
+    day DATE NOT NULL,
+    total_transactions INT NOT NULL,
+    total_quantity_sold INT NOT NULL,
+    total_revenue DECIMAL(12,2) NOT NULL,
+    total_discounts_given DECIMAL(12,2) NOT NULL,
+    PRIMARY KEY (employee_id, category_id, day)
+);
+
+DELIMITER //
+
+CREATE PROCEDURE refresh_sales_summary_daily()
+COMMENT 'Rebuilds the daily sales summary rollup from the sales table'
+BEGIN
+    -- True rebuild inside one transaction, matching REFRESH MATERIALIZED
+    -- VIEW semantics: an upsert alone would keep rows for groups whose
+    -- sales were deleted or corrected, overcounting forever
+    START TRANSACTION;
+    DELETE FROM mv_sales_summary_daily;
+    INSERT INTO mv_sales_summary_daily
+    SELECT
+        s.sales_person_id AS employee_id,
+        p.category_id,
+        DATE(s.sale_date) AS day,
+        COUNT(s.sale_id) AS total_transactions,
+        SUM(s.quantity) AS total_quantity_sold,
+        SUM(s.total_price) AS total_revenue,
+        SUM(s.discount) AS total_discounts_given
+    FROM sales s
+    INNER JOIN products p ON s.product_id = p.product_id
+    GROUP BY s.sales_person_id, p.category_id, DATE(s.sale_date);
+    COMMIT;
+END //
+
+DELIMITER ;
+
+-- Nightly refresh; requires event_scheduler = ON
+CREATE EVENT IF NOT EXISTS ev_refresh_sales_summary_daily
+ON SCHEDULE EVERY 1 DAY
+STARTS CURRENT_DATE + INTERVAL 1 DAY + INTERVAL 2 HOUR
+DO CALL refresh_sales_summary_daily();
+
+-- =============================================
+-- Daily Distinct-Customer Rollup
+-- =============================================
+-- MySQL has no HLL / approx_count_distinct, so the expensive
+-- COUNT(DISTINCT s.customer_id) in the geographic dashboard query is
+-- served from a pre-deduplicated (city, day, customer) rollup instead.
+-- Each day's distinct pairs are materialized once; counting distinct
+-- customers over any date range then scans the small rollup rather
+-- than hashing the full sales table, and cross-day merges stay exact.
+
+CREATE TABLE IF NOT EXISTS mv_city_daily_customers (
+    city_id INT NOT NULL,
+    day DATE NOT NULL,
+    customer_id INT NOT NULL,
+    PRIMARY KEY (city_id, day, customer_id)
+);
+
+DELIMITER //
+
+CREATE PROCEDURE refresh_city_daily_customers()
+COMMENT 'Rebuilds the per-city daily distinct-customer rollup'
+BEGIN
+    -- True rebuild inside one transaction: an upsert alone would keep
+    -- (city, day, customer) rows for deleted or corrected sales,
+    -- drifting the distinct counts permanently upward
+    START TRANSACTION;
+    DELETE FROM mv_city_daily_customers;
+    INSERT INTO mv_city_daily_customers
+    SELECT DISTINCT
+        c.city_id,
+        DATE(s.sale_date) AS day,
+        s.customer_id
+    FROM sales s
+    INNER JOIN customers c ON s.customer_id = c.customer_id;
+    COMMIT;
+END //
+
+DELIMITER ;
+
+CREATE EVENT IF NOT EXISTS ev_refresh_city_daily_customers
+ON SCHEDULE EVERY 1 DAY
+STARTS CURRENT_DATE + INTERVAL 1 DAY + INTERVAL 2 HOUR
+DO CALL refresh_city_daily_customers();
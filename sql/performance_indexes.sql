@@ -0,0 +1,30 @@
+-- =============================================
+-- Performance Indexes for Analytic Queries
+-- =============================================
+-- Composite covering indexes that support the CTE / window-function
+-- queries in src/database/advanced_queries.py. The trailing columns let
+-- MySQL serve the aggregations from the index (index-only scan) and feed
+-- window functions pre-sorted input, avoiding external sorts.
+-- MySQL has no INCLUDE clause, so the covered columns are appended to
+-- the key list instead.
+
+USE sales_manager;
+
+-- Sales performance analysis: aggregate by salesperson within a date range
+CREATE INDEX idx_sales_date_person_product
+    ON sales (sale_date, sales_person_id, product_id, quantity, total_price, discount);
+
+-- Customer segmentation (RFM): aggregate per customer over recent months
+CREATE INDEX idx_sales_customer_date
+    ON sales (customer_id, sale_date, total_price, quantity, product_id);
+
+-- Product performance trends: per-product time-series aggregation
+CREATE INDEX idx_sales_product_date
+    ON sales (product_id, sale_date, quantity, total_price);
+
+-- Dashboard daily trends: date-bucketed aggregation over the last N days
+CREATE INDEX idx_sales_date_covering
+    ON sales (sale_date, total_price, quantity, customer_id);
+
+-- Verify with: EXPLAIN FORMAT=JSON <query>; the plans should show
+-- "using_index": true and no filesort feeding the window functions.
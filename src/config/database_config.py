@@ -1,8 +1,32 @@
 import os
-from typing import Dict, Any
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from dotenv import load_dotenv
 
 
+@lru_cache(maxsize=1)
+def _load_config() -> Dict[str, Any]:
+    """
+    Load database configuration from environment variables.
+
+    The result is cached for the lifetime of the process so that
+    `load_dotenv()` and the dictionary construction happen exactly once,
+    no matter how many DatabaseConfig instances are created.
+
+    Returns:
+        Dict[str, Any]: Dictionary containing database configuration.
+    """
+    load_dotenv()
+    return {
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'port': int(os.getenv('DB_PORT', '3306')),
+        'database': os.getenv('DB_NAME', 'sales_manager'),
+        'user': os.getenv('DB_USER', 'root'),
+        'password': os.getenv('DB_PASSWORD', '12345678'),
+    }
+
+
 class DatabaseConfig:
     """
     DatabaseConfig handles the configuration and connection settings for the database.
@@ -12,42 +36,40 @@ class DatabaseConfig:
 
     def __init__(self):
         """
-        Initialize the database configuration by loading environment variables.
+        Initialize the database configuration from the cached environment settings.
         """
-        load_dotenv()
-        self._config = self._load_config()
+        self._config = _load_config()
+        redacted = {**self._config, 'password': '****'}
+        self._repr = f"DatabaseConfig({redacted})"
 
-    def _load_config(self) -> Dict[str, Any]:
+    @cached_property
+    def connection_string(self) -> str:
         """
-        Load database configuration from environment variables.
-        
+        Get the database connection string.
+
+        The string is built on first access and reused afterwards since the
+        underlying configuration never changes during the process lifetime.
+
         Returns:
-            Dict[str, Any]: Dictionary containing database configuration.
+            str: MySQL connection string.
         """
-        return {
-            'host': os.getenv('DB_HOST', 'localhost'),
-            'port': int(os.getenv('DB_PORT', '3306')),
-            'database': os.getenv('DB_NAME', 'sales_manager'),
-            'user': os.getenv('DB_USER', 'root'),
-            'password': os.getenv('DB_PASSWORD', '12345678'),
-        }
+        config = self._config
+        return f"mysql+pymysql://{config['user']}:{config['password']}@{config['host']}:{config['port']}/{config['database']}"
 
     @property
-    def connection_string(self) -> str:
+    def config(self) -> Mapping[str, Any]:
         """
-        Get the database connection string.
-        
+        Get a read-only view of the database configuration.
+
         Returns:
-            str: PostgreSQL connection string.
+            Mapping[str, Any]: Read-only mapping with the database configuration.
         """
-        config = self._config
-        return f"postgresql://{config['user']}:{config['password']}@{config['host']}:{config['port']}/{config['database']}"
+        return MappingProxyType(self._config)
 
-    @property
-    def config(self) -> Dict[str, Any]:
+    def copy(self) -> Dict[str, Any]:
         """
-        Get the database configuration dictionary.
-        
+        Get a mutable copy of the database configuration dictionary.
+
         Returns:
             Dict[str, Any]: Dictionary containing database configuration.
         """
@@ -56,10 +78,11 @@ class DatabaseConfig:
     def __str__(self) -> str:
         """
         String representation of the database configuration.
-        
+
+        The redacted repr is precomputed in __init__, so logging the
+        config does not copy and mutate the dict on every call.
+
         Returns:
             str: String representation of the configuration.
         """
-        config = self._config.copy()
-        config['password'] = '****'  # Hide password in string representation
-        return f"DatabaseConfig({config})" 
\ No newline at end of file
+        return self._repr
@@ -8,12 +8,168 @@ Author: Sales Manager System
 Date: 2024
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Dict, List, Any, Optional
 from datetime import datetime, date
+import numpy as np
 import pandas as pd
 from .connection import DatabaseConnection
 
 
+_PRODUCT_TRENDS_TEMPLATE = """
+        WITH time_series_sales AS (
+            -- CTE 1: Aggregate sales by product and time period
+            SELECT 
+                p.product_id,
+                p.product_name,
+                c.category_name,
+                p.price as current_price,
+                {date_trunc} as time_period,
+                COUNT(s.sale_id) as transactions,
+                SUM(s.quantity) as units_sold,
+                SUM(s.total_price) as revenue,
+                AVG(s.total_price) as avg_transaction_value,
+                COUNT(DISTINCT s.customer_id) as unique_customers,
+                SUM(s.discount) as total_discounts
+            FROM products p
+            INNER JOIN categories c ON p.category_id = c.category_id
+            LEFT JOIN sales s ON p.product_id = s.product_id
+            WHERE s.sale_date >= DATE_SUB(CURDATE(), INTERVAL 18 MONTH)
+              AND (:category_id IS NULL OR c.category_id = :category_id)
+            GROUP BY p.product_id, p.product_name, c.category_name, p.price, time_period
+        ),
+        performance_trends AS (
+            -- CTE 2: Calculate trends and moving averages
+            SELECT 
+                tss.*,
+                -- Previous period comparisons using LAG
+                LAG(revenue, 1) OVER (
+                    PARTITION BY product_id 
+                    ORDER BY time_period
+                ) as previous_period_revenue,
+                
+                LAG(units_sold, 1) OVER (
+                    PARTITION BY product_id 
+                    ORDER BY time_period
+                ) as previous_period_units,
+                
+                -- Next period using LEAD for forecasting validation
+                LEAD(revenue, 1) OVER (
+                    PARTITION BY product_id 
+                    ORDER BY time_period
+                ) as next_period_revenue,
+                
+                -- Moving averages (3-period)
+                AVG(revenue) OVER (
+                    PARTITION BY product_id 
+                    ORDER BY time_period 
+                    ROWS 2 PRECEDING
+                ) as revenue_3period_ma,
+                
+                AVG(units_sold) OVER (
+                    PARTITION BY product_id 
+                    ORDER BY time_period 
+                    ROWS 2 PRECEDING
+                ) as units_3period_ma,
+                
+                -- Cumulative metrics
+                SUM(revenue) OVER (
+                    PARTITION BY product_id 
+                    ORDER BY time_period 
+                    ROWS UNBOUNDED PRECEDING
+                ) as cumulative_revenue,
+                
+                -- Performance ranking within category
+                ROW_NUMBER() OVER (
+                    PARTITION BY category_name, time_period 
+                    ORDER BY revenue DESC
+                ) as category_revenue_rank,
+                
+                -- Overall ranking
+                RANK() OVER (
+                    PARTITION BY time_period 
+                    ORDER BY revenue DESC
+                ) as overall_revenue_rank,
+                
+                -- Performance percentile
+                PERCENT_RANK() OVER (
+                    PARTITION BY category_name, time_period 
+                    ORDER BY revenue
+                ) as category_performance_percentile
+            FROM time_series_sales tss
+        )
+        SELECT 
+            pt.product_id,
+            pt.product_name,
+            pt.category_name,
+            pt.current_price,
+            pt.time_period,
+            pt.transactions,
+            pt.units_sold,
+            pt.revenue,
+            pt.avg_transaction_value,
+            pt.unique_customers,
+            pt.total_discounts,
+            pt.previous_period_revenue,
+            pt.previous_period_units,
+            pt.next_period_revenue,
+            pt.revenue_3period_ma,
+            pt.units_3period_ma,
+            pt.cumulative_revenue,
+            pt.category_revenue_rank,
+            pt.overall_revenue_rank,
+            pt.category_performance_percentile,
+            -- Calculate growth rates
+            CASE 
+                WHEN previous_period_revenue IS NOT NULL AND previous_period_revenue > 0
+                THEN ROUND(((revenue - previous_period_revenue) / previous_period_revenue) * 100, 2)
+                ELSE NULL
+            END as revenue_growth_rate,
+            
+            CASE 
+                WHEN previous_period_units IS NOT NULL AND previous_period_units > 0
+                THEN ROUND(((units_sold - previous_period_units) / CAST(previous_period_units AS DECIMAL)) * 100, 2)
+                ELSE NULL
+            END as units_growth_rate,
+            
+            -- Trend indicators
+            CASE 
+                WHEN revenue > revenue_3period_ma THEN 'Above Trend'
+                WHEN revenue < revenue_3period_ma THEN 'Below Trend'
+                ELSE 'On Trend'
+            END as revenue_trend_indicator,
+            
+            -- Performance classification
+            CASE 
+                WHEN category_performance_percentile >= 0.8 THEN 'Top Performer'
+                WHEN category_performance_percentile >= 0.6 THEN 'Good Performer'
+                WHEN category_performance_percentile >= 0.4 THEN 'Average Performer'
+                WHEN category_performance_percentile >= 0.2 THEN 'Poor Performer'
+                ELSE 'Bottom Performer'
+            END as performance_class,
+            
+            -- Calculate revenue per customer
+            ROUND(revenue / NULLIF(unique_customers, 0), 2) as revenue_per_customer,
+            
+            -- Discount impact analysis
+            ROUND((total_discounts / NULLIF(revenue, 0)) * 100, 2) as discount_rate_percent
+        FROM performance_trends pt
+        ORDER BY pt.product_id, pt.time_period;
+"""
+
+# Specialize the template once per valid aggregation period so each call is
+# a dict lookup on a stable SQL string instead of a fresh f-string build
+_PRODUCT_TRENDS_SQL = {
+    period: _PRODUCT_TRENDS_TEMPLATE.format(date_trunc=expr)
+    for period, expr in {
+        'daily': "DATE(s.sale_date)",
+        'weekly': "DATE_FORMAT(s.sale_date, '%Y-%u')",
+        'monthly': "DATE_FORMAT(s.sale_date, '%Y-%m')",
+    }.items()
+}
+
+
 class AdvancedSQLQueries:
     """
     Advanced SQL query executor with CTE and Window Functions support.
@@ -22,52 +178,45 @@ class AdvancedSQLQueries:
     that help in business decision making and performance optimization.
     """
     
-    def __init__(self):
-        """Initialize with database connection."""
-        self.db = DatabaseConnection()
-    
-    def sales_performance_analysis_with_cte(self, 
-                                          start_date: Optional[str] = None, 
-                                          end_date: Optional[str] = None) -> List[Dict[str, Any]]:
-        """
-        Advanced sales performance analysis using CTEs and window functions.
-        
-        This query uses:
-        - CTE to aggregate sales data by salesperson and product category
-        - Window functions to rank salespeople by performance
-        - ROW_NUMBER() and RANK() for detailed ranking analysis
-        
-        Args:
-            start_date (str, optional): Start date for analysis (YYYY-MM-DD)
-            end_date (str, optional): End date for analysis (YYYY-MM-DD)
-            
-        Returns:
-            List[Dict[str, Any]]: Query results with performance metrics
-        """
-        
-        query = """
-        WITH sales_summary AS (
-            -- CTE 1: Aggregate sales data by salesperson and category
-            SELECT 
-                e.employee_id,
-                CONCAT(e.first_name, ' ', e.last_name) as salesperson_name,
-                c.category_name,
+    _SALES_PERFORMANCE_SQL = """
+        WITH sales_totals AS (
+            -- CTE 1: Aggregate sales over narrow integer keys only; the
+            -- display columns are joined back afterwards, so the grouping
+            -- hash entries stay small and a covering index on
+            -- (sale_date, sales_person_id, product_id, ...) can feed the scan
+            SELECT
+                s.sales_person_id as employee_id,
+                p.category_id,
                 COUNT(s.sale_id) as total_transactions,
                 SUM(s.quantity) as total_quantity_sold,
                 SUM(s.total_price) as total_revenue,
                 AVG(s.total_price) as avg_transaction_value,
                 SUM(s.discount) as total_discounts_given
             FROM sales s
-            INNER JOIN employees e ON s.sales_person_id = e.employee_id
             INNER JOIN products p ON s.product_id = p.product_id
-            INNER JOIN categories c ON p.category_id = c.category_id
             WHERE s.sale_date >= COALESCE(:start_date, DATE_SUB(CURDATE(), INTERVAL 1 YEAR))
               AND s.sale_date <= COALESCE(:end_date, CURDATE())
-            GROUP BY e.employee_id, e.first_name, e.last_name, c.category_id, c.category_name
+            GROUP BY s.sales_person_id, p.category_id
+        ),
+        sales_summary AS (
+            -- CTE 2: Attach display names to the already-aggregated rows
+            -- (one lookup per salesperson/category pair, not per sale)
+            SELECT
+                st.employee_id,
+                CONCAT(e.first_name, ' ', e.last_name) as salesperson_name,
+                c.category_name,
+                st.total_transactions,
+                st.total_quantity_sold,
+                st.total_revenue,
+                st.avg_transaction_value,
+                st.total_discounts_given
+            FROM sales_totals st
+            INNER JOIN employees e ON st.employee_id = e.employee_id
+            INNER JOIN categories c ON st.category_id = c.category_id
         ),
         performance_metrics AS (
-            -- CTE 2: Calculate performance metrics and rankings
-            SELECT 
+            -- CTE 3: Calculate performance metrics and rankings
+            SELECT
                 employee_id,
                 salesperson_name,
                 category_name,
@@ -78,14 +227,14 @@ class AdvancedSQLQueries:
                 total_discounts_given,
                 -- Window functions for ranking
                 ROW_NUMBER() OVER (
-                    PARTITION BY category_name 
+                    PARTITION BY category_name
                     ORDER BY total_revenue DESC
                 ) as revenue_rank_in_category,
                 RANK() OVER (
                     ORDER BY total_revenue DESC
                 ) as overall_revenue_rank,
                 DENSE_RANK() OVER (
-                    PARTITION BY category_name 
+                    PARTITION BY category_name
                     ORDER BY total_transactions DESC
                 ) as transactions_rank_in_category,
                 -- Performance percentiles
@@ -94,8 +243,8 @@ class AdvancedSQLQueries:
                 ) as revenue_percentile,
                 -- Running totals
                 SUM(total_revenue) OVER (
-                    PARTITION BY employee_id 
-                    ORDER BY total_revenue DESC 
+                    PARTITION BY employee_id
+                    ORDER BY total_revenue DESC
                     ROWS UNBOUNDED PRECEDING
                 ) as cumulative_revenue,
                 -- Performance compared to category average
@@ -104,9 +253,24 @@ class AdvancedSQLQueries:
                 ) as category_avg_revenue
             FROM sales_summary
         )
-        SELECT 
-            pm.*,
-            CASE 
+        -- Explicit projection: only the columns the dashboard consumes are
+        -- carried through the final sort, keeping the sorted rows narrow
+        SELECT
+            pm.employee_id,
+            pm.salesperson_name,
+            pm.category_name,
+            pm.total_transactions,
+            pm.total_quantity_sold,
+            pm.total_revenue,
+            pm.avg_transaction_value,
+            pm.total_discounts_given,
+            pm.revenue_rank_in_category,
+            pm.overall_revenue_rank,
+            pm.transactions_rank_in_category,
+            pm.revenue_percentile,
+            pm.cumulative_revenue,
+            pm.category_avg_revenue,
+            CASE
                 WHEN pm.total_revenue > pm.category_avg_revenue THEN 'Above Average'
                 WHEN pm.total_revenue = pm.category_avg_revenue THEN 'Average'
                 ELSE 'Below Average'
@@ -116,18 +280,246 @@ class AdvancedSQLQueries:
             ROUND(pm.total_quantity_sold / NULLIF(pm.total_transactions, 0), 2) as avg_items_per_transaction,
             ROUND((pm.total_discounts_given / NULLIF(pm.total_revenue, 0)) * 100, 2) as discount_percentage
         FROM performance_metrics pm
-        ORDER BY pm.overall_revenue_rank, pm.category_name;
+        -- Bounded top-N: filtering on the per-category rank lets the
+        -- engine keep a K-sized heap per category instead of sorting the
+        -- whole tail, and LIMIT caps the rows shipped to the client
+        WHERE pm.revenue_rank_in_category <= :top_k
+        ORDER BY pm.overall_revenue_rank, pm.category_name
+        LIMIT :limit;
         """
+
+    def __init__(self):
+        """Initialize with database connection."""
+        self.db = DatabaseConnection()
+
+    def sales_performance_analysis_with_cte(self,
+                                          start_date: Optional[str] = None, 
+                                          end_date: Optional[str] = None,
+                                          top_k: int = 10,
+                                          limit: int = 500) -> List[Dict[str, Any]]:
+        """
+        Advanced sales performance analysis using CTEs and window functions.
+        
+        This query uses:
+        - CTE to aggregate sales data by salesperson and product category
+        - Window functions to rank salespeople by performance
+        - ROW_NUMBER() and RANK() for detailed ranking analysis
+        
+        Args:
+            start_date (str, optional): Start date for analysis (YYYY-MM-DD)
+            end_date (str, optional): End date for analysis (YYYY-MM-DD)
+            top_k (int): Salespeople kept per category (default: 10)
+            limit (int): Overall cap on returned rows (default: 500)
+            
+        Returns:
+            List[Dict[str, Any]]: Query results with performance metrics
+        """
+        
+        query = self._SALES_PERFORMANCE_SQL
         
+        params = {
+            'start_date': start_date,
+            'end_date': end_date,
+            'top_k': top_k,
+            'limit': limit
+        }
+
+        return self.db.execute_query(query, params)
+
+    def sales_performance_analysis_arrow(self,
+                                         start_date: Optional[str] = None,
+                                         end_date: Optional[str] = None,
+                                         top_k: int = 10,
+                                         limit: int = 500):
+        """
+        Arrow-backed variant of the sales performance analysis.
+
+        Fetches the result set as a columnar pyarrow Table, avoiding the
+        per-row Python object materialization of the default path. Feed the
+        result to export_results_to_dataframe for a zero-copy pandas view.
+
+        Args:
+            start_date (str, optional): Start date for analysis (YYYY-MM-DD)
+            end_date (str, optional): End date for analysis (YYYY-MM-DD)
+            top_k (int): Salespeople kept per category (default: 10)
+            limit (int): Overall cap on returned rows (default: 500)
+
+        Returns:
+            pyarrow.Table: Query results as an Arrow table
+        """
+        return self.db.fetch_arrow_table(
+            self._SALES_PERFORMANCE_SQL,
+            {'start_date': start_date, 'end_date': end_date,
+             'top_k': top_k, 'limit': limit}
+        )
+
+    def sales_performance_summary_from_rollup(self,
+                                              start_date: Optional[str] = None,
+                                              end_date: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Sales performance summary served from the mv_sales_summary_daily
+        rollup table (see sql/materialized_views.sql).
+
+        The per-day aggregation is precomputed by a nightly refresh, so this
+        query only combines a date slice of the rollup instead of re-scanning
+        the full sales table on every dashboard refresh.
+
+        Args:
+            start_date (str, optional): Start date for analysis (YYYY-MM-DD)
+            end_date (str, optional): End date for analysis (YYYY-MM-DD)
+
+        Returns:
+            List[Dict[str, Any]]: Aggregated performance metrics per
+            salesperson and category
+        """
+
+        query = """
+        SELECT
+            mv.employee_id,
+            CONCAT(e.first_name, ' ', e.last_name) as salesperson_name,
+            c.category_name,
+            SUM(mv.total_transactions) as total_transactions,
+            SUM(mv.total_quantity_sold) as total_quantity_sold,
+            SUM(mv.total_revenue) as total_revenue,
+            SUM(mv.total_revenue) / NULLIF(SUM(mv.total_transactions), 0) as avg_transaction_value,
+            SUM(mv.total_discounts_given) as total_discounts_given
+        FROM mv_sales_summary_daily mv
+        INNER JOIN employees e ON mv.employee_id = e.employee_id
+        INNER JOIN categories c ON mv.category_id = c.category_id
+        WHERE mv.day >= COALESCE(:start_date, DATE_SUB(CURDATE(), INTERVAL 1 YEAR))
+          AND mv.day <= COALESCE(:end_date, CURDATE())
+        GROUP BY mv.employee_id, e.first_name, e.last_name, c.category_id, c.category_name
+        ORDER BY total_revenue DESC;
+        """
+
         params = {
             'start_date': start_date,
             'end_date': end_date
         }
-        
+
         return self.db.execute_query(query, params)
-    
-    def customer_segmentation_with_window_functions(self, 
-                                                  analysis_months: int = 12) -> List[Dict[str, Any]]:
+
+    _CUSTOMER_METRICS_SQL = """
+        WITH customer_totals AS (
+            -- Aggregate the sales table over the bare customer_id so the
+            -- grouping key is a single integer; names and geography are
+            -- joined back once per customer, not once per sale
+            SELECT
+                s.customer_id,
+                -- Recency: Days since last purchase
+                DATEDIFF(:as_of_date, MAX(s.sale_date)) as days_since_last_purchase,
+                -- Frequency: Number of purchases
+                COUNT(DISTINCT s.sale_id) as total_purchases,
+                COUNT(DISTINCT s.product_id) as unique_products_bought,
+                COUNT(DISTINCT DATE(s.sale_date)) as shopping_days,
+                -- Monetary: Total spent
+                SUM(s.total_price) as total_spent,
+                AVG(s.total_price) as avg_purchase_value,
+                SUM(s.quantity) as total_items_bought,
+                -- Time-based metrics
+                MIN(s.sale_date) as first_purchase_date,
+                MAX(s.sale_date) as last_purchase_date,
+                DATEDIFF(MAX(s.sale_date), MIN(s.sale_date)) as customer_lifetime_days
+            FROM sales s
+            WHERE s.sale_date >= DATE_SUB(:as_of_date, INTERVAL :analysis_months MONTH)
+            GROUP BY s.customer_id
+        )
+        SELECT
+            ct.customer_id,
+            CONCAT(c.first_name, ' ', c.last_name) as customer_name,
+            c.gender,
+            ci.city_name,
+            co.country_name,
+            ct.days_since_last_purchase,
+            ct.total_purchases,
+            ct.unique_products_bought,
+            ct.shopping_days,
+            ct.total_spent,
+            ct.avg_purchase_value,
+            ct.total_items_bought,
+            ct.first_purchase_date,
+            ct.last_purchase_date,
+            ct.customer_lifetime_days
+        FROM customer_totals ct
+        INNER JOIN customers c ON ct.customer_id = c.customer_id
+        INNER JOIN cities ci ON c.city_id = ci.city_id
+        INNER JOIN countries co ON ci.country_id = co.country_id;
+        """
+
+    def customer_segmentation_rfm(self, analysis_months: int = 12,
+                                  as_of_date: Optional[date] = None) -> pd.DataFrame:
+        """
+        RFM customer segmentation with scoring done client-side.
+
+        Only the per-customer aggregation runs in SQL; the quintile scores,
+        segment labels and value index are computed with vectorized
+        pandas/NumPy operations. This replaces five server-side window sorts
+        with one C-level sort per score column and trims the payload sent
+        over the wire.
+
+        Args:
+            analysis_months (int): Number of months to analyze (default: 12)
+            as_of_date (date, optional): Reference date for recency and the
+                analysis window (default: today)
+
+        Returns:
+            pd.DataFrame: Customer metrics with RFM scores and segments
+        """
+        df = self.db.execute_query(self._CUSTOMER_METRICS_SQL,
+                                   {'analysis_months': analysis_months,
+                                    'as_of_date': as_of_date or date.today()})
+        if df.empty:
+            return df
+
+        # Quintile scores mirroring the NTILE(5) semantics of the SQL path
+        df['recency_score'] = pd.qcut(
+            df['days_since_last_purchase'].rank(method='first'), 5, labels=False) + 1
+        df['frequency_score'] = pd.qcut(
+            df['total_purchases'].rank(method='first', ascending=False), 5, labels=False) + 1
+        df['monetary_score'] = pd.qcut(
+            df['total_spent'].rank(method='first', ascending=False), 5, labels=False) + 1
+
+        r = df['recency_score'].to_numpy()
+        f = df['frequency_score'].to_numpy()
+        m = df['monetary_score'].to_numpy()
+
+        df['rfm_segment'] = ((6 - r) * 100 + f * 10 + m).astype(str)
+        df['customer_segment'] = np.select(
+            [
+                (r >= 4) & (f >= 4) & (m >= 4),
+                (r >= 3) & (f >= 3) & (m >= 4),
+                (r >= 4) & (f <= 2) & (m >= 3),
+                (r >= 4) & (f <= 2) & (m <= 2),
+                (r <= 2) & (f >= 4) & (m >= 4),
+                (r <= 2) & (f >= 3) & (m >= 3),
+                (r <= 3) & (f <= 2) & (m <= 2),
+            ],
+            [
+                'Champions',
+                'Loyal Customers',
+                'Potential Loyalists',
+                'New Customers',
+                'Cannot Lose Them',
+                'At Risk',
+                'Hibernating',
+            ],
+            default='Others'
+        )
+        df['customer_value_index'] = np.round(
+            (f * 0.3 + m * 0.5 + (6 - r) * 0.2) / 5 * 100, 2)
+
+        # Segment statistics without another round-trip
+        segments = df.groupby('customer_segment', sort=False)
+        df['segment_size'] = segments['customer_segment'].transform('size')
+        df['segment_avg_spent'] = segments['total_spent'].transform('mean')
+        df['segment_avg_value_index'] = segments['customer_value_index'].transform('mean')
+
+        return df.sort_values(['customer_value_index', 'total_spent'],
+                              ascending=False, ignore_index=True)
+
+    def customer_segmentation_with_window_functions(self,
+                                                  analysis_months: int = 12,
+                                                  as_of_date: Optional[date] = None) -> List[Dict[str, Any]]:
         """
         Customer segmentation analysis using CTEs and advanced window functions.
         
@@ -139,22 +531,22 @@ class AdvancedSQLQueries:
         
         Args:
             analysis_months (int): Number of months to analyze (default: 12)
+            as_of_date (date, optional): Reference date for recency and the
+                analysis window (default: today)
             
         Returns:
             List[Dict[str, Any]]: Customer segmentation results
         """
         
         query = """
-        WITH customer_metrics AS (
-            -- CTE 1: Calculate RFM metrics for each customer
+        WITH customer_totals AS (
+            -- CTE 1a: Aggregate sales over the bare customer_id; the narrow
+            -- integer grouping key keeps aggregate hash entries small and
+            -- lets the customer/date covering index drive the scan
             SELECT 
-                c.customer_id,
-                CONCAT(c.first_name, ' ', c.last_name) as customer_name,
-                c.gender,
-                ci.city_name,
-                co.country_name,
+                s.customer_id,
                 -- Recency: Days since last purchase
-                DATEDIFF(CURDATE(), MAX(s.sale_date)) as days_since_last_purchase,
+                DATEDIFF(:as_of_date, MAX(s.sale_date)) as days_since_last_purchase,
                 -- Frequency: Number of purchases
                 COUNT(DISTINCT s.sale_id) as total_purchases,
                 COUNT(DISTINCT s.product_id) as unique_products_bought,
@@ -167,16 +559,41 @@ class AdvancedSQLQueries:
                 MIN(s.sale_date) as first_purchase_date,
                 MAX(s.sale_date) as last_purchase_date,
                 DATEDIFF(MAX(s.sale_date), MIN(s.sale_date)) as customer_lifetime_days
-            FROM customers c
-            INNER JOIN sales s ON c.customer_id = s.customer_id
+            FROM sales s
+            WHERE s.sale_date >= DATE_SUB(:as_of_date, INTERVAL :analysis_months MONTH)
+            GROUP BY s.customer_id
+        ),
+        customer_metrics AS (
+            -- CTE 1b: Join names and geography back onto the aggregates
+            -- (one lookup per customer, not per sale)
+            SELECT 
+                ct.customer_id,
+                CONCAT(c.first_name, ' ', c.last_name) as customer_name,
+                c.gender,
+                ci.city_name,
+                co.country_name,
+                ct.days_since_last_purchase,
+                ct.total_purchases,
+                ct.unique_products_bought,
+                ct.shopping_days,
+                ct.total_spent,
+                ct.avg_purchase_value,
+                ct.total_items_bought,
+                ct.first_purchase_date,
+                ct.last_purchase_date,
+                ct.customer_lifetime_days
+            FROM customer_totals ct
+            INNER JOIN customers c ON ct.customer_id = c.customer_id
             INNER JOIN cities ci ON c.city_id = ci.city_id
             INNER JOIN countries co ON ci.country_id = co.country_id
-            WHERE s.sale_date >= DATE_SUB(CURDATE(), INTERVAL :analysis_months MONTH)
-            GROUP BY c.customer_id, c.first_name, c.last_name, c.gender, 
-                     ci.city_name, co.country_name
         ),
-        customer_scores AS (
-            -- CTE 2: Calculate RFM scores using window functions
+        scored_segments AS (
+            -- CTE 2: RFM scores, segment classification and value index in
+            -- one projection. The CASE and CONCAT repeat the NTILE
+            -- expressions because window aliases cannot be referenced in
+            -- the same SELECT; identical OVER clauses share a single
+            -- window sort, so this fuses two tuple-stream passes into one
+            -- instead of materializing an intermediate scores CTE.
             SELECT 
                 cm.*,
                 -- RFM Scoring using NTILE (quintiles)
@@ -208,57 +625,96 @@ class AdvancedSQLQueries:
                 ROW_NUMBER() OVER (
                     PARTITION BY city_name 
                     ORDER BY total_spent DESC
-                ) as city_spending_rank
-            FROM customer_metrics cm
-        ),
-        segmented_customers AS (
-            -- CTE 3: Create customer segments
-            SELECT 
-                cs.*,
+                ) as city_spending_rank,
+                
                 -- Create RFM segment
                 CONCAT(
-                    CAST(6 - recency_score AS CHAR), 
-                    CAST(frequency_score AS CHAR), 
-                    CAST(monetary_score AS CHAR)
+                    CAST(6 - NTILE(5) OVER (ORDER BY days_since_last_purchase) AS CHAR), 
+                    CAST(NTILE(5) OVER (ORDER BY total_purchases DESC) AS CHAR), 
+                    CAST(NTILE(5) OVER (ORDER BY total_spent DESC) AS CHAR)
                 ) as rfm_segment,
                 
                 -- Business segment classification
                 CASE 
-                    WHEN recency_score >= 4 AND frequency_score >= 4 AND monetary_score >= 4 
+                    WHEN NTILE(5) OVER (ORDER BY days_since_last_purchase) >= 4 
+                         AND NTILE(5) OVER (ORDER BY total_purchases DESC) >= 4 
+                         AND NTILE(5) OVER (ORDER BY total_spent DESC) >= 4 
                         THEN 'Champions'
-                    WHEN recency_score >= 3 AND frequency_score >= 3 AND monetary_score >= 4 
+                    WHEN NTILE(5) OVER (ORDER BY days_since_last_purchase) >= 3 
+                         AND NTILE(5) OVER (ORDER BY total_purchases DESC) >= 3 
+                         AND NTILE(5) OVER (ORDER BY total_spent DESC) >= 4 
                         THEN 'Loyal Customers'
-                    WHEN recency_score >= 4 AND frequency_score <= 2 AND monetary_score >= 3 
+                    WHEN NTILE(5) OVER (ORDER BY days_since_last_purchase) >= 4 
+                         AND NTILE(5) OVER (ORDER BY total_purchases DESC) <= 2 
+                         AND NTILE(5) OVER (ORDER BY total_spent DESC) >= 3 
                         THEN 'Potential Loyalists'
-                    WHEN recency_score >= 4 AND frequency_score <= 2 AND monetary_score <= 2 
+                    WHEN NTILE(5) OVER (ORDER BY days_since_last_purchase) >= 4 
+                         AND NTILE(5) OVER (ORDER BY total_purchases DESC) <= 2 
+                         AND NTILE(5) OVER (ORDER BY total_spent DESC) <= 2 
                         THEN 'New Customers'
-                    WHEN recency_score <= 2 AND frequency_score >= 3 AND monetary_score >= 3 
+                    WHEN NTILE(5) OVER (ORDER BY days_since_last_purchase) <= 2 
+                         AND NTILE(5) OVER (ORDER BY total_purchases DESC) >= 3 
+                         AND NTILE(5) OVER (ORDER BY total_spent DESC) >= 3 
                         THEN 'At Risk'
-                    WHEN recency_score <= 2 AND frequency_score >= 4 AND monetary_score >= 4 
+                    WHEN NTILE(5) OVER (ORDER BY days_since_last_purchase) <= 2 
+                         AND NTILE(5) OVER (ORDER BY total_purchases DESC) >= 4 
+                         AND NTILE(5) OVER (ORDER BY total_spent DESC) >= 4 
                         THEN 'Cannot Lose Them'
-                    WHEN recency_score <= 3 AND frequency_score <= 2 AND monetary_score <= 2 
+                    WHEN NTILE(5) OVER (ORDER BY days_since_last_purchase) <= 3 
+                         AND NTILE(5) OVER (ORDER BY total_purchases DESC) <= 2 
+                         AND NTILE(5) OVER (ORDER BY total_spent DESC) <= 2 
                         THEN 'Hibernating'
                     ELSE 'Others'
                 END as customer_segment,
                 
                 -- Calculate customer value index
                 ROUND(
-                    (frequency_score * 0.3 + monetary_score * 0.5 + (6 - recency_score) * 0.2) 
+                    (NTILE(5) OVER (ORDER BY total_purchases DESC) * 0.3 
+                     + NTILE(5) OVER (ORDER BY total_spent DESC) * 0.5 
+                     + (6 - NTILE(5) OVER (ORDER BY days_since_last_purchase)) * 0.2) 
                     / 5 * 100, 2
                 ) as customer_value_index
-            FROM customer_scores cs
+            FROM customer_metrics cm
         )
         SELECT 
-            sc.*,
+            sc.customer_id,
+            sc.customer_name,
+            sc.gender,
+            sc.city_name,
+            sc.country_name,
+            sc.days_since_last_purchase,
+            sc.total_purchases,
+            sc.unique_products_bought,
+            sc.shopping_days,
+            sc.total_spent,
+            sc.avg_purchase_value,
+            sc.total_items_bought,
+            sc.first_purchase_date,
+            sc.last_purchase_date,
+            sc.customer_lifetime_days,
+            sc.recency_score,
+            sc.frequency_score,
+            sc.monetary_score,
+            sc.spending_percentile,
+            sc.frequency_percentile,
+            sc.overall_avg_spent,
+            sc.overall_avg_purchases,
+            sc.monthly_value,
+            sc.country_spending_rank,
+            sc.city_spending_rank,
+            sc.rfm_segment,
+            sc.customer_segment,
+            sc.customer_value_index,
             -- Add segment statistics
             COUNT(*) OVER (PARTITION BY customer_segment) as segment_size,
             AVG(total_spent) OVER (PARTITION BY customer_segment) as segment_avg_spent,
             AVG(customer_value_index) OVER (PARTITION BY customer_segment) as segment_avg_value_index
-        FROM segmented_customers sc
+        FROM scored_segments sc
         ORDER BY customer_value_index DESC, total_spent DESC;
         """
         
-        params = {'analysis_months': analysis_months}
+        params = {'analysis_months': analysis_months,
+                  'as_of_date': as_of_date or date.today()}
         
         return self.db.execute_query(query, params)
     
@@ -282,136 +738,7 @@ class AdvancedSQLQueries:
             List[Dict[str, Any]]: Product performance trends
         """
         
-        # Define date truncation based on time period
-        date_trunc_map = {
-            'daily': "DATE(s.sale_date)",
-            'weekly': "DATE_FORMAT(s.sale_date, '%Y-%u')",
-            'monthly': "DATE_FORMAT(s.sale_date, '%Y-%m')"
-        }
-        
-        date_trunc = date_trunc_map.get(time_period, "DATE_FORMAT(s.sale_date, '%Y-%m')")
-        
-        query = f"""
-        WITH time_series_sales AS (
-            -- CTE 1: Aggregate sales by product and time period
-            SELECT 
-                p.product_id,
-                p.product_name,
-                c.category_name,
-                p.price as current_price,
-                {date_trunc} as time_period,
-                COUNT(s.sale_id) as transactions,
-                SUM(s.quantity) as units_sold,
-                SUM(s.total_price) as revenue,
-                AVG(s.total_price) as avg_transaction_value,
-                COUNT(DISTINCT s.customer_id) as unique_customers,
-                SUM(s.discount) as total_discounts
-            FROM products p
-            INNER JOIN categories c ON p.category_id = c.category_id
-            LEFT JOIN sales s ON p.product_id = s.product_id
-            WHERE s.sale_date >= DATE_SUB(CURDATE(), INTERVAL 18 MONTH)
-              AND (:category_id IS NULL OR c.category_id = :category_id)
-            GROUP BY p.product_id, p.product_name, c.category_name, p.price, time_period
-        ),
-        performance_trends AS (
-            -- CTE 2: Calculate trends and moving averages
-            SELECT 
-                tss.*,
-                -- Previous period comparisons using LAG
-                LAG(revenue, 1) OVER (
-                    PARTITION BY product_id 
-                    ORDER BY time_period
-                ) as previous_period_revenue,
-                
-                LAG(units_sold, 1) OVER (
-                    PARTITION BY product_id 
-                    ORDER BY time_period
-                ) as previous_period_units,
-                
-                -- Next period using LEAD for forecasting validation
-                LEAD(revenue, 1) OVER (
-                    PARTITION BY product_id 
-                    ORDER BY time_period
-                ) as next_period_revenue,
-                
-                -- Moving averages (3-period)
-                AVG(revenue) OVER (
-                    PARTITION BY product_id 
-                    ORDER BY time_period 
-                    ROWS 2 PRECEDING
-                ) as revenue_3period_ma,
-                
-                AVG(units_sold) OVER (
-                    PARTITION BY product_id 
-                    ORDER BY time_period 
-                    ROWS 2 PRECEDING
-                ) as units_3period_ma,
-                
-                -- Cumulative metrics
-                SUM(revenue) OVER (
-                    PARTITION BY product_id 
-                    ORDER BY time_period 
-                    ROWS UNBOUNDED PRECEDING
-                ) as cumulative_revenue,
-                
-                -- Performance ranking within category
-                ROW_NUMBER() OVER (
-                    PARTITION BY category_name, time_period 
-                    ORDER BY revenue DESC
-                ) as category_revenue_rank,
-                
-                -- Overall ranking
-                RANK() OVER (
-                    PARTITION BY time_period 
-                    ORDER BY revenue DESC
-                ) as overall_revenue_rank,
-                
-                -- Performance percentile
-                PERCENT_RANK() OVER (
-                    PARTITION BY category_name, time_period 
-                    ORDER BY revenue
-                ) as category_performance_percentile
-            FROM time_series_sales tss
-        )
-        SELECT 
-            pt.*,
-            -- Calculate growth rates
-            CASE 
-                WHEN previous_period_revenue IS NOT NULL AND previous_period_revenue > 0
-                THEN ROUND(((revenue - previous_period_revenue) / previous_period_revenue) * 100, 2)
-                ELSE NULL
-            END as revenue_growth_rate,
-            
-            CASE 
-                WHEN previous_period_units IS NOT NULL AND previous_period_units > 0
-                THEN ROUND(((units_sold - previous_period_units) / CAST(previous_period_units AS DECIMAL)) * 100, 2)
-                ELSE NULL
-            END as units_growth_rate,
-            
-            -- Trend indicators
-            CASE 
-                WHEN revenue > revenue_3period_ma THEN 'Above Trend'
-                WHEN revenue < revenue_3period_ma THEN 'Below Trend'
-                ELSE 'On Trend'
-            END as revenue_trend_indicator,
-            
-            -- Performance classification
-            CASE 
-                WHEN category_performance_percentile >= 0.8 THEN 'Top Performer'
-                WHEN category_performance_percentile >= 0.6 THEN 'Good Performer'
-                WHEN category_performance_percentile >= 0.4 THEN 'Average Performer'
-                WHEN category_performance_percentile >= 0.2 THEN 'Poor Performer'
-                ELSE 'Bottom Performer'
-            END as performance_class,
-            
-            -- Calculate revenue per customer
-            ROUND(revenue / NULLIF(unique_customers, 0), 2) as revenue_per_customer,
-            
-            -- Discount impact analysis
-            ROUND((total_discounts / NULLIF(revenue, 0)) * 100, 2) as discount_rate_percent
-        FROM performance_trends pt
-        ORDER BY pt.product_id, pt.time_period;
-        """
+        query = _PRODUCT_TRENDS_SQL.get(time_period, _PRODUCT_TRENDS_SQL['monthly'])
         
         params = {'category_id': category_id}
         
@@ -450,7 +777,12 @@ class AdvancedSQLQueries:
             GROUP BY DATE(s.sale_date)
         )
         SELECT 
-            ds.*,
+            ds.sale_date,
+            ds.daily_transactions,
+            ds.daily_revenue,
+            ds.daily_units,
+            ds.daily_customers,
+            ds.daily_avg_transaction,
             AVG(daily_revenue) OVER (
                 ORDER BY sale_date 
                 ROWS 6 PRECEDING
@@ -483,7 +815,12 @@ class AdvancedSQLQueries:
             GROUP BY co.country_name, ci.city_name
         )
         SELECT 
-            gp.*,
+            gp.country_name,
+            gp.city_name,
+            gp.total_sales,
+            gp.total_revenue,
+            gp.unique_customers,
+            gp.avg_transaction_value,
             RANK() OVER (ORDER BY total_revenue DESC) as revenue_rank,
             PERCENT_RANK() OVER (ORDER BY total_revenue) as revenue_percentile,
             ROUND(total_revenue / NULLIF(unique_customers, 0), 2) as revenue_per_customer
@@ -493,14 +830,113 @@ class AdvancedSQLQueries:
         
         params = {'date_range_days': date_range_days}
         
-        # Execute all queries
-        results = {
-            'sales_trends': self.db.execute_query(trends_query, params),
-            'geographic_performance': self.db.execute_query(geographic_query, params)
+        # The sub-queries are independent, so dispatch them concurrently;
+        # each worker checks out its own pooled connection and the dashboard
+        # latency approaches max(query_times) instead of their sum
+        queries = {
+            'sales_trends': trends_query,
+            'geographic_performance': geographic_query
         }
-        
+
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            futures = {name: executor.submit(self.db.execute_query, sql, params)
+                       for name, sql in queries.items()}
+            results = {name: future.result() for name, future in futures.items()}
+
         return results
     
+    def geographic_unique_customers_from_rollup(self,
+                                                date_range_days: int = 90) -> pd.DataFrame:
+        """
+        Distinct-customer counts per city served from the
+        mv_city_daily_customers rollup (see sql/materialized_views.sql).
+
+        COUNT(DISTINCT s.customer_id) over the raw sales table hashes the
+        full date-range partition on every dashboard refresh. The rollup
+        stores each day's already-deduplicated (city, customer) pairs, so
+        the distinct count here scans a far smaller table while staying
+        exact across day boundaries.
+
+        Args:
+            date_range_days (int): Number of days to analyze
+
+        Returns:
+            pd.DataFrame: Distinct customer counts per country and city
+        """
+
+        query = """
+        SELECT
+            co.country_name,
+            ci.city_name,
+            COUNT(DISTINCT mv.customer_id) as unique_customers
+        FROM mv_city_daily_customers mv
+        INNER JOIN cities ci ON mv.city_id = ci.city_id
+        INNER JOIN countries co ON ci.country_id = co.country_id
+        WHERE mv.day >= DATE_SUB(CURDATE(), INTERVAL :date_range_days DAY)
+        GROUP BY co.country_name, ci.city_name
+        ORDER BY unique_customers DESC;
+        """
+
+        return self.db.execute_query(query, {'date_range_days': date_range_days})
+
+    def compute_derived_metrics(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add revenue-per-customer and discount-rate columns in one pass.
+
+        The inputs are pulled out as contiguous float64 arrays and the
+        derivations run as whole-array NumPy expressions, so the work
+        happens in vectorized C loops rather than per-row Python. Columns
+        that are absent from the frame are simply skipped.
+
+        Args:
+            df: Result frame with revenue/unique_customers/total_discounts
+                style columns (e.g. from the dashboard queries).
+
+        Returns:
+            pd.DataFrame: The same frame with the derived columns added.
+        """
+        if df.empty:
+            return df
+
+        if {'revenue', 'unique_customers'} <= set(df.columns):
+            revenue = df['revenue'].to_numpy(dtype=np.float64)
+            customers = df['unique_customers'].to_numpy(dtype=np.float64)
+            df['revenue_per_customer'] = np.round(
+                revenue / np.maximum(customers, 1.0), 2)
+
+        if {'revenue', 'total_discounts'} <= set(df.columns):
+            revenue = df['revenue'].to_numpy(dtype=np.float64)
+            discounts = df['total_discounts'].to_numpy(dtype=np.float64)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rate = np.where(revenue > 0.0, discounts / revenue * 100.0, 0.0)
+            df['discount_rate_percent'] = np.round(rate, 2)
+
+        return df
+
+    def export_results_to_json(self, results: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Serialize a dict of result frames to row-oriented JSON strings.
+
+        Polars frames are serialized with `write_json()` straight from
+        their Arrow buffers; pandas frames fall back to
+        `to_json(orient='records')`. Either way the per-row Python dict
+        step that `json.dumps` over `to_dict('records')` would require is
+        skipped, which is the hot path when the dashboard results are
+        returned from an API endpoint.
+
+        Args:
+            results: Mapping of section name to polars or pandas DataFrame,
+                e.g. the output of advanced_sales_analytics_dashboard().
+
+        Returns:
+            Dict[str, str]: Mapping of section name to JSON array string.
+        """
+        return {
+            name: frame.write_json() if hasattr(frame, 'write_json')
+            else frame.to_json(orient='records', date_format='iso')
+            for name, frame in results.items()
+        }
+
     def export_results_to_dataframe(self, 
                                    query_results: List[Dict[str, Any]]) -> pd.DataFrame:
         """
@@ -512,22 +948,51 @@ class AdvancedSQLQueries:
         Returns:
             pd.DataFrame: Formatted DataFrame with proper data types
         """
-        if not query_results:
+        # Arrow tables carry their own schema and convert zero-copy
+        if hasattr(query_results, 'to_pandas'):
+            return query_results.to_pandas(self_destruct=True, types_mapper=pd.ArrowDtype)
+
+        # Columnar results (execute_query_columnar) already hold one list
+        # per column, so the frame is built without per-row dict hashing
+        if isinstance(query_results, dict):
+            query_results = pd.DataFrame(query_results, copy=False)
+            columns = list(query_results.columns)
+        # Streamed results (execute_query_iter) are assembled in bounded
+        # chunks so peak memory stays O(chunk) rather than O(rows)
+        elif not isinstance(query_results, list):
+            chunks = []
+            iterator = iter(query_results)
+            while True:
+                chunk = list(islice(iterator, 10_000))
+                if not chunk:
+                    break
+                chunks.append(pd.DataFrame.from_records(chunk))
+            if not chunks:
+                return pd.DataFrame()
+            query_results = pd.concat(chunks, ignore_index=True)
+            columns = list(query_results.columns)
+        elif not query_results:
             return pd.DataFrame()
-        
-        df = pd.DataFrame(query_results)
-        
-        # Convert date columns
-        date_columns = [col for col in df.columns if 'date' in col.lower()]
-        for col in date_columns:
-            df[col] = pd.to_datetime(df[col], errors='coerce')
-        
-        # Convert numeric columns
-        numeric_columns = [col for col in df.columns if any(keyword in col.lower() 
-                          for keyword in ['price', 'revenue', 'total', 'avg', 'rate', 'score', 'rank'])]
-        for col in numeric_columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-        
+        else:
+            # Derive the dtype schema once from the first record's keys so the
+            # column scan does not repeat per row or per conversion pass
+            columns = list(query_results[0].keys())
+        date_columns = [col for col in columns if 'date' in col.lower()]
+        numeric_columns = [col for col in columns if col not in date_columns
+                           and any(keyword in col.lower()
+                                   for keyword in ['price', 'revenue', 'total', 'avg', 'rate', 'score', 'rank'])]
+
+        if isinstance(query_results, pd.DataFrame):
+            df = query_results
+        else:
+            df = pd.DataFrame.from_records(query_results, columns=columns)
+
+        # Apply each conversion in a single pass over the selected columns
+        if numeric_columns:
+            df[numeric_columns] = df[numeric_columns].apply(pd.to_numeric, errors='coerce')
+        if date_columns:
+            df[date_columns] = df[date_columns].apply(pd.to_datetime, errors='coerce')
+
         return df
 
 
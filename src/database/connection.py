@@ -1,14 +1,204 @@
 """
 Database connection module implementing the Singleton pattern.
 """
+import atexit
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain
 from typing import Optional, Dict, Any, List
 import os
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.sql.elements import TextClause
 from dotenv import load_dotenv
 import pandas as pd
 
+
+@lru_cache(maxsize=128)
+def _prepare_statement(query: str) -> TextClause:
+    """
+    Build and cache the TextClause for a SQL string.
+
+    Reusing one TextClause per statement text keeps SQLAlchemy's compiled
+    cache warm across calls, so repeated analytic queries skip client-side
+    re-parsing and statement compilation.
+
+    Args:
+        query (str): SQL query text.
+    Returns:
+        TextClause: Cached SQLAlchemy text construct.
+    """
+    return text(query)
+
+_DB_SETTINGS: Optional[Dict[str, Optional[str]]] = None
+
+
+def _load_db_settings() -> Dict[str, Optional[str]]:
+    """
+    Load database settings from the environment, caching complete reads.
+
+    load_dotenv() stats and parses the .env file, so a successful read
+    is cached for the process lifetime; singleton resets (close()
+    followed by reconstruction, common in test suites) reuse the parsed
+    values instead of re-reading the file. Incomplete settings are not
+    cached, so the environment can be fixed up and retried.
+
+    Returns:
+        Dict[str, Optional[str]]: Raw connection settings.
+    """
+    global _DB_SETTINGS
+    if _DB_SETTINGS is not None:
+        return _DB_SETTINGS
+
+    load_dotenv()
+    settings = {
+        'url': os.getenv('DB_URL'),
+        'user': os.getenv('DB_USER'),
+        'password': os.getenv('DB_PASSWORD'),
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'port': os.getenv('DB_PORT', '3306'),
+        'name': os.getenv('DB_NAME'),
+    }
+    if settings['url'] or all([settings['user'], settings['password'],
+                               settings['name']]):
+        _DB_SETTINGS = settings
+    return settings
+
+
+_IDENTIFIER_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_. ]*$')
+
+
+def _validate_identifier(name: str) -> str:
+    """
+    Validate a SQL identifier used in string-built queries.
+
+    Table, column and alias names are the only parts of the convenience
+    builders that must be interpolated as text; everything constant-like
+    goes through bind parameters instead. Rejecting anything outside the
+    identifier grammar keeps the builders injection-safe.
+
+    Args:
+        name (str): Identifier (optionally qualified) to check.
+    Returns:
+        str: The validated identifier, unchanged.
+    Raises:
+        ValueError: If the name is not a plain SQL identifier.
+    """
+    if not _IDENTIFIER_RE.match(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return name
+
+
+@lru_cache(maxsize=256)
+def _build_select_sql(table: str, columns: Optional[tuple],
+                      where_clause: Optional[str], order_by: Optional[str],
+                      has_limit: bool, has_offset: bool) -> str:
+    """
+    Build (and cache) the SQL text for a convenience SELECT.
+
+    The builder arguments are hashable, so repeated calls with the same
+    shape -- the common case for per-page dashboard renders -- reuse the
+    assembled string instead of re-running the f-string concatenation.
+
+    Args:
+        table (str): Table name to select from.
+        columns (tuple, optional): Columns to select, or None for all.
+        where_clause (str, optional): WHERE clause body.
+        order_by (str, optional): ORDER BY clause body.
+        has_limit (bool): Emit a LIMIT :__limit placeholder.
+        has_offset (bool): Emit an OFFSET :__offset placeholder.
+    Returns:
+        str: Assembled SQL string. LIMIT/OFFSET are bind placeholders so
+        every page of the same query shape shares one statement text.
+    """
+    cols = "*" if not columns else ", ".join(columns)
+    query = f"SELECT {cols} FROM {table}"
+    if where_clause:
+        query += f" WHERE {where_clause}"
+    if order_by:
+        query += f" ORDER BY {order_by}"
+    if has_limit:
+        query += " LIMIT :__limit"
+        if has_offset:
+            query += " OFFSET :__offset"
+    return query
+
+
+@lru_cache(maxsize=256)
+def _build_agg_sql(table: str, aggregations: tuple, group_by: Optional[tuple],
+                   where_clause: Optional[str], having_clause: Optional[str],
+                   order_by: Optional[str]) -> str:
+    """
+    Build (and cache) the SQL text for a convenience aggregation query.
+
+    Args:
+        table (str): Table name to query.
+        aggregations (tuple): (alias, aggregation_function) pairs.
+        group_by (tuple, optional): Columns to group by.
+        where_clause (str, optional): WHERE clause body.
+        having_clause (str, optional): HAVING clause body.
+        order_by (str, optional): ORDER BY clause body.
+    Returns:
+        str: Assembled SQL string.
+    """
+    # One join over a chained iterable instead of stitching two joined
+    # strings with '+'
+    select_cols = ", ".join(chain(
+        group_by or (),
+        (f"{func} AS {alias}" for alias, func in aggregations)))
+    query = f"SELECT {select_cols} FROM {table}"
+    if where_clause:
+        query += f" WHERE {where_clause}"
+    if group_by:
+        query += f" GROUP BY {', '.join(group_by)}"
+    if having_clause:
+        query += f" HAVING {having_clause}"
+    if order_by:
+        query += f" ORDER BY {order_by}"
+    return query
+
+
+@lru_cache(maxsize=256)
+def _build_join_sql(main_table: str, joins: tuple, columns: Optional[tuple],
+                    where_clause: Optional[str], order_by: Optional[str],
+                    has_limit: bool, has_offset: bool) -> str:
+    """
+    Build (and cache) the SQL text for a convenience JOIN query.
+
+    Args:
+        main_table (str): Main table name.
+        joins (tuple): (join_type, table, on_condition) triples.
+        columns (tuple, optional): Columns to select, or None for all.
+        where_clause (str, optional): WHERE clause body.
+        order_by (str, optional): ORDER BY clause body.
+        has_limit (bool): Emit a LIMIT :__limit placeholder.
+        has_offset (bool): Emit an OFFSET :__offset placeholder.
+    Returns:
+        str: Assembled SQL string. LIMIT/OFFSET are bind placeholders so
+        every page of the same query shape shares one statement text.
+    """
+    cols = "*" if not columns else ", ".join(columns)
+    join_clauses = " ".join(
+        f"{join_type} JOIN {table} ON {on_condition}"
+        for join_type, table, on_condition in joins)
+    query = f"SELECT {cols} FROM {main_table} {join_clauses}" if join_clauses \
+        else f"SELECT {cols} FROM {main_table}"
+    if where_clause:
+        query += f" WHERE {where_clause}"
+    if order_by:
+        query += f" ORDER BY {order_by}"
+    if has_limit:
+        query += " LIMIT :__limit"
+        if has_offset:
+            query += " OFFSET :__offset"
+    return query
+
+
 class DatabaseConnection:
     """
     Singleton class for managing database connections.
@@ -17,38 +207,72 @@ class DatabaseConnection:
     _instance: Optional['DatabaseConnection'] = None
     _engine: Optional[Engine] = None
     _Session: Optional[sessionmaker] = None
+    _lock = threading.Lock()
 
     def __new__(cls) -> 'DatabaseConnection':
         """
         Create a new instance only if one doesn't exist.
+        Double-checked locking keeps the common already-created path
+        lock-free while guaranteeing that concurrent first calls build
+        exactly one engine and pool.
         Returns:
             DatabaseConnection: The singleton instance.
         """
         if cls._instance is None:
-            cls._instance = super(DatabaseConnection, cls).__new__(cls)
-            cls._instance._initialize()
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(DatabaseConnection, cls).__new__(cls)
+                    instance._initialize()
+                    cls._instance = instance
         return cls._instance
 
     def _initialize(self) -> None:
         """
         Initialize the database connection.
         Loads environment variables and creates the SQLAlchemy engine.
+        Idempotent: re-entry with an engine already built is a no-op.
         """
-        load_dotenv()
-        
-        db_user = os.getenv('DB_USER')
-        db_password = os.getenv('DB_PASSWORD')
-        db_host = os.getenv('DB_HOST', 'localhost')
-        db_port = os.getenv('DB_PORT', '3306')
-        db_name = os.getenv('DB_NAME')
+        if self._engine is not None:
+            return
 
-        if not all([db_user, db_password, db_name]):
-            raise ValueError("Missing required database configuration in .env file")
+        settings = _load_db_settings()
 
-        connection_string = f"mysql+pymysql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
-        
-        self._engine = create_engine(connection_string)
+        # A full DB_URL (e.g. sqlite:///:memory: in tests) overrides the
+        # individual MySQL settings
+        connection_string = settings['url']
+        if not connection_string:
+            if not all([settings['user'], settings['password'], settings['name']]):
+                raise ValueError("Missing required database configuration in .env file")
+
+            connection_string = (
+                f"mysql+pymysql://{settings['user']}:{settings['password']}"
+                f"@{settings['host']}:{settings['port']}/{settings['name']}"
+            )
+
+        if connection_string.startswith('sqlite'):
+            # SQLite runs in-process; server pool tuning does not apply
+            self._engine = create_engine(connection_string)
+        else:
+            # Size the pool for concurrent DataFrame queries instead of the
+            # 5-connection default; pre-ping and recycle avoid MySQL
+            # "server has gone away" stalls on connections idled past
+            # wait_timeout
+            self._engine = create_engine(
+                connection_string,
+                pool_size=int(os.getenv('DB_POOL_SIZE', '10')),
+                max_overflow=int(os.getenv('DB_MAX_OVERFLOW', '20')),
+                pool_recycle=int(os.getenv('DB_POOL_RECYCLE', '3600')),
+                pool_pre_ping=True,
+            )
         self._Session = sessionmaker(bind=self._engine)
+        atexit.register(self._engine.dispose)
+
+        # LRU cache of query results keyed on statement text + params;
+        # entries carry the original SQL so writes can invalidate by
+        # table-name substring
+        self._cache: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._cache_ttl = float(os.getenv('DB_CACHE_TTL', '300'))
+        self._cache_maxsize = 128
 
     def get_session(self) -> Session:
         """
@@ -60,26 +284,294 @@ class DatabaseConnection:
             raise RuntimeError("Database connection not initialized")
         return self._Session()
 
-    def execute_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    @staticmethod
+    def _cache_key(query: str, params: Optional[Dict[str, Any]]) -> str:
+        """
+        Build a stable cache key from the query text and sorted params.
+        Args:
+            query (str): SQL query text.
+            params (Dict[str, Any], optional): Parameters for the query.
+        Returns:
+            str: Hex digest identifying this query/params combination.
+        """
+        payload = query + repr(sorted((params or {}).items()))
+        return hashlib.blake2b(payload.encode()).hexdigest()
+
+    def invalidate(self, table: str) -> None:
+        """
+        Drop cached results whose SQL references the given table.
+        Called after writes so readers never see stale cached frames.
+        Args:
+            table (str): Table name to invalidate.
+        """
+        needle = table.lower()
+        stale = [key for key, (_, _, sql) in self._cache.items()
+                 if needle in sql.lower()]
+        for key in stale:
+            del self._cache[key]
+
+    def execute_query(self, query: str, params: Optional[Dict[str, Any]] = None,
+                      use_cache: bool = False,
+                      chunksize: Optional[int] = None,
+                      dtype_backend: Optional[str] = None) -> pd.DataFrame:
         """
         Execute a SQL query and return results as a pandas DataFrame.
+        With use_cache=True, results are served from an in-process LRU
+        cache (TTL from DB_CACHE_TTL, default 300s) so repeated analytic
+        calls skip the round-trip and DataFrame rebuild. Cache hits
+        return a shallow copy; treat cached frames as read-only.
+        With chunksize set, the result streams through a server-side
+        cursor and is assembled from chunk frames, so peak memory is the
+        final frame plus one chunk instead of several whole-result
+        intermediate copies.
         Args:
             query (str): SQL query to execute.
             params (Dict[str, Any], optional): Parameters for the query.
+            use_cache (bool): Serve/store this result in the LRU cache.
+            chunksize (int, optional): Rows per streamed chunk.
+            dtype_backend (str, optional): Pass 'pyarrow' to get
+                Arrow-backed columns (requires pyarrow); string-heavy
+                results then hold zero-copy Arrow buffers instead of
+                Python object arrays.
         Returns:
             pd.DataFrame: Query results as a DataFrame.
         """
         if not self._engine:
             raise RuntimeError("Database connection not initialized")
+
+        read_kwargs: Dict[str, Any] = {}
+        if dtype_backend is not None:
+            read_kwargs['dtype_backend'] = dtype_backend
+
+        if use_cache:
+            key = self._cache_key(query, params)
+            entry = self._cache.get(key)
+            if entry is not None:
+                df, stored_at, _ = entry
+                if time.monotonic() - stored_at < self._cache_ttl:
+                    self._cache.move_to_end(key)
+                    return df.copy(deep=False)
+                del self._cache[key]
         
         try:
-            return pd.read_sql(text(query), self._engine, params=params)
+            if chunksize:
+                chunks = list(self.iter_query(query, params, chunksize))
+                df = (pd.concat(chunks, ignore_index=True, copy=False)
+                      if chunks else pd.DataFrame())
+            else:
+                # Check the connection out explicitly so pandas reuses one
+                # pooled connection for the whole read instead of acquiring
+                # its own
+                with self._engine.connect() as conn:
+                    df = pd.read_sql(_prepare_statement(query), conn,
+                                     params=params, **read_kwargs)
+        except Exception as e:
+            raise RuntimeError(f"Error executing query: {str(e)}")
+
+        if use_cache:
+            self._cache[key] = (df, time.monotonic(), query)
+            if len(self._cache) > self._cache_maxsize:
+                self._cache.popitem(last=False)
+            return df.copy(deep=False)
+        return df
+
+    def fetch_arrow_table(self, query: str, params: Optional[Dict[str, Any]] = None):
+        """
+        Execute a SQL query and return results as a pyarrow Table.
+        This skips the per-row Python dict/DataFrame materialization by
+        building columnar Arrow buffers directly from the driver cursor.
+        Args:
+            query (str): SQL query to execute.
+            params (Dict[str, Any], optional): Parameters for the query.
+        Returns:
+            pyarrow.Table: Query results as an Arrow table.
+        Raises:
+            RuntimeError: If pyarrow is not installed or the query fails.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise RuntimeError("pyarrow is required for fetch_arrow_table; install pyarrow")
+
+        if not self._engine:
+            raise RuntimeError("Database connection not initialized")
+
+        try:
+            with self._engine.connect() as conn:
+                result = conn.execute(_prepare_statement(query), params or {})
+                columns = list(result.keys())
+                rows = result.fetchall()
+                data = {col: [row[i] for row in rows] for i, col in enumerate(columns)}
+                return pa.table(data)
+        except Exception as e:
+            raise RuntimeError(f"Error executing query: {str(e)}")
+
+    def iter_query(self, query: str, params: Optional[Dict[str, Any]] = None,
+                   chunksize: int = 10_000):
+        """
+        Execute a SQL query and yield DataFrame chunks.
+        The read runs over a server-side streaming cursor, so consumers
+        that aggregate incrementally never hold more than one chunk in
+        memory and can process results larger than RAM.
+        Args:
+            query (str): SQL query to execute.
+            params (Dict[str, Any], optional): Parameters for the query.
+            chunksize (int): Rows per yielded DataFrame chunk.
+        Yields:
+            pd.DataFrame: Successive chunks of the result set.
+        """
+        if not self._engine:
+            raise RuntimeError("Database connection not initialized")
+
+        with self._engine.connect().execution_options(
+                stream_results=True, max_row_buffer=chunksize) as conn:
+            yield from pd.read_sql(_prepare_statement(query), conn,
+                                   params=params, chunksize=chunksize)
+
+    def execute_query_iter(self, query: str, params: Optional[Dict[str, Any]] = None,
+                           chunk_size: int = 10_000):
+        """
+        Execute a SQL query and stream rows as dictionaries.
+        The result set is fetched through a server-side streaming cursor
+        (SQLAlchemy stream_results, PyMySQL SSCursor underneath), so at
+        most chunk_size rows are buffered client-side at a time instead
+        of the whole result. Use this for large analytic extracts where
+        materializing the full DataFrame up front would exhaust memory.
+        Args:
+            query (str): SQL query to execute.
+            params (Dict[str, Any], optional): Parameters for the query.
+            chunk_size (int): Rows buffered per fetch from the server.
+        Yields:
+            Dict[str, Any]: One result row at a time.
+        """
+        if not self._engine:
+            raise RuntimeError("Database connection not initialized")
+
+        try:
+            with self._engine.connect().execution_options(
+                    stream_results=True, max_row_buffer=chunk_size) as conn:
+                result = conn.execute(_prepare_statement(query), params or {})
+                for partition in result.mappings().partitions(chunk_size):
+                    for row in partition:
+                        yield dict(row)
         except Exception as e:
             raise RuntimeError(f"Error executing query: {str(e)}")
 
-    def execute_select(self, table: str, columns: List[str] = None, 
+    def execute_query_columnar(self, query: str,
+                               params: Optional[Dict[str, Any]] = None) -> Dict[str, list]:
+        """
+        Execute a SQL query and return results as a columns dictionary.
+        The row tuples are transposed once with zip(*rows) into one list
+        per column (structure-of-arrays), so building a DataFrame from the
+        result is a handful of array constructions instead of per-row
+        dict hashing over the whole result set.
+        Args:
+            query (str): SQL query to execute.
+            params (Dict[str, Any], optional): Parameters for the query.
+        Returns:
+            Dict[str, list]: Mapping of column name to list of values.
+        """
+        if not self._engine:
+            raise RuntimeError("Database connection not initialized")
+
+        try:
+            with self._engine.connect() as conn:
+                result = conn.execute(_prepare_statement(query), params or {})
+                columns = list(result.keys())
+                rows = result.fetchall()
+                if not rows:
+                    return {col: [] for col in columns}
+                return dict(zip(columns, map(list, zip(*rows))))
+        except Exception as e:
+            raise RuntimeError(f"Error executing query: {str(e)}")
+
+    def execute_query_arrow(self, query: str, params: Optional[Dict[str, Any]] = None):
+        """
+        Execute a SQL query and return a pyarrow Table, preferring connectorx.
+        When connectorx is installed and the query needs no bound
+        parameters, the result is parsed straight from the wire into
+        columnar Arrow buffers in native code, skipping the DBAPI
+        row-tuple pipeline entirely. Parameterized queries (connectorx
+        only takes literal SQL) and environments without connectorx fall
+        back to fetch_arrow_table.
+        Args:
+            query (str): SQL query to execute.
+            params (Dict[str, Any], optional): Parameters for the query.
+        Returns:
+            pyarrow.Table: Query results as an Arrow table.
+        """
+        if not params:
+            try:
+                import connectorx as cx
+            except ImportError:
+                cx = None
+            if cx is not None:
+                if not self._engine:
+                    raise RuntimeError("Database connection not initialized")
+                try:
+                    return cx.read_sql(
+                        str(self._engine.url.render_as_string(hide_password=False)),
+                        query, return_type='arrow')
+                except Exception as e:
+                    raise RuntimeError(f"Error executing query: {str(e)}")
+        return self.fetch_arrow_table(query, params)
+
+    def execute_scalar(self, query: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Execute a query and return the first column of the first row.
+        Skips the cursor -> numpy -> DataFrame pipeline for queries that
+        produce a single value, such as stored-function calls and
+        aggregates.
+        Args:
+            query (str): SQL query to execute.
+            params (Dict[str, Any], optional): Parameters for the query.
+        Returns:
+            Any: The scalar result, or None if the query returned no rows.
+        """
+        if not self._engine:
+            raise RuntimeError("Database connection not initialized")
+
+        try:
+            with self._engine.connect() as conn:
+                return conn.execute(_prepare_statement(query), params or {}).scalar()
+        except Exception as e:
+            raise RuntimeError(f"Error executing query: {str(e)}")
+
+    def execute_query_polars(self, query: str, params: Optional[Dict[str, Any]] = None):
+        """
+        Execute a SQL query and return results as a polars DataFrame.
+        Polars reads the result set into Arrow-backed columnar buffers, so
+        no per-row Python dicts are built, and callers can serialize the
+        frame straight to JSON with `df.write_json()` for API responses.
+        Args:
+            query (str): SQL query to execute.
+            params (Dict[str, Any], optional): Parameters for the query.
+        Returns:
+            polars.DataFrame: Query results as a polars DataFrame.
+        Raises:
+            RuntimeError: If polars is not installed or the query fails.
+        """
+        try:
+            import polars as pl
+        except ImportError:
+            raise RuntimeError("polars is required for execute_query_polars; install polars")
+
+        if not self._engine:
+            raise RuntimeError("Database connection not initialized")
+
+        try:
+            with self._engine.connect() as conn:
+                return pl.read_database(
+                    query=_prepare_statement(query),
+                    connection=conn,
+                    execute_options={'parameters': params or {}},
+                )
+        except Exception as e:
+            raise RuntimeError(f"Error executing query: {str(e)}")
+
+    def execute_select(self, table: str, columns: List[str] = None,
                       where_clause: str = None, order_by: str = None, 
-                      limit: int = None) -> pd.DataFrame:
+                      limit: int = None, offset: int = 0) -> pd.DataFrame:
         """
         Execute a SELECT query with convenience parameters.
         Args:
@@ -88,23 +580,22 @@ class DatabaseConnection:
             where_clause (str, optional): WHERE clause without the WHERE keyword.
             order_by (str, optional): ORDER BY clause without the ORDER BY keyword.
             limit (int, optional): Number of rows to limit.
+            offset (int, optional): Rows to skip before the page; pushed
+                into SQL so skipped rows are never transferred.
         Returns:
             pd.DataFrame: Query results as a DataFrame.
         """
-        # Build the query
-        cols = "*" if not columns else ", ".join(columns)
-        query = f"SELECT {cols} FROM {table}"
-        
-        if where_clause:
-            query += f" WHERE {where_clause}"
-        
-        if order_by:
-            query += f" ORDER BY {order_by}"
-        
-        if limit:
-            query += f" LIMIT {limit}"
-        
-        return self.execute_query(query)
+        _validate_identifier(table)
+
+        query = _build_select_sql(table, tuple(columns) if columns else None,
+                                  where_clause, order_by,
+                                  limit is not None, bool(offset))
+        params = {}
+        if limit is not None:
+            params['__limit'] = limit
+            if offset:
+                params['__offset'] = offset
+        return self.execute_query(query, params or None, use_cache=True)
 
     def execute_aggregation(self, table: str, aggregations: Dict[str, str], 
                           group_by: List[str] = None, where_clause: str = None,
@@ -121,34 +612,21 @@ class DatabaseConnection:
         Returns:
             pd.DataFrame: Query results as a DataFrame.
         """
-        # Build aggregation part
-        agg_parts = [f"{func} AS {alias}" for alias, func in aggregations.items()]
-        
-        # Build GROUP BY columns if provided
-        if group_by:
-            select_cols = ", ".join(group_by) + ", " + ", ".join(agg_parts)
-        else:
-            select_cols = ", ".join(agg_parts)
-        
-        query = f"SELECT {select_cols} FROM {table}"
-        
-        if where_clause:
-            query += f" WHERE {where_clause}"
-        
-        if group_by:
-            query += f" GROUP BY {', '.join(group_by)}"
-        
-        if having_clause:
-            query += f" HAVING {having_clause}"
-        
-        if order_by:
-            query += f" ORDER BY {order_by}"
-        
-        return self.execute_query(query)
+        _validate_identifier(table)
+        for alias in aggregations:
+            _validate_identifier(alias)
+        for column in group_by or ():
+            _validate_identifier(column)
+
+        query = _build_agg_sql(table, tuple(aggregations.items()),
+                               tuple(group_by) if group_by else None,
+                               where_clause, having_clause, order_by)
+        return self.execute_query(query, use_cache=True)
 
     def execute_join_query(self, main_table: str, joins: List[Dict[str, str]], 
                           columns: List[str] = None, where_clause: str = None,
-                          order_by: str = None, limit: int = None) -> pd.DataFrame:
+                          order_by: str = None, limit: int = None,
+                          offset: int = 0) -> pd.DataFrame:
         """
         Execute a JOIN query with convenience parameters.
         Args:
@@ -158,45 +636,147 @@ class DatabaseConnection:
             where_clause (str, optional): WHERE clause without the WHERE keyword.
             order_by (str, optional): ORDER BY clause without the ORDER BY keyword.
             limit (int, optional): Number of rows to limit.
+            offset (int, optional): Rows to skip before the page; pushed
+                into SQL so skipped rows are never transferred.
         Returns:
             pd.DataFrame: Query results as a DataFrame.
         """
-        cols = "*" if not columns else ", ".join(columns)
-        query = f"SELECT {cols} FROM {main_table}"
-        
-        # Add joins
+        _validate_identifier(main_table)
         for join in joins:
-            join_type = join.get('type', 'INNER').upper()
-            query += f" {join_type} JOIN {join['table']} ON {join['on']}"
-        
-        if where_clause:
-            query += f" WHERE {where_clause}"
-        
-        if order_by:
-            query += f" ORDER BY {order_by}"
-        
-        if limit:
-            query += f" LIMIT {limit}"
-        
-        return self.execute_query(query)
+            _validate_identifier(join['table'])
+
+        joins_key = tuple((join.get('type', 'INNER').upper(),
+                           join['table'], join['on']) for join in joins)
+        query = _build_join_sql(main_table, joins_key,
+                                tuple(columns) if columns else None,
+                                where_clause, order_by,
+                                limit is not None, bool(offset))
+        params = {}
+        if limit is not None:
+            params['__limit'] = limit
+            if offset:
+                params['__offset'] = offset
+        return self.execute_query(query, params or None, use_cache=True)
+
+    def execute_insert_returning(self, insert_query: str,
+                                 params: Dict[str, Any],
+                                 select_query: str) -> Dict[str, Any]:
+        """
+        Run an INSERT and a follow-up SELECT in one transaction.
+        The SELECT receives the new row's LAST_INSERT_ID() as :sale_id
+        and both statements share a single connection checkout, so
+        insert-then-read flows cost one round-trip pair instead of a
+        connect/commit cycle per statement.
+        Args:
+            insert_query (str): Parameterized INSERT statement.
+            params (Dict[str, Any]): Parameters for the INSERT.
+            select_query (str): Follow-up SELECT using :sale_id.
+        Returns:
+            Dict[str, Any]: The row returned by the follow-up SELECT.
+        """
+        if not self._engine:
+            raise RuntimeError("Database connection not initialized")
+
+        try:
+            with self._engine.begin() as conn:
+                conn.execute(_prepare_statement(insert_query), params)
+                new_id = conn.execute(
+                    _prepare_statement("SELECT LAST_INSERT_ID()")).scalar()
+                row = conn.execute(_prepare_statement(select_query),
+                                   {'sale_id': new_id}).mappings().first()
+                return dict(row) if row is not None else {}
+        except Exception as e:
+            raise RuntimeError(f"Error executing insert: {str(e)}")
+
+    def execute_one(self, query: str,
+                    params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Execute a query and return the first row as a plain dict.
+        The row comes straight from the driver tuple via
+        Result.mappings().first(), so single-row reads skip the
+        DataFrame/Series materialization of execute_query entirely.
+        Args:
+            query (str): SQL query to execute.
+            params (Dict[str, Any], optional): Parameters for the query.
+        Returns:
+            Optional[Dict[str, Any]]: First row, or None if no rows.
+        """
+        if not self._engine:
+            raise RuntimeError("Database connection not initialized")
+
+        try:
+            with self._engine.connect() as conn:
+                row = conn.execute(_prepare_statement(query),
+                                   params or {}).mappings().first()
+                return dict(row) if row is not None else None
+        except Exception as e:
+            raise RuntimeError(f"Error executing query: {str(e)}")
+
+    def execute_batch_readonly(self, queries: Dict[str, str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Execute several read-only queries on one pooled connection.
+        All statements share a single connection checkout, so a batch of
+        N diagnostics costs one round-trip setup instead of N, and rows
+        come back as plain dicts without a DataFrame detour.
+        Args:
+            queries (Dict[str, str]): Mapping of result name to SQL text.
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Rows per named query.
+        """
+        if not self._engine:
+            raise RuntimeError("Database connection not initialized")
+
+        try:
+            with self._engine.connect() as conn:
+                return {
+                    name: [dict(row) for row in
+                           conn.execute(_prepare_statement(sql)).mappings()]
+                    for name, sql in queries.items()
+                }
+        except Exception as e:
+            raise RuntimeError(f"Error executing query: {str(e)}")
 
     def execute_insert(self, table: str, data: Dict[str, Any]) -> bool:
         """
-        Execute an INSERT query.
+        Execute an INSERT query for a single row.
         Args:
             table (str): Table name to insert into.
             data (Dict[str, Any]): Dictionary with column: value pairs.
         Returns:
             bool: True if successful, False otherwise.
         """
+        return self.execute_insert_many(table, [data]) == 1
+
+    def execute_insert_many(self, table: str, rows: List[Dict[str, Any]],
+                            page_size: int = 500) -> int:
+        """
+        Insert many rows with executemany-style batching.
+        All rows go through one pooled connection and one transaction,
+        with parameter sets flushed in pages of page_size, so a loop of
+        N inserts costs a handful of round trips instead of N
+        connect/commit cycles.
+        Args:
+            table (str): Table name to insert into.
+            rows (List[Dict[str, Any]]): Rows as column: value dicts. All
+                rows must share the keys of the first row.
+            page_size (int): Parameter sets sent per execute call.
+        Returns:
+            int: Number of rows inserted.
+        """
+        if not rows:
+            return 0
+
+        columns = ", ".join(rows[0].keys())
+        placeholders = ", ".join(f":{key}" for key in rows[0].keys())
+        query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+
         try:
-            with self._engine.connect() as conn:
-                columns = ", ".join(data.keys())
-                placeholders = ", ".join([f":{key}" for key in data.keys()])
-                query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
-                conn.execute(text(query), data)
-                conn.commit()
-                return True
+            with self._engine.begin() as conn:
+                statement = _prepare_statement(query)
+                for start in range(0, len(rows), page_size):
+                    conn.execute(statement, rows[start:start + page_size])
+            self.invalidate(table)
+            return len(rows)
         except Exception as e:
             raise RuntimeError(f"Error executing insert: {str(e)}")
 
@@ -207,8 +787,7 @@ class DatabaseConnection:
             bool: True if connection is successful, False otherwise.
         """
         try:
-            result = self.execute_query("SELECT 1 as test")
-            return len(result) > 0 and result.iloc[0]['test'] == 1
+            return self.execute_scalar("SELECT 1") == 1
         except Exception:
             return False
 
@@ -229,4 +808,4 @@ class DatabaseConnection:
         """
         if self._engine:
             self._engine.dispose()
-            self._instance = None 
\ No newline at end of file
+            type(self)._instance = None
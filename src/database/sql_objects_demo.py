@@ -12,12 +12,58 @@ Author: Sales Manager System
 Date: 2024
 """
 
+from functools import cached_property
 from typing import Dict, List, Any, Optional
 from datetime import datetime, date, timedelta
-import pandas as pd
 from .connection import DatabaseConnection
 
 
+#: Single fused catalog query for the existence-check snapshot: one
+#: information_schema scan returns triggers, views and functions
+#: together instead of one catalog query per object kind
+_CATALOG_SNAPSHOT_SQL = """
+SELECT 'triggers' AS kind, TRIGGER_NAME AS name
+FROM information_schema.triggers
+WHERE TRIGGER_SCHEMA = DATABASE()
+UNION ALL
+SELECT 'views', TABLE_NAME
+FROM information_schema.views
+WHERE TABLE_SCHEMA = DATABASE()
+UNION ALL
+SELECT 'functions', ROUTINE_NAME
+FROM information_schema.routines
+WHERE ROUTINE_SCHEMA = DATABASE() AND ROUTINE_TYPE = 'FUNCTION';
+"""
+
+#: EXPLAIN statements for the index demo, hoisted so the dict is not
+#: rebuilt on every call
+_INDEX_USAGE_PLANS: Dict[str, str] = {
+    # Test sales date-product index
+    'sales_index_plan': """
+    EXPLAIN FORMAT=JSON SELECT * FROM sales
+    WHERE sale_date >= DATE_SUB(CURDATE(), INTERVAL 30 DAY)
+    AND product_id IN (1, 2, 3);
+    """,
+    # Test customer-city-country index
+    'customer_index_plan': """
+    EXPLAIN FORMAT=JSON SELECT * FROM customers
+    WHERE city_id = 1
+    ORDER BY customer_id;
+    """,
+    # Test product category index
+    'product_index_plan': """
+    EXPLAIN FORMAT=JSON SELECT * FROM products
+    WHERE category_id = 1;
+    """,
+    # Test full-text search index
+    'search_index_plan': """
+    EXPLAIN FORMAT=JSON SELECT * FROM products
+    WHERE MATCH(product_name, class_type)
+    AGAINST('organic' IN BOOLEAN MODE);
+    """
+}
+
+
 class SQLObjectsDemo:
     """
     Demonstrates the usage of advanced SQL objects in the system.
@@ -30,31 +76,102 @@ class SQLObjectsDemo:
     def __init__(self):
         """Initialize with database connection."""
         self.db = DatabaseConnection()
-    
+        # Memo cache for the read-only demos; the function and view are
+        # deterministic for identical arguments, so repeat calls return
+        # from this dict instead of a database round-trip. Demos with
+        # side effects (procedure, trigger insert) never touch it.
+        self._cache: Dict[tuple, Any] = {}
+
+    def clear_cache(self) -> None:
+        """Drop all memoized read-only demo results and catalog snapshots."""
+        self._cache.clear()
+        self.__dict__.pop('_catalog_names', None)
+
+    @cached_property
+    def _catalog_names(self) -> Dict[str, frozenset]:
+        """
+        Trigger, view and function names for the current schema.
+
+        information_schema scans are slow on large catalogs, so all
+        three snapshots come back from one fused UNION ALL query and
+        existence checks afterwards are in-memory set lookups.
+        clear_cache() drops the snapshot after DDL changes.
+        """
+        rows = self.db.execute_query_columnar(_CATALOG_SNAPSHOT_SQL)
+        names: Dict[str, set] = {'triggers': set(), 'views': set(),
+                                 'functions': set()}
+        for kind, name in zip(rows['kind'], rows['name']):
+            names[kind].add(name)
+        return {kind: frozenset(members) for kind, members in names.items()}
+
+    def trigger_exists(self, trigger_name: str) -> bool:
+        """
+        Check whether a trigger exists in the current schema.
+
+        Args:
+            trigger_name: Name of the trigger to look up
+
+        Returns:
+            bool: True if the trigger exists
+        """
+        return trigger_name in self._catalog_names['triggers']
+
+    def view_exists(self, view_name: str) -> bool:
+        """
+        Check whether a view exists in the current schema.
+
+        Args:
+            view_name: Name of the view to look up
+
+        Returns:
+            bool: True if the view exists
+        """
+        return view_name in self._catalog_names['views']
+
+    def function_exists(self, function_name: str) -> bool:
+        """
+        Check whether a stored function exists in the current schema.
+
+        Args:
+            function_name: Name of the function to look up
+
+        Returns:
+            bool: True if the function exists
+        """
+        return function_name in self._catalog_names['functions']
+
     def demo_customer_lifetime_value(self, customer_id: int, months: int = 12) -> float:
         """
         Demonstrate the customer lifetime value calculation function.
-        
+
+        Results are memoized per (customer_id, months); call
+        clear_cache() after the underlying data changes.
+
         Args:
             customer_id: ID of the customer to analyze
             months: Number of months to analyze
-            
+
         Returns:
             float: Calculated customer lifetime value
         """
+        cache_key = ('lifetime_value', customer_id, months)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         query = """
         SELECT calculate_customer_lifetime_value(:customer_id, :months) as lifetime_value;
         """
-        
+
         params = {
             'customer_id': customer_id,
             'months': months
         }
-        
-        result = self.db.execute_query(query, params)
-        if isinstance(result, pd.DataFrame):
-            return result['lifetime_value'].iloc[0] if not result.empty else 0.0
-        return result[0]['lifetime_value'] if result else 0.0
+
+        # Scalar fast path: no DataFrame is built for the single value
+        result = float(self.db.execute_scalar(query, params) or 0.0)
+        self._cache[cache_key] = result
+        return result
     
     def demo_sales_report_procedure(self, 
                                   start_date: Optional[str] = None,
@@ -94,42 +211,52 @@ class SQLObjectsDemo:
         # Execute the procedure
         results = self.db.execute_query(query, params)
         
-        # Process results
-        if isinstance(results, pd.DataFrame):
-            if not results.empty:
-                summary = results.iloc[0].to_dict()
-                details = results.iloc[1:].to_dict('records') if len(results) > 1 else []
-                return {'summary': summary, 'details': details}
-        elif results:
-            summary = results[0]
-            details = results[1] if len(results) > 1 else []
-            return {'summary': summary, 'details': details}
-        
-        return {'summary': {}, 'details': []}
+        # execute_query always returns a DataFrame, so no type dispatch
+        if results.empty:
+            return {'summary': {}, 'details': []}
+        summary = results.iloc[0].to_dict()
+        details = results.iloc[1:].to_dict('records') if len(results) > 1 else []
+        return {'summary': summary, 'details': details}
     
     def demo_customer_purchase_history(self, 
-                                     customer_id: Optional[int] = None) -> List[Dict[str, Any]]:
+                                     customer_id: Optional[int] = None,
+                                     page: int = 1,
+                                     page_size: int = 100) -> List[Dict[str, Any]]:
         """
         Demonstrate the customer purchase history view.
         
+        Pagination happens in SQL via LIMIT/OFFSET, so only the requested
+        page crosses the wire instead of the whole view being fetched and
+        sliced in Python. Pages are memoized per argument tuple; call
+        clear_cache() after the underlying data changes.
+
         Args:
             customer_id: Optional customer ID filter
-            
+            page: 1-based page number to return
+            page_size: Rows per page
+
         Returns:
-            List of customer purchase history records
+            List of customer purchase history records for the page
         """
+        cache_key = ('purchase_history', customer_id, page, page_size)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         query = """
         SELECT * FROM customer_purchase_history
         WHERE (:customer_id IS NULL OR customer_id = :customer_id)
-        ORDER BY total_spent DESC;
+        ORDER BY total_spent DESC
+        LIMIT :limit OFFSET :offset;
         """
         
-        params = {'customer_id': customer_id}
+        params = {'customer_id': customer_id,
+                  'limit': page_size,
+                  'offset': (max(page, 1) - 1) * page_size}
         
-        results = self.db.execute_query(query, params)
-        if isinstance(results, pd.DataFrame):
-            return results.to_dict('records')
-        return results
+        records = self.db.execute_query(query, params).to_dict('records')
+        self._cache[cache_key] = records
+        return records
     
     def demo_trigger_with_new_sale(self, 
                                  product_id: int,
@@ -141,6 +268,11 @@ class SQLObjectsDemo:
         """
         Demonstrate the after_sale_insert trigger by inserting a new sale.
         
+        The inserted sale, its triggered product/category updates and the
+        audit-log entry come back in one joined SELECT keyed on the new
+        sale_id, so the demo costs two statements on one connection
+        instead of an insert plus four separate round-trips.
+        
         Args:
             product_id: ID of the product sold
             customer_id: ID of the customer
@@ -152,16 +284,16 @@ class SQLObjectsDemo:
         Returns:
             Dict containing the inserted sale and triggered updates
         """
-        # Insert new sale
+        # Insert new sale; transaction_number is filled by the
+        # before_sale_insert trigger (the old inline LAST_INSERT_ID()
+        # expression read the previous statement's id, not this row's)
         insert_query = """
         INSERT INTO sales (
             product_id, customer_id, sales_person_id,
-            quantity, total_price, discount, sale_date,
-            transaction_number
+            quantity, total_price, discount, sale_date
         ) VALUES (
             :product_id, :customer_id, :sales_person_id,
-            :quantity, :total_price, :discount, CURDATE(),
-            CONCAT('TRX', DATE_FORMAT(CURDATE(), '%Y%m%d'), LPAD(LAST_INSERT_ID(), 4, '0'))
+            :quantity, :total_price, :discount, CURDATE()
         );
         """
         
@@ -174,44 +306,41 @@ class SQLObjectsDemo:
             'discount': discount
         }
         
-        # Execute insert
-        self.db.execute_query(insert_query, params)
-        
-        # Get the inserted sale
-        sale_query = """
-        SELECT * FROM sales WHERE sale_id = LAST_INSERT_ID();
+        combined_query = """
+        SELECT
+            s.*,
+            p.total_sales as product_total_sales,
+            p.total_revenue as product_total_revenue,
+            p.last_sale_date as product_last_sale_date,
+            c.total_sales as category_total_sales,
+            c.total_revenue as category_total_revenue,
+            c.last_sale_date as category_last_sale_date,
+            a.log_id as audit_log_id,
+            a.action_timestamp as audit_action_timestamp
+        FROM sales s
+        INNER JOIN products p ON s.product_id = p.product_id
+        INNER JOIN categories c ON p.category_id = c.category_id
+        LEFT JOIN sales_audit_log a ON a.sale_id = s.sale_id
+        WHERE s.sale_id = :sale_id
+        ORDER BY a.action_timestamp DESC
+        LIMIT 1;
         """
-        sale_result = self.db.execute_query(sale_query)
-        sale = sale_result.iloc[0].to_dict() if isinstance(sale_result, pd.DataFrame) else sale_result[0]
         
-        # Get the triggered updates
-        product_query = """
-        SELECT total_sales, total_revenue, last_sale_date 
-        FROM products WHERE product_id = :product_id;
-        """
-        product_result = self.db.execute_query(product_query, {'product_id': product_id})
-        product = product_result.iloc[0].to_dict() if isinstance(product_result, pd.DataFrame) else product_result[0]
+        row = self.db.execute_insert_returning(insert_query, params, combined_query)
         
-        category_query = """
-        SELECT c.total_sales, c.total_revenue, c.last_sale_date
-        FROM categories c
-        INNER JOIN products p ON c.category_id = p.category_id
-        WHERE p.product_id = :product_id;
-        """
-        category_result = self.db.execute_query(category_query, {'product_id': product_id})
-        category = category_result.iloc[0].to_dict() if isinstance(category_result, pd.DataFrame) else category_result[0]
-        
-        audit_query = """
-        SELECT * FROM sales_audit_log 
-        WHERE sale_id = :sale_id
-        ORDER BY action_timestamp DESC
-        LIMIT 1;
-        """
-        audit_result = self.db.execute_query(audit_query, {'sale_id': sale['sale_id']})
-        audit = audit_result.iloc[0].to_dict() if isinstance(audit_result, pd.DataFrame) else audit_result[0]
+        # Split the joined row back into the per-entity sub-dicts the
+        # callers expect
+        product = {key.replace('product_', '', 1): row.pop(key)
+                   for key in list(row) if key.startswith('product_total')
+                   or key == 'product_last_sale_date'}
+        category = {key.replace('category_', '', 1): row.pop(key)
+                    for key in list(row) if key.startswith('category_total')
+                    or key == 'category_last_sale_date'}
+        audit = {key.replace('audit_', '', 1): row.pop(key)
+                 for key in list(row) if key.startswith('audit_')}
         
         return {
-            'sale': sale,
+            'sale': row,
             'product_updates': product,
             'category_updates': category,
             'audit_log': audit
@@ -221,54 +350,15 @@ class SQLObjectsDemo:
         """
         Demonstrate the usage of created indexes.
         
+        All four EXPLAIN statements run on one connection checkout via
+        execute_batch_readonly, and FORMAT=JSON returns a single row per
+        plan, so the diagnostic costs one round-trip setup instead of
+        four DataFrame fetches.
+        
         Returns:
             Dict containing query execution plans
         """
-        # Test sales date-product index
-        sales_query = """
-        EXPLAIN SELECT * FROM sales 
-        WHERE sale_date >= DATE_SUB(CURDATE(), INTERVAL 30 DAY)
-        AND product_id IN (1, 2, 3);
-        """
-        sales_plan = self.db.execute_query(sales_query)
-        if isinstance(sales_plan, pd.DataFrame):
-            sales_plan = sales_plan.to_dict('records')
-        
-        # Test customer-city-country index
-        customer_query = """
-        EXPLAIN SELECT * FROM customers 
-        WHERE city_id = 1
-        ORDER BY customer_id;
-        """
-        customer_plan = self.db.execute_query(customer_query)
-        if isinstance(customer_plan, pd.DataFrame):
-            customer_plan = customer_plan.to_dict('records')
-        
-        # Test product category index
-        product_query = """
-        EXPLAIN SELECT * FROM products 
-        WHERE category_id = 1;
-        """
-        product_plan = self.db.execute_query(product_query)
-        if isinstance(product_plan, pd.DataFrame):
-            product_plan = product_plan.to_dict('records')
-        
-        # Test full-text search index
-        search_query = """
-        EXPLAIN SELECT * FROM products 
-        WHERE MATCH(product_name, class_type) 
-        AGAINST('organic' IN BOOLEAN MODE);
-        """
-        search_plan = self.db.execute_query(search_query)
-        if isinstance(search_plan, pd.DataFrame):
-            search_plan = search_plan.to_dict('records')
-        
-        return {
-            'sales_index_plan': sales_plan,
-            'customer_index_plan': customer_plan,
-            'product_index_plan': product_plan,
-            'search_index_plan': search_plan
-        }
+        return self.db.execute_batch_readonly(_INDEX_USAGE_PLANS)
 
 
 def main():
@@ -1,19 +1,250 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List
+import numpy as np
 import pandas as pd
 
+_EPOCH = date(1970, 1, 1)
+
+#: Concrete numeric types accepted by the id/number validation rules.
+#: `type(x) in set` is a single hash probe, against isinstance's MRO
+#: walk per tuple element, and the NumPy scalars cover values hydrated
+#: straight out of DataFrame columns.
+_INT_TYPES = frozenset({int, np.int32, np.int64})
+_NUM_TYPES = frozenset(_INT_TYPES | {float, np.float32, np.float64})
+
+
+def _encode_epoch_days(value):
+    """
+    Encode a date value as int days since the Unix epoch.
+
+    Ints pass through (already encoded), None stays None, and anything
+    date-like is parsed once from its ISO prefix. Unparseable values are
+    kept as-is so validate()/repr still see the original input.
+    """
+    if value is None or isinstance(value, int):
+        return value
+    try:
+        return (date.fromisoformat(str(value)[:10]) - _EPOCH).days
+    except ValueError:
+        return value
+
+
+def _decode_epoch_days(days):
+    """Decode epoch days back to the ISO date string callers expect."""
+    if isinstance(days, int):
+        return (_EPOCH + timedelta(days=days)).isoformat()
+    return days
+
+
+def _encode_cents(value):
+    """
+    Encode a money value as exact integer cents.
+
+    Non-numeric values (and NaN) are kept as-is so validate() still
+    sees and rejects the original input, mirroring _encode_epoch_days.
+    """
+    if type(value) not in _NUM_TYPES or value != value:
+        return value
+    return int(round(value * 100))
+
+
+def _decode_cents(cents):
+    """Decode stored cents back to the currency units callers expect."""
+    if type(cents) is int:
+        return cents / 100
+    return cents
+
+
+@lru_cache(maxsize=128)
+def _resolve_columns(cls, columns: tuple) -> Dict[str, Any]:
+    """
+    Resolve each model field's alias to an actual DataFrame column.
+
+    Query results and CSV loads reuse the same column layout over and
+    over, so the field -> column mapping is cached per (class, columns)
+    pair; repeat hydrations skip the per-field candidate scan entirely.
+
+    Args:
+        cls: Model class whose _ALIASES spec drives the resolution.
+        columns (tuple): The DataFrame's column names.
+
+    Returns:
+        Dict[str, Any]: Field name -> matching column name, or None
+        when no alias candidate is present.
+    """
+    column_set = set(columns)
+    return {field: next((c for c in candidates if c in column_set), None)
+            for field, candidates in cls._ALIASES.items()}
+
+#: Rule name -> boolean expression template used by _compile_validator.
+#: {f} is the field name and {arg} the name the rule argument is bound
+#: to in the compiled function's globals.
+_VALIDATOR_TEMPLATES = {
+    'truthy': 'self.{f}',
+    'instance': 'isinstance(self.{f}, {arg})',
+    'instance_or_none': '(self.{f} is None or isinstance(self.{f}, {arg}))',
+    'type_in': 'type(self.{f}) in {arg}',
+    'type_in_or_none': '(self.{f} is None or type(self.{f}) in {arg})',
+    'in_or_none': '(self.{f} is None or self.{f} in {arg})',
+    'max_len_or_none': '(self.{f} is None or len(self.{f}) <= {arg})',
+    'len_eq': 'len(self.{f}) == {arg}',
+    'mask_zero': '(self.{f} & {arg}) == 0',
+}
+
+
+#: Result a rule yields for a wholly absent column (every value None)
+_RULE_NONE_RESULTS = {
+    'truthy': False,
+    'instance': False,
+    'instance_or_none': True,
+    'type_in': False,
+    'type_in_or_none': True,
+    'in_or_none': True,
+    'max_len_or_none': True,
+    'len_eq': False,
+    'mask_zero': True,
+}
+
+
+def _vectorize_rule(series: pd.Series, rule: str, arg) -> np.ndarray:
+    """
+    Evaluate one validation rule column-wise, returning a boolean mask.
+
+    Membership, null and length checks run in pandas' C kernels
+    (isin/notna/str.len); only the isinstance rules fall back to a
+    per-element map, mirroring the compiled per-row semantics.
+    """
+    if rule == 'truthy':
+        return series.notna().to_numpy() & series.map(bool).to_numpy(dtype=bool)
+    if rule == 'instance':
+        return series.map(lambda v: isinstance(v, arg)).to_numpy(dtype=bool)
+    if rule == 'instance_or_none':
+        return series.map(
+            lambda v: v is None or isinstance(v, arg)).to_numpy(dtype=bool)
+    if rule in ('type_in', 'type_in_or_none'):
+        # Dtype fast path: an int64/float64 column cannot hold a
+        # mismatched element, so one dtype check replaces the map
+        kind = series.dtype.kind
+        if (kind in 'iu' and int in arg) or (kind == 'f' and float in arg):
+            return np.ones(len(series), dtype=bool)
+        if rule == 'type_in':
+            return series.map(lambda v: type(v) in arg).to_numpy(dtype=bool)
+        return series.map(
+            lambda v: v is None or type(v) in arg).to_numpy(dtype=bool)
+    if rule == 'in_or_none':
+        return series.isna().to_numpy() | series.isin(tuple(arg)).to_numpy()
+    if rule == 'max_len_or_none':
+        within = (series.str.len() <= arg).fillna(False)
+        return series.isna().to_numpy() | within.to_numpy(dtype=bool)
+    if rule == 'len_eq':
+        return (series.str.len() == arg).fillna(False).to_numpy(dtype=bool)
+    if rule == 'mask_zero':
+        return series.map(lambda v: ((v or 0) & arg) == 0).to_numpy(dtype=bool)
+    raise KeyError(rule)
+
+
+def _compile_validator(class_name, spec):
+    """
+    Compile a _VALIDATORS spec into a single-expression validate().
+
+    The per-rule checks are joined into one short-circuiting boolean
+    expression and exec'd once at class-definition time, so calling
+    validate() costs a single compiled expression with membership sets
+    bound as constants instead of a chain of if/return statements.
+
+    Args:
+        class_name (str): Name of the model class, for the qualname.
+        spec: Iterable of (field, rule) or (field, rule, arg) tuples.
+
+    Returns:
+        The compiled validate function.
+    """
+    namespace = {}
+    parts = []
+    for index, (field, rule, *arg) in enumerate(spec):
+        template = _VALIDATOR_TEMPLATES[rule]
+        if arg:
+            bound = f'_arg{index}'
+            namespace[bound] = arg[0]
+            parts.append(template.format(f=field, arg=bound))
+        else:
+            parts.append(template.format(f=field))
+    expression = '\n        and '.join(parts) or 'True'
+    source = (
+        'def validate(self):\n'
+        '    return bool(\n'
+        f'        {expression}\n'
+        '    )\n'
+    )
+    exec(source, namespace)
+    validate = namespace['validate']
+    validate.__qualname__ = f'{class_name}.validate'
+    validate.__doc__ = (
+        'Validate the model data.\n\n'
+        'Compiled from the class _VALIDATORS spec.\n\n'
+        'Returns:\n'
+        '    bool: True if the data is valid, False otherwise.'
+    )
+    return validate
+
 
 class BaseModel(ABC):
     """
     BaseModel is an abstract base class that defines the interface for all data models in the system.
     It provides common functionality for data validation, transformation, and database operations.
+
+    Models are slotted: instances carry only their declared field slots,
+    with no per-instance __dict__, which matters when query results are
+    materialized into thousands of model objects. Subclasses must declare
+    their field names in __slots__ and store values as plain attributes.
     """
 
+    __slots__ = ('_data',)
+
+    #: Field name -> candidate column names (CSV convention first, then
+    #: DB convention); subclasses override for alias-aware hydration
+    _ALIASES: Dict[str, tuple] = {}
+
+    #: Validation spec as (field, rule) / (field, rule, arg) tuples;
+    #: subclasses declare it to have validate() compiled for them
+    _VALIDATORS: tuple = ()
+
+    #: Fields stored as epoch days; from_dataframe_batch parses their
+    #: columns vectorized instead of string-by-string in the constructor
+    _DATE_FIELDS: tuple = ()
+
+    #: Column-wise spec for validate_batch when it differs from
+    #: _VALIDATORS (e.g. rules over packed storage that has no column)
+    _BATCH_VALIDATORS: tuple = ()
+
+    #: Small lookup entities (categories, countries, cities) set this so
+    #: hydration shares one instance per id instead of one per row
+    _FLYWEIGHT: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Compile the subclass validation spec, if one is declared.
+
+        Subclasses that declare _VALIDATORS get a validate() generated
+        from the spec at class-creation time; the rest implement
+        validate() by hand as before.
+        """
+        super().__init_subclass__(**kwargs)
+        spec = cls.__dict__.get('_VALIDATORS')
+        if spec:
+            cls.validate = _compile_validator(cls.__name__, spec)
+        # Per-class flyweight cache: each subclass gets its own dict
+        cls._CACHE = {}
+
     def __init__(self):
         """
-        Initialize the base model with default values.
+        Initialize the base model.
+
+        Subclasses assign their slotted fields directly; the base class
+        allocates nothing per instance.
         """
-        self._data: Dict[str, Any] = {}
 
     @abstractmethod
     def validate(self) -> bool:
@@ -25,43 +256,245 @@ class BaseModel(ABC):
         """
         pass
 
-    @abstractmethod
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the model instance to a dictionary representation.
         
+        The default implementation is driven by the subclass __slots__
+        declaration, so slotted models get serialization for free; models
+        with a different storage layout override it.
+        
         Returns:
             Dict[str, Any]: Dictionary containing the model's data.
         """
-        pass
+        return {field: getattr(self, field) for field in self.__slots__}
 
     @classmethod
-    @abstractmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BaseModel':
         """
         Create a model instance from a dictionary.
         
+        The default implementation maps the subclass __slots__ names onto
+        keyword arguments, tolerating missing keys, which is the shared
+        shape of every slotted model's constructor.
+        
         Args:
             data (Dict[str, Any]): Dictionary containing the model's data.
             
         Returns:
             BaseModel: A new instance of the model.
         """
-        pass
+        return cls(**{field: data.get(field) for field in cls.__slots__})
 
     @classmethod
-    @abstractmethod
     def from_dataframe(cls, df: pd.DataFrame) -> 'BaseModel':
         """
         Create a model instance from a pandas DataFrame row.
         
+        The default implementation unpacks the first row via itertuples
+        (no per-row Series) and delegates to from_dict. Subclasses
+        override it when their column names need alias resolution.
+        
         Args:
             df (pd.DataFrame): DataFrame containing the model's data.
             
         Returns:
             BaseModel: A new instance of the model.
         """
-        pass
+        columns = tuple(df.columns)
+        row = next(df.itertuples(index=False, name=None))
+        return cls.from_dict(dict(zip(columns, row)))
+
+    @classmethod
+    def from_dataframe_rows(cls, df: pd.DataFrame):
+        """
+        Yield one model instance per DataFrame row.
+        
+        Generator variant of from_dataframe_bulk for memory-bounded
+        pipelines: rows are converted lazily, so only one model beyond
+        the consumer's working set is alive at a time.
+        
+        Args:
+            df (pd.DataFrame): DataFrame with one row per model.
+            
+        Yields:
+            BaseModel: A model instance per row.
+        """
+        columns = tuple(df.columns)
+        for row in df.itertuples(index=False, name=None):
+            yield cls.from_dict(dict(zip(columns, row)))
+
+    @classmethod
+    def from_dataframe_batch(cls, df: pd.DataFrame) -> List['BaseModel']:
+        """
+        Create one model instance per DataFrame row, resolving aliases.
+
+        The _ALIASES resolution is served from the cached per-layout
+        mapping (_resolve_columns) and the values pulled as whole NumPy
+        arrays, so bulk hydration costs O(columns) column pulls plus one
+        tight zip over the rows instead of per-row, per-field lookups.
+
+        Args:
+            df (pd.DataFrame): DataFrame with one row per model.
+
+        Returns:
+            List[BaseModel]: A model instance per row.
+        """
+        row_count = len(df.index)
+        columns = _resolve_columns(cls, tuple(df.columns))
+        resolved = {}
+        for field, column in columns.items():
+            if column is None:
+                resolved[field] = (None,) * row_count
+            elif field in cls._DATE_FIELDS:
+                # One vectorized parse for the whole column; the
+                # constructors then take the epoch-day ints straight
+                # through instead of re-parsing per row
+                parsed = pd.to_datetime(df[column], errors='coerce')
+                days = (parsed.to_numpy().astype('datetime64[D]')
+                        .astype('int64').astype(object))
+                days[parsed.isna().to_numpy()] = None
+                resolved[field] = days
+            else:
+                values = df[column].to_numpy()
+                if values.dtype == object:
+                    # Normalize pandas' NaN missing markers to None so
+                    # constructors and validate() see one null value
+                    missing = pd.isna(values)
+                    if missing.any():
+                        values = np.where(missing, None, values)
+                resolved[field] = values
+        fields = tuple(resolved)
+        if cls._FLYWEIGHT:
+            # The id field leads the _ALIASES declaration, so row[0] is
+            # the cache key; rows repeating an id share one instance
+            cache = cls._CACHE
+            instances = []
+            for row in zip(*resolved.values()):
+                key = row[0]
+                obj = cache.get(key) if key is not None else None
+                if obj is None:
+                    obj = cls(**dict(zip(fields, row)))
+                    if key is not None:
+                        cache[key] = obj
+                instances.append(obj)
+            return instances
+        return [cls(**dict(zip(fields, row)))
+                for row in zip(*resolved.values())]
+
+    @classmethod
+    def get_or_create(cls, key, **kwargs) -> 'BaseModel':
+        """
+        Get the cached instance for an id, constructing it on first use.
+
+        Flyweight accessor for the small lookup entities: every caller
+        asking for the same id shares one instance instead of allocating
+        a duplicate per referencing row.
+
+        Args:
+            key: The entity's id (first constructor argument).
+            **kwargs: Remaining constructor arguments for a cache miss.
+
+        Returns:
+            BaseModel: The shared instance for the id.
+        """
+        obj = cls._CACHE.get(key)
+        if obj is None:
+            obj = cls._CACHE[key] = cls(key, **kwargs)
+        return obj
+
+    @classmethod
+    def validate_batch(cls, df: pd.DataFrame) -> np.ndarray:
+        """
+        Validate a whole DataFrame column-wise, returning a boolean mask.
+
+        Instead of hydrating N instances and calling validate() in a
+        Python loop, each rule of the validation spec runs once over its
+        resolved column with vectorized pandas kernels and the per-rule
+        masks are AND-ed together. Callers filter invalid rows up front
+        with df[mask] before constructing objects.
+
+        Args:
+            df (pd.DataFrame): DataFrame with one candidate row per model.
+
+        Returns:
+            np.ndarray: Boolean mask, True where the row is valid.
+        """
+        columns = _resolve_columns(cls, tuple(df.columns))
+        mask = np.ones(len(df.index), dtype=bool)
+        for field, rule, *arg in (cls._BATCH_VALIDATORS or cls._VALIDATORS):
+            column = columns.get(field)
+            if column is None:
+                if not _RULE_NONE_RESULTS[rule]:
+                    mask[:] = False
+                continue
+            mask &= _vectorize_rule(df[column], rule,
+                                    arg[0] if arg else None)
+        return mask
+
+    @classmethod
+    def from_dataframe_valid(cls, df: pd.DataFrame) -> List['BaseModel']:
+        """
+        Hydrate only the valid rows of a DataFrame in one fused pass.
+
+        The column-wise validity mask is computed first and invalid rows
+        are dropped before any model object is allocated, so ingestion
+        pays vectorized kernels for the filter stage and per-instance
+        cost only for rows that survive it.
+
+        Args:
+            df (pd.DataFrame): DataFrame with one candidate row per model.
+
+        Returns:
+            List[BaseModel]: A model instance per valid row.
+        """
+        mask = cls.validate_batch(df)
+        if not mask.all():
+            df = df[mask]
+        return cls.from_dataframe_batch(df)
+
+    @classmethod
+    def from_arrow_batch(cls, batch) -> List['BaseModel']:
+        """
+        Create one model instance per pyarrow RecordBatch row.
+
+        Arrow-sourced data (execute_query_arrow, Parquet) is hydrated
+        without a pandas detour: each field's column is located via the
+        cached alias resolution and bulk-unboxed once with to_pylist(),
+        then the Python lists are zipped into instances. Only batch
+        methods are touched, so pyarrow stays an optional dependency.
+
+        Args:
+            batch: pyarrow.RecordBatch (or Table) with one row per model.
+
+        Returns:
+            List[BaseModel]: A model instance per row.
+        """
+        columns = _resolve_columns(cls, tuple(batch.schema.names))
+        values = [(batch.column(column).to_pylist() if column is not None
+                   else (None,) * batch.num_rows)
+                  for column in columns.values()]
+        fields = tuple(columns)
+        return [cls(**dict(zip(fields, row))) for row in zip(*values)]
+
+    @classmethod
+    def from_dataframe_bulk(cls, df: pd.DataFrame) -> List['BaseModel']:
+        """
+        Create one model instance per DataFrame row.
+
+        Rows are unpacked with itertuples (C-level, no per-row Series)
+        and zipped against the column tuple built once, so bulk loading
+        query results avoids the slow iterrows path.
+
+        Args:
+            df (pd.DataFrame): DataFrame with one row per model.
+
+        Returns:
+            List[BaseModel]: A model instance per row.
+        """
+        columns = tuple(df.columns)
+        return [cls.from_dict(dict(zip(columns, row)))
+                for row in df.itertuples(index=False, name=None)]
 
     def __str__(self) -> str:
         """
@@ -70,7 +503,7 @@ class BaseModel(ABC):
         Returns:
             str: String representation of the model.
         """
-        return f"{self.__class__.__name__}({self._data})"
+        return f"{self.__class__.__name__}({self.to_dict()})"
 
     def __repr__(self) -> str:
         """
@@ -1,11 +1,28 @@
 from typing import Any, Dict
 import pandas as pd
-from .base_model import BaseModel
+from .base_model import BaseModel, _INT_TYPES
 
 class City(BaseModel):
     """
     City represents a city entity in the system, containing geographic and reference information.
     """
+
+    __slots__ = ('city_id', 'city_name', 'zip_code', 'country_id')
+
+    _ALIASES = {
+        'city_id': ('CityID', 'city_id'),
+        'city_name': ('CityName', 'city_name'),
+        'zip_code': ('Zipcode', 'zip_code'),
+        'country_id': ('CountryID', 'country_id'),
+    }
+
+    #: Shared one-instance-per-id flyweight (small lookup table)
+    _FLYWEIGHT = True
+
+    _VALIDATORS = (
+        ('city_name', 'truthy'),
+        ('country_id', 'type_in', _INT_TYPES),
+    )
     def __init__(self, city_id: int = None, city_name: str = None, zip_code: str = None, country_id: int = None):
         """
         Initialize a City instance.
@@ -16,46 +33,10 @@ class City(BaseModel):
             country_id (int, optional): Identifier for the country this city belongs to.
         """
         super().__init__()
-        self._data = {
-            'city_id': city_id,
-            'city_name': city_name,
-            'zip_code': zip_code,
-            'country_id': country_id
-        }
-
-    def validate(self) -> bool:
-        """
-        Validate the city data.
-        Returns:
-            bool: True if the data is valid, False otherwise.
-        """
-        if not self._data['city_name'] or not isinstance(self._data['country_id'], int):
-            return False
-        return True
-
-    def to_dict(self) -> Dict[str, Any]:
-        """
-        Convert the city instance to a dictionary.
-        Returns:
-            Dict[str, Any]: Dictionary containing the city's data.
-        """
-        return self._data.copy()
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'City':
-        """
-        Create a City instance from a dictionary.
-        Args:
-            data (Dict[str, Any]): Dictionary containing the city's data.
-        Returns:
-            City: A new City instance.
-        """
-        return cls(
-            city_id=data.get('city_id'),
-            city_name=data.get('city_name'),
-            zip_code=data.get('zip_code'),
-            country_id=data.get('country_id')
-        )
+        self.city_id = city_id
+        self.city_name = city_name
+        self.zip_code = zip_code
+        self.country_id = country_id
 
     @classmethod
     def from_dataframe(cls, df: pd.DataFrame) -> 'City':
@@ -66,54 +47,9 @@ class City(BaseModel):
         Returns:
             City: A new City instance.
         """
-        if df.empty:
+        # len(df.index) skips the empty property's multi-axis scan
+        if len(df.index) == 0:
             return cls()
         
-        # Handle both column naming conventions (from CSV and DB)
-        city_id = df.get('CityID', df.get('city_id', [None]))[0]
-        city_name = df.get('CityName', df.get('city_name', [None]))[0]
-        zip_code = df.get('Zipcode', df.get('zip_code', [None]))[0]
-        country_id = df.get('CountryID', df.get('country_id', [None]))[0]
-        
-        return cls(
-            city_id=city_id,
-            city_name=city_name,
-            zip_code=zip_code,
-            country_id=country_id
-        )
-
-    @property
-    def city_id(self) -> int:
-        """
-        Get the city ID.
-        Returns:
-            int: The city ID.
-        """
-        return self._data['city_id']
-
-    @property
-    def city_name(self) -> str:
-        """
-        Get the city name.
-        Returns:
-            str: The city name.
-        """
-        return self._data['city_name']
-
-    @property
-    def zip_code(self) -> str:
-        """
-        Get the city's ZIP code.
-        Returns:
-            str: The ZIP code.
-        """
-        return self._data['zip_code']
-
-    @property
-    def country_id(self) -> int:
-        """
-        Get the country ID.
-        Returns:
-            int: The country ID.
-        """
-        return self._data['country_id'] 
\ No newline at end of file
+        # Alias resolution lives in _ALIASES; reuse the batch path
+        return cls.from_dataframe_batch(df.head(1))[0]
@@ -1,3 +1,4 @@
+import sys
 from typing import Any, Dict
 import pandas as pd
 from .base_model import BaseModel
@@ -6,6 +7,23 @@ class Country(BaseModel):
     """
     Country represents a country entity in the system, containing metadata and reference information.
     """
+
+    __slots__ = ('country_id', 'country_name', 'country_code')
+
+    _ALIASES = {
+        'country_id': ('CountryID', 'country_id'),
+        'country_name': ('CountryName', 'country_name'),
+        'country_code': ('CountryCode', 'country_code'),
+    }
+
+    #: Shared one-instance-per-id flyweight (small lookup table)
+    _FLYWEIGHT = True
+
+    _VALIDATORS = (
+        ('country_name', 'truthy'),
+        ('country_code', 'truthy'),
+        ('country_code', 'len_eq', 2),
+    )
     def __init__(self, country_id: int = None, country_name: str = None, country_code: str = None):
         """
         Initialize a Country instance.
@@ -15,46 +33,11 @@ class Country(BaseModel):
             country_code (str, optional): Country code (e.g., ISO code).
         """
         super().__init__()
-        self._data = {
-            'country_id': country_id,
-            'country_name': country_name,
-            'country_code': country_code
-        }
-
-    def validate(self) -> bool:
-        """
-        Validate the country data.
-        Returns:
-            bool: True if the data is valid, False otherwise.
-        """
-        if not self._data['country_name'] or not self._data['country_code']:
-            return False
-        if len(self._data['country_code']) != 2:
-            return False
-        return True
-
-    def to_dict(self) -> Dict[str, Any]:
-        """
-        Convert the country instance to a dictionary.
-        Returns:
-            Dict[str, Any]: Dictionary containing the country's data.
-        """
-        return self._data.copy()
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Country':
-        """
-        Create a Country instance from a dictionary.
-        Args:
-            data (Dict[str, Any]): Dictionary containing the country's data.
-        Returns:
-            Country: A new Country instance.
-        """
-        return cls(
-            country_id=data.get('country_id'),
-            country_name=data.get('country_name'),
-            country_code=data.get('country_code')
-        )
+        self.country_id = country_id
+        self.country_name = country_name
+        # Interned: ~250 distinct 2-char codes shared across all
+        # instances, and equality checks short-circuit on identity
+        self.country_code = sys.intern(country_code) if isinstance(country_code, str) else country_code
 
     @classmethod
     def from_dataframe(cls, df: pd.DataFrame) -> 'Country':
@@ -65,43 +48,9 @@ class Country(BaseModel):
         Returns:
             Country: A new Country instance.
         """
-        if df.empty:
+        # len(df.index) skips the empty property's multi-axis scan
+        if len(df.index) == 0:
             return cls()
         
-        # Handle both column naming conventions (from CSV and DB)
-        country_id = df.get('CountryID', df.get('country_id', [None]))[0]
-        country_name = df.get('CountryName', df.get('country_name', [None]))[0]
-        country_code = df.get('CountryCode', df.get('country_code', [None]))[0]
-        
-        return cls(
-            country_id=country_id,
-            country_name=country_name,
-            country_code=country_code
-        )
-
-    @property
-    def country_id(self) -> int:
-        """
-        Get the country ID.
-        Returns:
-            int: The country ID.
-        """
-        return self._data['country_id']
-
-    @property
-    def country_name(self) -> str:
-        """
-        Get the country name.
-        Returns:
-            str: The country name.
-        """
-        return self._data['country_name']
-
-    @property
-    def country_code(self) -> str:
-        """
-        Get the country code.
-        Returns:
-            str: The country code.
-        """
-        return self._data['country_code'] 
\ No newline at end of file
+        # Alias resolution lives in _ALIASES; reuse the batch path
+        return cls.from_dataframe_batch(df.head(1))[0]
@@ -1,11 +1,30 @@
+import sys
 from typing import Any, Dict
 import pandas as pd
-from .base_model import BaseModel
+from .base_model import BaseModel, _INT_TYPES
 
 class Customer(BaseModel):
     """
     Customer represents a customer entity in the system, containing personal and contact information.
     """
+
+    __slots__ = ('customer_id', 'first_name', 'middle_initial', 'last_name', 'city_id', 'address')
+
+    _ALIASES = {
+        'customer_id': ('CustomerID', 'customer_id'),
+        'first_name': ('FirstName', 'first_name'),
+        'middle_initial': ('MiddleInitial', 'middle_initial'),
+        'last_name': ('LastName', 'last_name'),
+        'city_id': ('CityID', 'city_id'),
+        'address': ('Address', 'address'),
+    }
+
+    _VALIDATORS = (
+        ('first_name', 'truthy'),
+        ('last_name', 'truthy'),
+        ('city_id', 'type_in_or_none', _INT_TYPES),
+        ('middle_initial', 'max_len_or_none', 5),
+    )
     def __init__(self, customer_id: int = None, first_name: str = None, middle_initial: str = None, 
                  last_name: str = None, city_id: int = None, address: str = None):
         """
@@ -19,54 +38,17 @@ class Customer(BaseModel):
             address (str, optional): Customer's address.
         """
         super().__init__()
-        self._data = {
-            'customer_id': customer_id,
-            'first_name': first_name,
-            'middle_initial': middle_initial,
-            'last_name': last_name,
-            'city_id': city_id,
-            'address': address
-        }
-
-    def validate(self) -> bool:
-        """
-        Validate the customer data.
-        Returns:
-            bool: True if the data is valid, False otherwise.
-        """
-        if not self._data['first_name'] or not self._data['last_name']:
-            return False
-        if self._data['city_id'] is not None and not isinstance(self._data['city_id'], int):
-            return False
-        if self._data['middle_initial'] is not None and len(self._data['middle_initial']) > 5:
-            return False
-        return True
-
-    def to_dict(self) -> Dict[str, Any]:
-        """
-        Convert the customer instance to a dictionary.
-        Returns:
-            Dict[str, Any]: Dictionary containing the customer's data.
-        """
-        return self._data.copy()
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Customer':
-        """
-        Create a Customer instance from a dictionary.
-        Args:
-            data (Dict[str, Any]): Dictionary containing the customer's data.
-        Returns:
-            Customer: A new Customer instance.
-        """
-        return cls(
-            customer_id=data.get('customer_id'),
-            first_name=data.get('first_name'),
-            middle_initial=data.get('middle_initial'),
-            last_name=data.get('last_name'),
-            city_id=data.get('city_id'),
-            address=data.get('address')
-        )
+        self.customer_id = customer_id
+        # Names recur heavily across customer rows; interning shares one
+        # string object per distinct value instead of one per row
+        self.first_name = (sys.intern(first_name)
+                           if type(first_name) is str else first_name)
+        self.middle_initial = (sys.intern(middle_initial)
+                               if type(middle_initial) is str else middle_initial)
+        self.last_name = (sys.intern(last_name)
+                          if type(last_name) is str else last_name)
+        self.city_id = city_id
+        self.address = address
 
     @classmethod
     def from_dataframe(cls, df: pd.DataFrame) -> 'Customer':
@@ -77,76 +59,9 @@ class Customer(BaseModel):
         Returns:
             Customer: A new Customer instance.
         """
-        if df.empty:
+        # len(df.index) skips the empty property's multi-axis scan
+        if len(df.index) == 0:
             return cls()
         
-        # Handle both column naming conventions (from CSV and DB)
-        customer_id = df.get('CustomerID', df.get('customer_id', [None]))[0]
-        first_name = df.get('FirstName', df.get('first_name', [None]))[0]
-        middle_initial = df.get('MiddleInitial', df.get('middle_initial', [None]))[0]
-        last_name = df.get('LastName', df.get('last_name', [None]))[0]
-        city_id = df.get('CityID', df.get('city_id', [None]))[0]
-        address = df.get('Address', df.get('address', [None]))[0]
-        
-        return cls(
-            customer_id=customer_id,
-            first_name=first_name,
-            middle_initial=middle_initial,
-            last_name=last_name,
-            city_id=city_id,
-            address=address
-        )
-
-    @property
-    def customer_id(self) -> int:
-        """
-        Get the customer ID.
-        Returns:
-            int: The customer ID.
-        """
-        return self._data['customer_id']
-
-    @property
-    def first_name(self) -> str:
-        """
-        Get the customer's first name.
-        Returns:
-            str: The first name.
-        """
-        return self._data['first_name']
-
-    @property
-    def middle_initial(self) -> str:
-        """
-        Get the customer's middle initial.
-        Returns:
-            str: The middle initial.
-        """
-        return self._data['middle_initial']
-
-    @property
-    def last_name(self) -> str:
-        """
-        Get the customer's last name.
-        Returns:
-            str: The last name.
-        """
-        return self._data['last_name']
-
-    @property
-    def city_id(self) -> int:
-        """
-        Get the city ID where the customer resides.
-        Returns:
-            int: The city ID.
-        """
-        return self._data['city_id']
-
-    @property
-    def address(self) -> str:
-        """
-        Get the customer's address.
-        Returns:
-            str: The address.
-        """
-        return self._data['address'] 
\ No newline at end of file
+        # Alias resolution lives in _ALIASES; reuse the batch path
+        return cls.from_dataframe_batch(df.head(1))[0]
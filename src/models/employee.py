@@ -1,11 +1,50 @@
 from typing import Any, Dict
 import pandas as pd
-from .base_model import BaseModel
+from .base_model import BaseModel, _INT_TYPES, _decode_epoch_days, _encode_epoch_days
+
+#: Gender -> 4-bit code, mirroring Product's packed categoricals; 0 is
+#: unset and unknown inputs get the invalid code caught by mask_zero
+_INVALID_CODE = 0xC
+_GENDER_CODES = {'M': 1, 'F': 2}
+_GENDER_NAMES = {code: name for name, code in _GENDER_CODES.items()}
 
 class Employee(BaseModel):
     """
     Employee represents an employee entity in the system, containing personal and employment information.
     """
+
+    __slots__ = ('employee_id', 'first_name', 'middle_initial', 'last_name', '_birth_days', '_gender_code', 'city_id', '_hire_days')
+
+    _ALIASES = {
+        'employee_id': ('EmployeeID', 'employee_id'),
+        'first_name': ('FirstName', 'first_name'),
+        'middle_initial': ('MiddleInitial', 'middle_initial'),
+        'last_name': ('LastName', 'last_name'),
+        'birth_date': ('BirthDate', 'birth_date'),
+        'gender': ('Gender', 'gender'),
+        'city_id': ('CityID', 'city_id'),
+        'hire_date': ('HireDate', 'hire_date'),
+    }
+
+    _DATE_FIELDS = ('birth_date', 'hire_date')
+
+    _VALIDATORS = (
+        ('first_name', 'truthy'),
+        ('last_name', 'truthy'),
+        ('city_id', 'type_in_or_none', _INT_TYPES),
+        ('middle_initial', 'max_len_or_none', 5),
+        ('_gender_code', 'mask_zero', 0xC),
+    )
+
+    #: validate_batch works on raw columns, so the packed gender rule
+    #: is expressed as membership over the source strings instead
+    _BATCH_VALIDATORS = (
+        ('first_name', 'truthy'),
+        ('last_name', 'truthy'),
+        ('city_id', 'type_in_or_none', _INT_TYPES),
+        ('middle_initial', 'max_len_or_none', 5),
+        ('gender', 'in_or_none', frozenset(_GENDER_CODES)),
+    )
     def __init__(self, employee_id: int = None, first_name: str = None, middle_initial: str = None, 
                  last_name: str = None, birth_date: str = None, gender: str = None, 
                  city_id: int = None, hire_date: str = None):
@@ -22,60 +61,61 @@ class Employee(BaseModel):
             hire_date (str, optional): Date when the employee was hired.
         """
         super().__init__()
-        self._data = {
-            'employee_id': employee_id,
-            'first_name': first_name,
-            'middle_initial': middle_initial,
-            'last_name': last_name,
-            'birth_date': birth_date,
-            'gender': gender,
-            'city_id': city_id,
-            'hire_date': hire_date
-        }
-
-    def validate(self) -> bool:
-        """
-        Validate the employee data.
-        Returns:
-            bool: True if the data is valid, False otherwise.
-        """
-        if not self._data['first_name'] or not self._data['last_name']:
-            return False
-        if self._data['city_id'] is not None and not isinstance(self._data['city_id'], int):
-            return False
-        if self._data['middle_initial'] is not None and len(self._data['middle_initial']) > 5:
-            return False
-        if self._data['gender'] is not None and self._data['gender'] not in ['M', 'F']:
-            return False
-        return True
+        self.employee_id = employee_id
+        self.first_name = first_name
+        self.middle_initial = middle_initial
+        self.last_name = last_name
+        # Dates are stored as epoch-day ints (parsed once here, or
+        # vectorized upstream in from_dataframe_batch)
+        self._birth_days = _encode_epoch_days(birth_date)
+        # Packed like Product's categoricals: one 4-bit code per value
+        self._gender_code = (0 if gender is None
+                             else _GENDER_CODES.get(gender, _INVALID_CODE))
+        self.city_id = city_id
+        self._hire_days = _encode_epoch_days(hire_date)
+
+    @property
+    def gender(self) -> str:
+        """Gender of the employee, decoded from the packed code."""
+        return _GENDER_NAMES.get(self._gender_code)
+
+    @property
+    def birth_date(self) -> str:
+        """Date of birth as an ISO string, decoded from epoch days."""
+        return _decode_epoch_days(self._birth_days)
+
+    @property
+    def hire_date(self) -> str:
+        """Hire date as an ISO string, decoded from epoch days."""
+        return _decode_epoch_days(self._hire_days)
 
     def to_dict(self) -> Dict[str, Any]:
         """
-        Convert the employee instance to a dictionary.
+        Convert the employee to a dictionary representation.
+
+        Overridden because the dates live in epoch-day slots; the
+        decoded ISO strings are emitted under their field names.
+
         Returns:
             Dict[str, Any]: Dictionary containing the employee's data.
         """
-        return self._data.copy()
+        return {field: getattr(self, field) for field in self._ALIASES}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Employee':
         """
         Create an Employee instance from a dictionary.
+
+        Overridden because the dates live in epoch-day slots; the
+        constructor re-encodes the date values.
+
         Args:
             data (Dict[str, Any]): Dictionary containing the employee's data.
+
         Returns:
             Employee: A new Employee instance.
         """
-        return cls(
-            employee_id=data.get('employee_id'),
-            first_name=data.get('first_name'),
-            middle_initial=data.get('middle_initial'),
-            last_name=data.get('last_name'),
-            birth_date=data.get('birth_date'),
-            gender=data.get('gender'),
-            city_id=data.get('city_id'),
-            hire_date=data.get('hire_date')
-        )
+        return cls(**{field: data.get(field) for field in cls._ALIASES})
 
     @classmethod
     def from_dataframe(cls, df: pd.DataFrame) -> 'Employee':
@@ -86,98 +126,9 @@ class Employee(BaseModel):
         Returns:
             Employee: A new Employee instance.
         """
-        if df.empty:
+        # len(df.index) skips the empty property's multi-axis scan
+        if len(df.index) == 0:
             return cls()
         
-        # Handle both column naming conventions (from CSV and DB)
-        employee_id = df.get('EmployeeID', df.get('employee_id', [None]))[0]
-        first_name = df.get('FirstName', df.get('first_name', [None]))[0]
-        middle_initial = df.get('MiddleInitial', df.get('middle_initial', [None]))[0]
-        last_name = df.get('LastName', df.get('last_name', [None]))[0]
-        birth_date = df.get('BirthDate', df.get('birth_date', [None]))[0]
-        gender = df.get('Gender', df.get('gender', [None]))[0]
-        city_id = df.get('CityID', df.get('city_id', [None]))[0]
-        hire_date = df.get('HireDate', df.get('hire_date', [None]))[0]
-        
-        return cls(
-            employee_id=employee_id,
-            first_name=first_name,
-            middle_initial=middle_initial,
-            last_name=last_name,
-            birth_date=birth_date,
-            gender=gender,
-            city_id=city_id,
-            hire_date=hire_date
-        )
-
-    @property
-    def employee_id(self) -> int:
-        """
-        Get the employee ID.
-        Returns:
-            int: The employee ID.
-        """
-        return self._data['employee_id']
-
-    @property
-    def first_name(self) -> str:
-        """
-        Get the employee's first name.
-        Returns:
-            str: The first name.
-        """
-        return self._data['first_name']
-
-    @property
-    def middle_initial(self) -> str:
-        """
-        Get the employee's middle initial.
-        Returns:
-            str: The middle initial.
-        """
-        return self._data['middle_initial']
-
-    @property
-    def last_name(self) -> str:
-        """
-        Get the employee's last name.
-        Returns:
-            str: The last name.
-        """
-        return self._data['last_name']
-
-    @property
-    def birth_date(self) -> str:
-        """
-        Get the employee's birth date.
-        Returns:
-            str: The birth date.
-        """
-        return self._data['birth_date']
-
-    @property
-    def gender(self) -> str:
-        """
-        Get the employee's gender.
-        Returns:
-            str: The gender (M/F).
-        """
-        return self._data['gender']
-
-    @property
-    def city_id(self) -> int:
-        """
-        Get the city ID where the employee resides.
-        Returns:
-            int: The city ID.
-        """
-        return self._data['city_id']
-
-    @property
-    def hire_date(self) -> str:
-        """
-        Get the employee's hire date.
-        Returns:
-            str: The hire date.
-        """
-        return self._data['hire_date'] 
\ No newline at end of file
+        # Alias resolution lives in _ALIASES; reuse the batch path
+        return cls.from_dataframe_batch(df.head(1))[0]
@@ -1,11 +1,75 @@
+import sys
 from typing import Any, Dict
 import pandas as pd
-from .base_model import BaseModel
+from .base_model import (BaseModel, _INT_TYPES, _NUM_TYPES, _decode_cents,
+                         _decode_epoch_days, _encode_cents, _encode_epoch_days)
+
+#: Categorical value -> 4-bit code. 0 means unset; unknown inputs map to
+#: _INVALID_CODE, whose high bits make the validity mask test fail.
+_INVALID_CODE = 0xC
+_CLASS_CODES = {'Low': 1, 'Medium': 2, 'High': 3}
+_RESISTANT_CODES = {'Durable': 1, 'Weak': 2, 'Unknown': 3}
+_ALLERGIC_CODES = {'TRUE': 1, 'FALSE': 2, 'Unknown': 3}
+_CLASS_NAMES = {code: name for name, code in _CLASS_CODES.items()}
+_RESISTANT_NAMES = {code: name for name, code in _RESISTANT_CODES.items()}
+_ALLERGIC_NAMES = {code: name for name, code in _ALLERGIC_CODES.items()}
+
+
+def _encode(value, codes):
+    """Map a categorical value to its 4-bit code (0 for None)."""
+    if value is None:
+        return 0
+    return codes.get(value, _INVALID_CODE)
+
 
 class Product(BaseModel):
     """
     Product represents a product entity in the system, containing information about items available for sale.
+
+    The three categorical fields (class_type, resistant, is_allergic)
+    are quantized into one packed-int slot instead of three string
+    references, cutting per-instance memory for bulk loads; properties
+    decode them back to the original strings for callers.
     """
+
+    __slots__ = ('product_id', 'product_name', '_price_cents', 'category_id', '_flags', '_modify_days', 'vitality_days')
+
+    _ALIASES = {
+        'product_id': ('ProductID', 'product_id'),
+        'product_name': ('ProductName', 'product_name'),
+        'price': ('Price', 'price'),
+        'category_id': ('CategoryID', 'category_id'),
+        'class_type': ('Class', 'class_type'),
+        'modify_date': ('ModifyDate', 'modify_date'),
+        'resistant': ('Resistant', 'resistant'),
+        'is_allergic': ('IsAllergic', 'is_allergic'),
+        'vitality_days': ('VitalityDays', 'vitality_days'),
+    }
+
+    _DATE_FIELDS = ('modify_date',)
+
+    _VALIDATORS = (
+        ('product_name', 'truthy'),
+        ('price', 'type_in_or_none', _NUM_TYPES),
+        ('category_id', 'type_in_or_none', _INT_TYPES),
+        # One mask test covers all three packed categoricals: any
+        # invalid nibble (0xC) trips the high bits
+        ('_flags', 'mask_zero', 0xCCC),
+        ('vitality_days', 'type_in_or_none', _INT_TYPES),
+    )
+
+    #: validate_batch works on raw columns, so the packed-flags rule is
+    #: expressed as membership over the categorical strings instead
+    _BATCH_VALIDATORS = (
+        ('product_name', 'truthy'),
+        ('price', 'type_in_or_none', _NUM_TYPES),
+        ('category_id', 'type_in_or_none', _INT_TYPES),
+        ('class_type', 'in_or_none', frozenset(_CLASS_CODES)),
+        ('resistant', 'in_or_none', frozenset(_RESISTANT_CODES)),
+        ('is_allergic', 'in_or_none', frozenset(_ALLERGIC_CODES)),
+        ('vitality_days', 'type_in_or_none', _INT_TYPES),
+    )
+
     def __init__(self, product_id: int = None, product_name: str = None, price: float = None, 
                  category_id: int = None, class_type: str = None, modify_date: str = None,
                  resistant: str = None, is_allergic: str = None, vitality_days: int = None):
@@ -23,68 +87,80 @@ class Product(BaseModel):
             vitality_days (int, optional): Number of days the product remains fresh.
         """
         super().__init__()
-        self._data = {
-            'product_id': product_id,
-            'product_name': product_name,
-            'price': price,
-            'category_id': category_id,
-            'class_type': class_type,
-            'modify_date': modify_date,
-            'resistant': resistant,
-            'is_allergic': is_allergic,
-            'vitality_days': vitality_days
-        }
-
-    def validate(self) -> bool:
-        """
-        Validate the product data.
-        Returns:
-            bool: True if the data is valid, False otherwise.
-        """
-        if not self._data['product_name']:
-            return False
-        if self._data['price'] is not None and not isinstance(self._data['price'], (int, float)):
-            return False
-        if self._data['category_id'] is not None and not isinstance(self._data['category_id'], int):
-            return False
-        if self._data['class_type'] is not None and self._data['class_type'] not in ['Low', 'Medium', 'High']:
-            return False
-        if self._data['resistant'] is not None and self._data['resistant'] not in ['Durable', 'Weak', 'Unknown']:
-            return False
-        if self._data['is_allergic'] is not None and self._data['is_allergic'] not in ['TRUE', 'FALSE', 'Unknown']:
-            return False
-        if self._data['vitality_days'] is not None and not isinstance(self._data['vitality_days'], int):
-            return False
-        return True
+        self.product_id = product_id
+        # Product names repeat across joined sales rows; intern so each
+        # distinct name is one shared string object
+        self.product_name = (sys.intern(product_name)
+                             if type(product_name) is str else product_name)
+        # Money is stored as integer cents: exact equality, no repeated
+        # driver Decimal allocations downstream. Non-numeric input is
+        # stored as-is for validate() to reject.
+        self._price_cents = _encode_cents(price)
+        self.category_id = category_id
+        self._flags = ((_encode(class_type, _CLASS_CODES) << 8)
+                       | (_encode(resistant, _RESISTANT_CODES) << 4)
+                       | _encode(is_allergic, _ALLERGIC_CODES))
+        # Stored as epoch-day ints like Employee's dates
+        self._modify_days = _encode_epoch_days(modify_date)
+        self.vitality_days = vitality_days
+
+    @property
+    def price(self) -> float:
+        """Price in currency units, decoded from the cents storage."""
+        return _decode_cents(self._price_cents)
+
+    @property
+    def price_cents(self) -> int:
+        """Price as exact integer cents (valid instances only)."""
+        return self._price_cents
+
+    @property
+    def modify_date(self) -> str:
+        """Date of last modification as an ISO string, decoded from epoch days."""
+        return _decode_epoch_days(self._modify_days)
+
+    @property
+    def class_type(self) -> str:
+        """Classification of the product, decoded from the packed flags."""
+        return _CLASS_NAMES.get((self._flags >> 8) & 0xF)
+
+    @property
+    def resistant(self) -> str:
+        """Durability classification, decoded from the packed flags."""
+        return _RESISTANT_NAMES.get((self._flags >> 4) & 0xF)
+
+    @property
+    def is_allergic(self) -> str:
+        """Allergy indicator, decoded from the packed flags."""
+        return _ALLERGIC_NAMES.get(self._flags & 0xF)
 
     def to_dict(self) -> Dict[str, Any]:
         """
-        Convert the product instance to a dictionary.
+        Convert the product to a dictionary representation.
+
+        Overridden because the categoricals live in the packed slot; the
+        decoded string values are emitted under their field names.
+
         Returns:
             Dict[str, Any]: Dictionary containing the product's data.
         """
-        return self._data.copy()
+        return {field: getattr(self, field) for field in self._ALIASES}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Product':
         """
         Create a Product instance from a dictionary.
+
+        Overridden because the categoricals live in the packed slot; the
+        constructor re-encodes the string values.
+
         Args:
             data (Dict[str, Any]): Dictionary containing the product's data.
+
         Returns:
             Product: A new Product instance.
         """
-        return cls(
-            product_id=data.get('product_id'),
-            product_name=data.get('product_name'),
-            price=data.get('price'),
-            category_id=data.get('category_id'),
-            class_type=data.get('class_type'),
-            modify_date=data.get('modify_date'),
-            resistant=data.get('resistant'),
-            is_allergic=data.get('is_allergic'),
-            vitality_days=data.get('vitality_days')
-        )
+        return cls(**{field: data.get(field) for field in cls._ALIASES})
 
     @classmethod
     def from_dataframe(cls, df: pd.DataFrame) -> 'Product':
@@ -95,109 +171,9 @@ class Product(BaseModel):
         Returns:
             Product: A new Product instance.
         """
-        if df.empty:
+        # len(df.index) skips the empty property's multi-axis scan
+        if len(df.index) == 0:
             return cls()
         
-        # Handle both column naming conventions (from CSV and DB)
-        product_id = df.get('ProductID', df.get('product_id', [None]))[0]
-        product_name = df.get('ProductName', df.get('product_name', [None]))[0]
-        price = df.get('Price', df.get('price', [None]))[0]
-        category_id = df.get('CategoryID', df.get('category_id', [None]))[0]
-        class_type = df.get('Class', df.get('class_type', [None]))[0]
-        modify_date = df.get('ModifyDate', df.get('modify_date', [None]))[0]
-        resistant = df.get('Resistant', df.get('resistant', [None]))[0]
-        is_allergic = df.get('IsAllergic', df.get('is_allergic', [None]))[0]
-        vitality_days = df.get('VitalityDays', df.get('vitality_days', [None]))[0]
-        
-        return cls(
-            product_id=product_id,
-            product_name=product_name,
-            price=price,
-            category_id=category_id,
-            class_type=class_type,
-            modify_date=modify_date,
-            resistant=resistant,
-            is_allergic=is_allergic,
-            vitality_days=vitality_days
-        )
-
-    @property
-    def product_id(self) -> int:
-        """
-        Get the product ID.
-        Returns:
-            int: The product ID.
-        """
-        return self._data['product_id']
-
-    @property
-    def product_name(self) -> str:
-        """
-        Get the product name.
-        Returns:
-            str: The product name.
-        """
-        return self._data['product_name']
-
-    @property
-    def price(self) -> float:
-        """
-        Get the product price.
-        Returns:
-            float: The product price.
-        """
-        return self._data['price']
-
-    @property
-    def category_id(self) -> int:
-        """
-        Get the category ID.
-        Returns:
-            int: The category ID.
-        """
-        return self._data['category_id']
-
-    @property
-    def class_type(self) -> str:
-        """
-        Get the product class.
-        Returns:
-            str: The product class (Low/Medium/High).
-        """
-        return self._data['class_type']
-
-    @property
-    def modify_date(self) -> str:
-        """
-        Get the modification date.
-        Returns:
-            str: The modification date.
-        """
-        return self._data['modify_date']
-
-    @property
-    def resistant(self) -> str:
-        """
-        Get the resistance classification.
-        Returns:
-            str: The resistance classification (Durable/Weak/Unknown).
-        """
-        return self._data['resistant']
-
-    @property
-    def is_allergic(self) -> str:
-        """
-        Get the allergy indicator.
-        Returns:
-            str: The allergy indicator (TRUE/FALSE/Unknown).
-        """
-        return self._data['is_allergic']
-
-    @property
-    def vitality_days(self) -> int:
-        """
-        Get the vitality days.
-        Returns:
-            int: The number of days the product remains fresh.
-        """
-        return self._data['vitality_days'] 
\ No newline at end of file
+        # Alias resolution lives in _ALIASES; reuse the batch path
+        return cls.from_dataframe_batch(df.head(1))[0]
@@ -0,0 +1,182 @@
+import numpy as np
+import pandas as pd
+from .base_model import _decode_epoch_days, _resolve_columns
+from .product import (Product, _ALLERGIC_CODES, _ALLERGIC_NAMES,
+                      _CLASS_CODES, _CLASS_NAMES, _INVALID_CODE,
+                      _RESISTANT_CODES, _RESISTANT_NAMES)
+
+
+def _encode_categorical(series: pd.Series, codes) -> np.ndarray:
+    """Vectorized categorical -> code column (0 unset, 0xC invalid)."""
+    encoded = series.map(codes)
+    encoded = encoded.where(series.isna() | encoded.notna(), _INVALID_CODE)
+    return encoded.fillna(0).to_numpy(dtype='uint8')
+
+
+def _encode_numeric(series: pd.Series, dtype: str, fill) -> np.ndarray:
+    """Vectorized numeric column pull with a sentinel for missing."""
+    return pd.to_numeric(series, errors='coerce').fillna(fill).to_numpy(dtype=dtype)
+
+
+class ProductColumnStore:
+    """
+    Struct-of-arrays companion to Product for batch analytics.
+
+    Thousands of Product rows held as objects pay a header plus pointer
+    chase per field access; the store keeps each field as one contiguous
+    NumPy array instead, so aggregations (mean price, per-category
+    groupbys) run at C speed over a few bytes per row. Individual rows
+    are exposed as lightweight views that index into the arrays rather
+    than copying them out.
+    """
+
+    __slots__ = ('product_id', 'product_name', 'price', 'category_id',
+                 'class_code', 'resistant_code', 'allergic_code',
+                 'modify_days', 'vitality_days')
+
+    #: Sentinel in the id/int columns for missing source values
+    MISSING = -1
+
+    #: Sentinel in modify_days for missing dates (negative days are
+    #: legitimate pre-1970 dates, so -1 cannot double as the marker)
+    NO_DATE = np.iinfo('int32').min
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Build the columnar store from a products DataFrame.
+
+        Columns are resolved through Product's alias table, parsed
+        vectorized and stored with compact dtypes (uint8 categorical
+        codes, int32 epoch days).
+
+        Args:
+            df (pd.DataFrame): DataFrame with one row per product.
+        """
+        columns = _resolve_columns(Product, tuple(df.columns))
+        row_count = len(df.index)
+        empty = pd.Series((None,) * row_count)
+
+        def col(field):
+            column = columns.get(field)
+            return df[column] if column is not None else empty
+
+        self.product_id = _encode_numeric(col('product_id'), 'int64', self.MISSING)
+        self.product_name = col('product_name').to_numpy(dtype=object)
+        self.price = _encode_numeric(col('price'), 'float64', np.nan)
+        self.category_id = _encode_numeric(col('category_id'), 'int64', self.MISSING)
+        self.class_code = _encode_categorical(col('class_type'), _CLASS_CODES)
+        self.resistant_code = _encode_categorical(col('resistant'), _RESISTANT_CODES)
+        self.allergic_code = _encode_categorical(col('is_allergic'), _ALLERGIC_CODES)
+        parsed = pd.to_datetime(col('modify_date'), errors='coerce')
+        days = parsed.to_numpy().astype('datetime64[D]').astype('int64')
+        days[parsed.isna().to_numpy()] = self.NO_DATE
+        self.modify_days = days.astype('int32')
+        self.vitality_days = _encode_numeric(col('vitality_days'), 'int64', self.MISSING)
+
+    def __len__(self) -> int:
+        return len(self.product_id)
+
+    def row(self, idx: int) -> 'ProductRowView':
+        """
+        Get a lightweight view of one row.
+
+        Args:
+            idx (int): Row position in the store.
+
+        Returns:
+            ProductRowView: View indexing into the columnar arrays.
+        """
+        return ProductRowView(self, idx)
+
+    def rows(self):
+        """Yield a view per row, in order."""
+        for idx in range(len(self)):
+            yield ProductRowView(self, idx)
+
+    def mean_price(self) -> float:
+        """Average price over the store, ignoring missing values."""
+        return float(np.nanmean(self.price)) if len(self) else 0.0
+
+    def price_by_category(self):
+        """
+        Average price per category as {category_id: mean_price}.
+
+        Runs entirely on the columnar arrays via bincount, no pandas
+        groupby machinery.
+        """
+        present = (self.category_id != self.MISSING) & ~np.isnan(self.price)
+        ids = self.category_id[present]
+        if not len(ids):
+            return {}
+        totals = np.bincount(ids, weights=self.price[present])
+        counts = np.bincount(ids)
+        found = np.nonzero(counts)[0]
+        return {int(cid): float(totals[cid] / counts[cid]) for cid in found}
+
+
+class ProductRowView:
+    """
+    Lightweight view of one ProductColumnStore row.
+
+    Holds only a store reference and an index; every attribute read
+    decodes straight from the columnar arrays.
+    """
+
+    __slots__ = ('_store', '_idx')
+
+    def __init__(self, store: ProductColumnStore, idx: int):
+        self._store = store
+        self._idx = idx
+
+    @property
+    def product_id(self):
+        value = self._store.product_id[self._idx]
+        return int(value) if value != ProductColumnStore.MISSING else None
+
+    @property
+    def product_name(self):
+        return self._store.product_name[self._idx]
+
+    @property
+    def price(self):
+        value = self._store.price[self._idx]
+        return float(value) if not np.isnan(value) else None
+
+    @property
+    def category_id(self):
+        value = self._store.category_id[self._idx]
+        return int(value) if value != ProductColumnStore.MISSING else None
+
+    @property
+    def class_type(self):
+        return _CLASS_NAMES.get(int(self._store.class_code[self._idx]))
+
+    @property
+    def resistant(self):
+        return _RESISTANT_NAMES.get(int(self._store.resistant_code[self._idx]))
+
+    @property
+    def is_allergic(self):
+        return _ALLERGIC_NAMES.get(int(self._store.allergic_code[self._idx]))
+
+    @property
+    def modify_date(self):
+        days = int(self._store.modify_days[self._idx])
+        return _decode_epoch_days(days) if days != ProductColumnStore.NO_DATE else None
+
+    @property
+    def vitality_days(self):
+        value = self._store.vitality_days[self._idx]
+        return int(value) if value != ProductColumnStore.MISSING else None
+
+    def to_product(self) -> Product:
+        """Materialize the view as a full Product instance."""
+        return Product(product_id=self.product_id,
+                       product_name=self.product_name,
+                       price=self.price,
+                       category_id=self.category_id,
+                       class_type=self.class_type,
+                       modify_date=self.modify_date,
+                       resistant=self.resistant,
+                       is_allergic=self.is_allergic,
+                       vitality_days=self.vitality_days)
@@ -1,13 +1,40 @@
 from typing import Any, Dict
 import pandas as pd
-from .base_model import BaseModel
+from .base_model import (BaseModel, _INT_TYPES, _NUM_TYPES, _decode_cents,
+                         _encode_cents)
 
 class Sale(BaseModel):
     """
     Sale represents a sales transaction in the system, containing information about products sold and transaction details.
     """
-    def __init__(self, sale_id: int = None, sales_person_id: int = None, customer_id: int = None, 
-                 product_id: int = None, quantity: int = None, discount: float = None, 
+
+    __slots__ = ('sale_id', 'sales_person_id', 'customer_id', 'product_id',
+                 'quantity', 'discount', '_total_price_cents', 'sale_date',
+                 'transaction_number')
+
+    _ALIASES = {
+        'sale_id': ('SalesID', 'sale_id'),
+        'sales_person_id': ('SalesPersonID', 'sales_person_id'),
+        'customer_id': ('CustomerID', 'customer_id'),
+        'product_id': ('ProductID', 'product_id'),
+        'quantity': ('Quantity', 'quantity'),
+        'discount': ('Discount', 'discount'),
+        'total_price': ('TotalPrice', 'total_price'),
+        'sale_date': ('SalesDate', 'sale_date'),
+        'transaction_number': ('TransactionNumber', 'transaction_number'),
+    }
+
+    _VALIDATORS = (
+        ('quantity', 'type_in_or_none', _INT_TYPES),
+        ('discount', 'type_in_or_none', _NUM_TYPES),
+        ('total_price', 'type_in_or_none', _NUM_TYPES),
+        ('sales_person_id', 'type_in_or_none', _INT_TYPES),
+        ('customer_id', 'type_in_or_none', _INT_TYPES),
+        ('product_id', 'type_in_or_none', _INT_TYPES),
+    )
+
+    def __init__(self, sale_id: int = None, sales_person_id: int = None, customer_id: int = None,
+                 product_id: int = None, quantity: int = None, discount: float = None,
                  total_price: float = None, sale_date: str = None, transaction_number: str = None):
         """
         Initialize a Sale instance.
@@ -23,66 +50,56 @@ class Sale(BaseModel):
             transaction_number (str, optional): Unique transaction identifier.
         """
         super().__init__()
-        self._data = {
-            'sale_id': sale_id,
-            'sales_person_id': sales_person_id,
-            'customer_id': customer_id,
-            'product_id': product_id,
-            'quantity': quantity,
-            'discount': discount,
-            'total_price': total_price,
-            'sale_date': sale_date,
-            'transaction_number': transaction_number
-        }
-
-    def validate(self) -> bool:
-        """
-        Validate the sale data.
-        Returns:
-            bool: True if the data is valid, False otherwise.
-        """
-        if self._data['quantity'] is not None and not isinstance(self._data['quantity'], int):
-            return False
-        if self._data['discount'] is not None and not isinstance(self._data['discount'], (int, float)):
-            return False
-        if self._data['total_price'] is not None and not isinstance(self._data['total_price'], (int, float)):
-            return False
-        if self._data['sales_person_id'] is not None and not isinstance(self._data['sales_person_id'], int):
-            return False
-        if self._data['customer_id'] is not None and not isinstance(self._data['customer_id'], int):
-            return False
-        if self._data['product_id'] is not None and not isinstance(self._data['product_id'], int):
-            return False
-        return True
+        self.sale_id = sale_id
+        self.sales_person_id = sales_person_id
+        self.customer_id = customer_id
+        self.product_id = product_id
+        self.quantity = quantity
+        self.discount = discount
+        # Money is stored as integer cents: exact equality, no repeated
+        # driver Decimal allocations downstream. Non-numeric input is
+        # stored as-is for validate() to reject.
+        self._total_price_cents = _encode_cents(total_price)
+        self.sale_date = sale_date
+        self.transaction_number = transaction_number
+
+    @property
+    def total_price(self) -> float:
+        """Total price in currency units, decoded from the cents storage."""
+        return _decode_cents(self._total_price_cents)
+
+    @property
+    def total_price_cents(self) -> int:
+        """Total price as exact integer cents (valid instances only)."""
+        return self._total_price_cents
 
     def to_dict(self) -> Dict[str, Any]:
         """
-        Convert the sale instance to a dictionary.
+        Convert the sale to a dictionary representation.
+
+        Overridden because total_price lives in the cents slot; the
+        decoded value is emitted under its field name.
+
         Returns:
             Dict[str, Any]: Dictionary containing the sale's data.
         """
-        return self._data.copy()
+        return {field: getattr(self, field) for field in self._ALIASES}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Sale':
         """
         Create a Sale instance from a dictionary.
+
+        Overridden because total_price lives in the cents slot; the
+        constructor re-encodes the currency value.
+
         Args:
             data (Dict[str, Any]): Dictionary containing the sale's data.
+
         Returns:
             Sale: A new Sale instance.
         """
-        return cls(
-            sale_id=data.get('sale_id'),
-            sales_person_id=data.get('sales_person_id'),
-            customer_id=data.get('customer_id'),
-            product_id=data.get('product_id'),
-            quantity=data.get('quantity'),
-            discount=data.get('discount'),
-            total_price=data.get('total_price'),
-            sale_date=data.get('sale_date'),
-            transaction_number=data.get('transaction_number')
-        )
+        return cls(**{field: data.get(field) for field in cls._ALIASES})
 
     @classmethod
     def from_dataframe(cls, df: pd.DataFrame) -> 'Sale':
@@ -93,109 +110,9 @@ class Sale(BaseModel):
         Returns:
             Sale: A new Sale instance.
         """
-        if df.empty:
+        # len(df.index) skips the empty property's multi-axis scan
+        if len(df.index) == 0:
             return cls()
-        
-        # Handle both column naming conventions (from CSV and DB)
-        sale_id = df.get('SalesID', df.get('sale_id', [None]))[0]
-        sales_person_id = df.get('SalesPersonID', df.get('sales_person_id', [None]))[0]
-        customer_id = df.get('CustomerID', df.get('customer_id', [None]))[0]
-        product_id = df.get('ProductID', df.get('product_id', [None]))[0]
-        quantity = df.get('Quantity', df.get('quantity', [None]))[0]
-        discount = df.get('Discount', df.get('discount', [None]))[0]
-        total_price = df.get('TotalPrice', df.get('total_price', [None]))[0]
-        sale_date = df.get('SalesDate', df.get('sale_date', [None]))[0]
-        transaction_number = df.get('TransactionNumber', df.get('transaction_number', [None]))[0]
-        
-        return cls(
-            sale_id=sale_id,
-            sales_person_id=sales_person_id,
-            customer_id=customer_id,
-            product_id=product_id,
-            quantity=quantity,
-            discount=discount,
-            total_price=total_price,
-            sale_date=sale_date,
-            transaction_number=transaction_number
-        )
-
-    @property
-    def sale_id(self) -> int:
-        """
-        Get the sale ID.
-        Returns:
-            int: The sale ID.
-        """
-        return self._data['sale_id']
-
-    @property
-    def sales_person_id(self) -> int:
-        """
-        Get the sales person ID.
-        Returns:
-            int: The sales person ID.
-        """
-        return self._data['sales_person_id']
-
-    @property
-    def customer_id(self) -> int:
-        """
-        Get the customer ID.
-        Returns:
-            int: The customer ID.
-        """
-        return self._data['customer_id']
-
-    @property
-    def product_id(self) -> int:
-        """
-        Get the product ID.
-        Returns:
-            int: The product ID.
-        """
-        return self._data['product_id']
-
-    @property
-    def quantity(self) -> int:
-        """
-        Get the quantity sold.
-        Returns:
-            int: The quantity sold.
-        """
-        return self._data['quantity']
-
-    @property
-    def discount(self) -> float:
-        """
-        Get the discount applied.
-        Returns:
-            float: The discount amount.
-        """
-        return self._data['discount']
 
-    @property
-    def total_price(self) -> float:
-        """
-        Get the total price after discount.
-        Returns:
-            float: The total price.
-        """
-        return self._data['total_price']
-
-    @property
-    def sale_date(self) -> str:
-        """
-        Get the sale date.
-        Returns:
-            str: The sale date.
-        """
-        return self._data['sale_date']
-
-    @property
-    def transaction_number(self) -> str:
-        """
-        Get the transaction number.
-        Returns:
-            str: The transaction number.
-        """
-        return self._data['transaction_number'] 
\ No newline at end of file
+        # Alias resolution lives in _ALIASES; reuse the batch path
+        return cls.from_dataframe_batch(df.head(1))[0]
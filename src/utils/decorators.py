@@ -2,9 +2,11 @@
 Decorator pattern implementation for adding functionality to database operations.
 """
 import time
+import inspect
 import logging
 import functools
-from typing import Any, Callable, Dict
+from collections import OrderedDict
+from typing import Any, Callable
 import pandas as pd
 
 
@@ -18,53 +20,54 @@ class QueryCache:
     Simple in-memory cache for query results.
     """
     def __init__(self, max_size: int = 100):
-        self._cache: Dict[str, Any] = {}
+        # OrderedDict keeps insertion order, so recency tracking is a
+        # move_to_end per touch instead of an O(n) list.remove
+        self._cache: OrderedDict = OrderedDict()
         self._max_size = max_size
-        self._access_order = []
-    
-    def get(self, key: str) -> Any:
+
+    def get(self, key) -> Any:
         """
         Get a cached result.
         Args:
-            key (str): Cache key.
+            key: Cache key.
         Returns:
-            Any: Cached result or None if not found.
+            Any: Cached result or None if not found or expired.
         """
-        if key in self._cache:
-            # Move to end for LRU
-            self._access_order.remove(key)
-            self._access_order.append(key)
-            return self._cache[key]
-        return None
-    
-    def set(self, key: str, value: Any) -> None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() > expires_at:
+            # Expired: release the entry instead of serving stale data
+            del self._cache[key]
+            return None
+        # Move to end for LRU
+        self._cache.move_to_end(key)
+        return value
+
+    def set(self, key, value: Any, ttl: float = None) -> None:
         """
         Store a result in cache.
         Args:
-            key (str): Cache key.
+            key: Cache key.
             value (Any): Value to cache.
+            ttl (float, optional): Seconds before the entry expires;
+                entries without a ttl never expire.
         """
+        expires_at = float('inf') if ttl is None else time.monotonic() + ttl
         if key in self._cache:
             # Update existing
-            self._cache[key] = value
-            self._access_order.remove(key)
-            self._access_order.append(key)
-        else:
-            # Add new
-            if len(self._cache) >= self._max_size:
-                # Remove least recently used
-                oldest_key = self._access_order.pop(0)
-                del self._cache[oldest_key]
-            
-            self._cache[key] = value
-            self._access_order.append(key)
-    
+            self._cache.move_to_end(key)
+        elif len(self._cache) >= self._max_size:
+            # Remove least recently used
+            self._cache.popitem(last=False)
+        self._cache[key] = (expires_at, value)
+
     def clear(self) -> None:
         """
         Clear the cache.
         """
         self._cache.clear()
-        self._access_order.clear()
 
 
 # Global cache instance
@@ -83,17 +86,19 @@ def timing_decorator(func: Callable) -> Callable:
     """
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        # perf_counter_ns: monotonic, highest available resolution, and
+        # integer subtraction keeps floats off the hot path
+        start_ns = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        execution_time = end_time - start_time
-        
-        logger.info(f"{func.__name__} executed in {execution_time:.4f} seconds")
-        
+        elapsed_ns = time.perf_counter_ns() - start_ns
+
+        # %-style args are only formatted if a handler wants the record
+        logger.info("%s executed in %.4f seconds", func.__name__, elapsed_ns / 1e9)
+
         # Add timing info to result if it's a DataFrame
         if isinstance(result, pd.DataFrame):
-            result.attrs['execution_time'] = execution_time
-        
+            result.attrs['execution_time_ns'] = elapsed_ns
+
         return result
     return wrapper
 
@@ -112,70 +117,165 @@ def logging_decorator(func: Callable) -> Callable:
     def wrapper(*args, **kwargs):
         # Log method call
         method_name = func.__name__
-        logger.info(f"Calling {method_name}")
-        
-        # Log parameters (excluding self and sensitive data)
-        if args and hasattr(args[0], '__class__'):
-            # Skip self parameter
-            log_args = args[1:]
-        else:
-            log_args = args
-        
-        if log_args:
-            logger.debug(f"Parameters: args={log_args}")
-        
-        if kwargs:
-            # Filter out sensitive information like passwords
-            filtered_kwargs = {k: v for k, v in kwargs.items() 
-                             if 'password' not in k.lower() and 'secret' not in k.lower()}
-            logger.debug(f"Keyword parameters: {filtered_kwargs}")
-        
+        logger.info("Calling %s", method_name)
+
+        # Parameter extraction and the sensitive-data filter only run
+        # when a handler actually wants DEBUG records
+        if logger.isEnabledFor(logging.DEBUG):
+            # Log parameters (excluding self and sensitive data)
+            if args and hasattr(args[0], '__class__'):
+                # Skip self parameter
+                log_args = args[1:]
+            else:
+                log_args = args
+
+            if log_args:
+                logger.debug("Parameters: args=%s", log_args)
+
+            if kwargs:
+                # Filter out sensitive information like passwords
+                filtered_kwargs = {k: v for k, v in kwargs.items()
+                                 if 'password' not in k.lower() and 'secret' not in k.lower()}
+                logger.debug("Keyword parameters: %s", filtered_kwargs)
+
         try:
             result = func(*args, **kwargs)
-            logger.info(f"{method_name} completed successfully")
-            
+            logger.info("%s completed successfully", method_name)
+
             # Log result summary if it's a DataFrame
             if isinstance(result, pd.DataFrame):
-                logger.info(f"Returned DataFrame with {len(result)} rows and {len(result.columns)} columns")
-            
+                logger.info("Returned DataFrame with %d rows and %d columns",
+                            len(result), len(result.columns))
+
             return result
-        
+
         except Exception as e:
-            logger.error(f"{method_name} failed with error: {str(e)}")
+            logger.error("%s failed with error: %s", method_name, e)
             raise
     
     return wrapper
 
 
-def caching_decorator(cache_ttl: int = 300) -> Callable:
+def _default_cache_key(func: Callable, args: tuple, kwargs: dict) -> tuple:
+    """
+    Build a hashable cache key from a call's arguments.
+
+    Stringifying the arguments (the old key scheme) walks every cell of
+    any DataFrame argument — O(rows x cols) just to build a key. The
+    typed key hashes the arguments themselves instead; DataFrame and
+    other unhashable arguments are skipped, and a call whose positional
+    arguments are all DataFrames is rejected since nothing identifying
+    would remain in the key.
+
+    Args:
+        func (Callable): The decorated function.
+        args (tuple): Positional arguments of the call.
+        kwargs (dict): Keyword arguments of the call.
+    Returns:
+        tuple: Hashable cache key.
+    Raises:
+        TypeError: If no positional argument can contribute to the key.
+    """
+    keyed_args = []
+    for arg in args:
+        if isinstance(arg, pd.DataFrame):
+            continue
+        try:
+            hash(arg)
+        except TypeError:
+            continue
+        keyed_args.append(arg)
+    if args and not keyed_args:
+        raise TypeError(
+            f"Cannot build a cache key for {func.__name__}: every "
+            f"positional argument is unhashable; pass key_fn to "
+            f"caching_decorator")
+    keyed_kwargs = frozenset(
+        (name, value) for name, value in kwargs.items()
+        if not isinstance(value, pd.DataFrame))
+    return (func.__name__, tuple(keyed_args), keyed_kwargs)
+
+
+def _compile_cache_key(func: Callable) -> Callable:
+    """
+    Compile a key builder specialized for one function's signature.
+
+    The generic key walks every argument at call time; here the
+    signature is inspected once at decoration time and a flat tuple
+    expression is exec'd that picks each parameter straight out of
+    args/kwargs. Parameters annotated as DataFrames are dropped from
+    the key. Functions with *args/**kwargs can't be specialized and
+    return None so the caller falls back to the generic key.
+
+    Args:
+        func (Callable): The function being decorated.
+    Returns:
+        Callable: Specialized key builder, or None.
+    """
+    try:
+        sig = inspect.signature(func)
+    except (TypeError, ValueError):
+        return None
+
+    parts = []
+    namespace = {'_name': func.__name__}
+    for index, param in enumerate(sig.parameters.values()):
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            return None
+        if param.annotation is pd.DataFrame:
+            continue
+        default = None if param.default is param.empty else param.default
+        namespace[f'_d{index}'] = default
+        parts.append(f"args[{index}] if n > {index} "
+                     f"else kwargs.get({param.name!r}, _d{index})")
+
+    source = (f"def _key(*args, **kwargs):\n"
+              f"    n = len(args)\n"
+              f"    return (_name, {', '.join(parts)})\n")
+    exec(source, namespace)
+    return namespace['_key']
+
+
+def caching_decorator(cache_ttl: int = 300, key_fn: Callable = None) -> Callable:
     """
     Decorator that caches query results.
     This solves the problem of repeated expensive queries and improves performance.
-    
+
     Args:
         cache_ttl (int): Cache time-to-live in seconds.
+        key_fn (Callable, optional): Custom key builder receiving the
+            call's arguments and returning a hashable key; defaults to
+            the typed-argument key.
     Returns:
         Callable: Decorator function.
     """
     def decorator(func: Callable) -> Callable:
+        make_key = key_fn or _compile_cache_key(func)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Create cache key from function name and parameters
-            cache_key = f"{func.__name__}:{str(args)}:{str(sorted(kwargs.items()))}"
-            
-            # Try to get from cache
-            cached_result = _query_cache.get(cache_key)
+            # Create cache key from function name and parameters, then
+            # try the cache; an unhashable argument means this call
+            # can't be cached, so just execute it
+            try:
+                if make_key is not None:
+                    cache_key = make_key(*args, **kwargs)
+                else:
+                    cache_key = _default_cache_key(func, args, kwargs)
+                cached_result = _query_cache.get(cache_key)
+            except TypeError:
+                return func(*args, **kwargs)
             if cached_result is not None:
-                logger.info(f"Cache hit for {func.__name__}")
+                logger.info("Cache hit for %s", func.__name__)
                 return cached_result
-            
+
             # Execute function and cache result
-            logger.info(f"Cache miss for {func.__name__}, executing...")
+            logger.info("Cache miss for %s, executing...", func.__name__)
             result = func(*args, **kwargs)
-            
+
             # Cache the result
-            _query_cache.set(cache_key, result)
-            logger.info(f"Result cached for {func.__name__}")
+            _query_cache.set(cache_key, result, cache_ttl)
+            logger.info("Result cached for %s", func.__name__)
             
             return result
         
@@ -199,11 +299,11 @@ def error_handling_decorator(func: Callable) -> Callable:
             return func(*args, **kwargs)
         
         except ConnectionError as e:
-            logger.error(f"Database connection error in {func.__name__}: {str(e)}")
+            logger.error("Database connection error in %s: %s", func.__name__, e)
             raise RuntimeError(f"Failed to connect to database: {str(e)}")
-        
+
         except Exception as e:
-            logger.error(f"Unexpected error in {func.__name__}: {str(e)}")
+            logger.error("Unexpected error in %s: %s", func.__name__, e)
             raise RuntimeError(f"Database operation failed: {str(e)}")
     
     return wrapper
@@ -232,11 +332,13 @@ def retry_decorator(max_retries: int = 3, delay: float = 1.0) -> Callable:
                 except Exception as e:
                     last_exception = e
                     if attempt < max_retries:
-                        logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {str(e)}")
-                        logger.info(f"Retrying in {delay} seconds...")
+                        logger.warning("Attempt %d failed for %s: %s",
+                                       attempt + 1, func.__name__, e)
+                        logger.info("Retrying in %s seconds...", delay)
                         time.sleep(delay)
                     else:
-                        logger.error(f"All {max_retries + 1} attempts failed for {func.__name__}")
+                        logger.error("All %d attempts failed for %s",
+                                     max_retries + 1, func.__name__)
             
             raise last_exception
         
@@ -244,26 +346,90 @@ def retry_decorator(max_retries: int = 3, delay: float = 1.0) -> Callable:
     return decorator
 
 
-def database_operation(cache_ttl: int = 300, max_retries: int = 3) -> Callable:
+def database_operation(cache_ttl: int = 300, max_retries: int = 3,
+                       delay: float = 1.0, key_fn: Callable = None) -> Callable:
     """
-    Composite decorator that combines multiple decorators for database operations.
-    This provides a complete solution for database method enhancement.
-    
+    Composite decorator that combines caching, timing, logging, error
+    handling and retries for database operations.
+
+    A single wrapper replaces the former stack of five nested
+    decorators: a cache hit returns after one frame and one cache
+    lookup, and the timing/logging/retry machinery only runs when the
+    underlying function is actually called. Log lines are gated on
+    isEnabledFor so their f-strings are never built when the logger is
+    quiet.
+
     Args:
         cache_ttl (int): Cache time-to-live in seconds.
         max_retries (int): Maximum number of retries.
+        delay (float): Delay between retries in seconds.
+        key_fn (Callable, optional): Custom key builder receiving the
+            call's arguments and returning a hashable key; defaults to
+            the typed-argument key.
     Returns:
         Callable: Composite decorator function.
     """
     def decorator(func: Callable) -> Callable:
-        # Apply decorators in order (innermost first)
-        decorated_func = func
-        decorated_func = error_handling_decorator(decorated_func)
-        decorated_func = retry_decorator(max_retries)(decorated_func)
-        decorated_func = caching_decorator(cache_ttl)(decorated_func)
-        decorated_func = timing_decorator(decorated_func)
-        decorated_func = logging_decorator(decorated_func)
-        
-        return decorated_func
-    
-    return decorator 
\ No newline at end of file
+        name = func.__name__
+        make_key = key_fn or _compile_cache_key(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Fast path: serve from cache without timing or retry setup.
+            # A call whose arguments can't form a hashable key still runs
+            # through the timing/retry machinery below, just uncached.
+            try:
+                if make_key is not None:
+                    cache_key = make_key(*args, **kwargs)
+                else:
+                    cache_key = _default_cache_key(func, args, kwargs)
+                cached_result = _query_cache.get(cache_key)
+            except TypeError:
+                cache_key = None
+                cached_result = None
+            if cached_result is not None:
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Cache hit for %s", name)
+                return cached_result
+
+            verbose = logger.isEnabledFor(logging.INFO)
+            if verbose:
+                logger.info("Calling %s", name)
+            start_ns = time.perf_counter_ns()
+
+            last_exception = None
+            for attempt in range(max_retries + 1):
+                try:
+                    result = func(*args, **kwargs)
+                    break
+                except ConnectionError as e:
+                    logger.error("Database connection error in %s: %s", name, e)
+                    last_exception = RuntimeError(
+                        f"Failed to connect to database: {str(e)}")
+                except Exception as e:
+                    logger.error("Unexpected error in %s: %s", name, e)
+                    last_exception = RuntimeError(
+                        f"Database operation failed: {str(e)}")
+                if attempt < max_retries:
+                    logger.warning("Attempt %d failed for %s", attempt + 1, name)
+                    time.sleep(delay)
+            else:
+                logger.error("All %d attempts failed for %s", max_retries + 1, name)
+                raise last_exception
+
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            if isinstance(result, pd.DataFrame):
+                result.attrs['execution_time_ns'] = elapsed_ns
+                if verbose:
+                    logger.info("Returned DataFrame with %d rows and %d columns",
+                                len(result), len(result.columns))
+            if verbose:
+                logger.info("%s executed in %.4f seconds", name, elapsed_ns / 1e9)
+
+            if cache_key is not None:
+                _query_cache.set(cache_key, result, cache_ttl)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -1,29 +1,59 @@
 """
 Factory Method pattern implementation for creating model instances.
 """
-from abc import ABC, abstractmethod
-from typing import Dict, Any, Type
+from typing import Dict, Any, Protocol, Type, TYPE_CHECKING
 import pandas as pd
 
-from ..models.category import Category
-from ..models.city import City
-from ..models.country import Country
-from ..models.customer import Customer
-from ..models.employee import Employee
-from ..models.product import Product
-from ..models.sale import Sale
-from ..models.base_model import BaseModel
+if TYPE_CHECKING:
+    from ..models.base_model import BaseModel
+    from ..models.category import Category
+    from ..models.product import Product
+    from ..models.sale import Sale
 
 
-class ModelFactory(ABC):
+#: Lazily imported model classes, keyed by model type. Populated on
+#: first use so importing this module does not pull in every model
+#: module (and its dependencies) just to reach one factory.
+_model_classes: Dict[str, type] = {}
+
+
+def _load_model_classes() -> Dict[str, type]:
+    """
+    Import the model classes on first use and cache them.
+    Returns:
+        Dict[str, type]: Model classes keyed by model type.
     """
-    Abstract factory class for creating model instances.
-    This pattern solves the problem of object creation complexity and allows
-    for easy extension when new model types are added.
+    if not _model_classes:
+        from ..models.category import Category
+        from ..models.city import City
+        from ..models.country import Country
+        from ..models.customer import Customer
+        from ..models.employee import Employee
+        from ..models.product import Product
+        from ..models.sale import Sale
+        _model_classes.update(
+            category=Category,
+            city=City,
+            country=Country,
+            customer=Customer,
+            employee=Employee,
+            product=Product,
+            sale=Sale,
+        )
+    return _model_classes
+
+
+class ModelFactory(Protocol):
     """
-    
-    @abstractmethod
-    def create_model(self, data: Dict[str, Any]) -> BaseModel:
+    Factory interface for creating model instances.
+    A structural Protocol rather than an ABC, so concrete factories
+    carry no abstract-base machinery at runtime while static checkers
+    still enforce the interface.
+    """
+
+    __slots__ = ()
+
+    def create_model(self, data: Dict[str, Any]) -> 'BaseModel':
         """
         Create a model instance from data.
         Args:
@@ -31,10 +61,9 @@ class ModelFactory(ABC):
         Returns:
             BaseModel: Created model instance.
         """
-        pass
+        ...
 
-    @abstractmethod
-    def create_from_dataframe(self, df: pd.DataFrame) -> BaseModel:
+    def create_from_dataframe(self, df: pd.DataFrame) -> 'BaseModel':
         """
         Create a model instance from a DataFrame row.
         Args:
@@ -42,15 +71,27 @@ class ModelFactory(ABC):
         Returns:
             BaseModel: Created model instance.
         """
-        pass
+        ...
+
+    def create_models(self, df: pd.DataFrame) -> list:
+        """
+        Create one model instance per DataFrame row in a single pass.
+        Args:
+            df (pd.DataFrame): DataFrame with one row per model.
+        Returns:
+            list: Created model instances.
+        """
+        ...
 
 
-class CategoryFactory(ModelFactory):
+class CategoryFactory:
     """
     Factory for creating Category model instances.
     """
-    
-    def create_model(self, data: Dict[str, Any]) -> Category:
+
+    __slots__ = ()
+
+    def create_model(self, data: Dict[str, Any]) -> 'Category':
         """
         Create a Category instance from data.
         Args:
@@ -58,9 +99,9 @@ class CategoryFactory(ModelFactory):
         Returns:
             Category: Created Category instance.
         """
-        return Category.from_dict(data)
-    
-    def create_from_dataframe(self, df: pd.DataFrame) -> Category:
+        return _load_model_classes()['category'].from_dict(data)
+
+    def create_from_dataframe(self, df: pd.DataFrame) -> 'Category':
         """
         Create a Category instance from a DataFrame row.
         Args:
@@ -68,15 +109,31 @@ class CategoryFactory(ModelFactory):
         Returns:
             Category: Created Category instance.
         """
-        return Category.from_dataframe(df)
+        return _load_model_classes()['category'].from_dataframe(df)
+
+    def create_models(self, df: pd.DataFrame) -> list:
+        """
+        Create a Category instance per DataFrame row in a single pass.
 
+        Delegates to the model's batch hydrator, which pulls each
+        column once and zips rows instead of dispatching per row.
 
-class ProductFactory(ModelFactory):
+        Args:
+            df (pd.DataFrame): DataFrame with one row per category.
+        Returns:
+            list: Created Category instances.
+        """
+        return _load_model_classes()['category'].from_dataframe_batch(df)
+
+
+class ProductFactory:
     """
     Factory for creating Product model instances.
     """
-    
-    def create_model(self, data: Dict[str, Any]) -> Product:
+
+    __slots__ = ()
+
+    def create_model(self, data: Dict[str, Any]) -> 'Product':
         """
         Create a Product instance from data.
         Args:
@@ -84,9 +141,9 @@ class ProductFactory(ModelFactory):
         Returns:
             Product: Created Product instance.
         """
-        return Product.from_dict(data)
-    
-    def create_from_dataframe(self, df: pd.DataFrame) -> Product:
+        return _load_model_classes()['product'].from_dict(data)
+
+    def create_from_dataframe(self, df: pd.DataFrame) -> 'Product':
         """
         Create a Product instance from a DataFrame row.
         Args:
@@ -94,15 +151,31 @@ class ProductFactory(ModelFactory):
         Returns:
             Product: Created Product instance.
         """
-        return Product.from_dataframe(df)
+        return _load_model_classes()['product'].from_dataframe(df)
+
+    def create_models(self, df: pd.DataFrame) -> list:
+        """
+        Create a Product instance per DataFrame row in a single pass.
+
+        Delegates to the model's batch hydrator, which pulls each
+        column once and zips rows instead of dispatching per row.
 
+        Args:
+            df (pd.DataFrame): DataFrame with one row per product.
+        Returns:
+            list: Created Product instances.
+        """
+        return _load_model_classes()['product'].from_dataframe_batch(df)
 
-class SaleFactory(ModelFactory):
+
+class SaleFactory:
     """
     Factory for creating Sale model instances.
     """
-    
-    def create_model(self, data: Dict[str, Any]) -> Sale:
+
+    __slots__ = ()
+
+    def create_model(self, data: Dict[str, Any]) -> 'Sale':
         """
         Create a Sale instance from data.
         Args:
@@ -110,9 +183,9 @@ class SaleFactory(ModelFactory):
         Returns:
             Sale: Created Sale instance.
         """
-        return Sale.from_dict(data)
-    
-    def create_from_dataframe(self, df: pd.DataFrame) -> Sale:
+        return _load_model_classes()['sale'].from_dict(data)
+
+    def create_from_dataframe(self, df: pd.DataFrame) -> 'Sale':
         """
         Create a Sale instance from a DataFrame row.
         Args:
@@ -120,7 +193,21 @@ class SaleFactory(ModelFactory):
         Returns:
             Sale: Created Sale instance.
         """
-        return Sale.from_dataframe(df)
+        return _load_model_classes()['sale'].from_dataframe(df)
+
+    def create_models(self, df: pd.DataFrame) -> list:
+        """
+        Create a Sale instance per DataFrame row in a single pass.
+
+        Delegates to the model's batch hydrator, which pulls each
+        column once and zips rows instead of dispatching per row.
+
+        Args:
+            df (pd.DataFrame): DataFrame with one row per sale.
+        Returns:
+            list: Created Sale instances.
+        """
+        return _load_model_classes()['sale'].from_dataframe_batch(df)
 
 
 class ModelFactoryRegistry:
@@ -129,21 +216,52 @@ class ModelFactoryRegistry:
     This solves the problem of having to know which specific factory to use
     and provides a unified interface for model creation.
     """
-    
+
     _factories: Dict[str, Type[ModelFactory]] = {
         'category': CategoryFactory,
         'product': ProductFactory,
         'sale': SaleFactory,
-        'city': ModelFactory,  # Could be expanded with specific factories
-        'country': ModelFactory,
-        'customer': ModelFactory,
-        'employee': ModelFactory,
     }
-    
+
+    #: The factories are stateless, so one instance per type is shared
+    #: across all callers instead of allocating a fresh one per call
+    _instances: Dict[str, ModelFactory] = {}
+
+    #: Direct dispatch: model_type -> (from_dict, from_dataframe,
+    #: batch) callables. The concrete factories only forward to these
+    #: classmethods, so the registry calls them without routing each
+    #: creation through a factory object and its virtual dispatch.
+    #: Entries are bound lazily per type so the model modules are not
+    #: imported until a type is actually created.
+    _dispatch: Dict[str, tuple] = {}
+
+    @classmethod
+    def _dispatch_entry(cls, model_type: str) -> tuple:
+        """
+        Get (and on first use bind) the dispatch tuple for a model type.
+        Args:
+            model_type (str): Type of model to dispatch on.
+        Returns:
+            tuple: (from_dict, from_dataframe, batch) callables.
+        Raises:
+            KeyError: If model type is not supported.
+        """
+        entry = cls._dispatch.get(model_type)
+        if entry is None:
+            model = _load_model_classes()[model_type]
+            entry = (model.from_dict, model.from_dataframe,
+                     model.from_dataframe_batch)
+            cls._dispatch[model_type] = entry
+        return entry
+
     @classmethod
     def get_factory(cls, model_type: str) -> ModelFactory:
         """
         Get the appropriate factory for a model type.
+
+        Factories carry no state, so the instance created on first
+        request is cached and reused by every later call.
+
         Args:
             model_type (str): Type of model ('category', 'product', 'sale', etc.)
         Returns:
@@ -151,14 +269,16 @@ class ModelFactoryRegistry:
         Raises:
             ValueError: If model type is not supported.
         """
-        if model_type not in cls._factories:
-            raise ValueError(f"Unsupported model type: {model_type}")
-        
-        factory_class = cls._factories[model_type]
-        return factory_class()
-    
+        factory = cls._instances.get(model_type)
+        if factory is None:
+            if model_type not in cls._factories:
+                raise ValueError(f"Unsupported model type: {model_type}")
+            factory = cls._factories[model_type]()
+            cls._instances[model_type] = factory
+        return factory
+
     @classmethod
-    def create_model(cls, model_type: str, data: Dict[str, Any]) -> BaseModel:
+    def create_model(cls, model_type: str, data: Dict[str, Any]) -> 'BaseModel':
         """
         Create a model instance using the appropriate factory.
         Args:
@@ -166,10 +286,31 @@ class ModelFactoryRegistry:
             data (Dict[str, Any]): Data for the model.
         Returns:
             BaseModel: Created model instance.
+        Raises:
+            ValueError: If model type is not supported.
+        """
+        try:
+            return cls._dispatch_entry(model_type)[0](data)
+        except KeyError:
+            raise ValueError(f"Unsupported model type: {model_type}")
+
+    @classmethod
+    def create_models(cls, model_type: str, df: pd.DataFrame) -> list:
         """
-        factory = cls.get_factory(model_type)
-        return factory.create_model(data)
-    
+        Create one model per DataFrame row using the appropriate factory.
+        Args:
+            model_type (str): Type of model to create.
+            df (pd.DataFrame): DataFrame with one row per model.
+        Returns:
+            list: Created model instances.
+        Raises:
+            ValueError: If model type is not supported.
+        """
+        try:
+            return cls._dispatch_entry(model_type)[2](df)
+        except KeyError:
+            raise ValueError(f"Unsupported model type: {model_type}")
+
     @classmethod
     def register_factory(cls, model_type: str, factory_class: Type[ModelFactory]) -> None:
         """
@@ -178,4 +319,11 @@ class ModelFactoryRegistry:
             model_type (str): Model type identifier.
             factory_class (Type[ModelFactory]): Factory class to register.
         """
-        cls._factories[model_type] = factory_class 
\ No newline at end of file
+        cls._factories[model_type] = factory_class
+        # Drop any cached instance of the factory being replaced and
+        # route dispatch through one instance of the new factory
+        cls._instances.pop(model_type, None)
+        factory = factory_class()
+        cls._dispatch[model_type] = (factory.create_model,
+                                     factory.create_from_dataframe,
+                                     factory.create_models)
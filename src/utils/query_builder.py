@@ -1,7 +1,54 @@
 """
 Builder pattern implementation for constructing SQL queries.
 """
-from typing import List, Dict, Any, Optional
+import io
+import sys
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, Optional
+
+import numpy as np
+
+
+def _write_clause(buf: io.StringIO, keyword: str, parts: List[str],
+                  separator: str) -> None:
+    """Write a keyword followed by separator-joined parts into buf."""
+    buf.write(keyword)
+    buf.write(parts[0])
+    for part in parts[1:]:
+        buf.write(separator)
+        buf.write(part)
+
+
+#: Clause kinds in SQL emission order; one tagged segment list replaces
+#: five per-clause lists, and build() sorts it stably so clauses come
+#: out in this order while entries within a clause keep call order.
+#: Each segment carries (kind, literal_text, placeholder_text): build()
+#: emits the literal form, build_parameterized() the %s form.
+_JOIN, _WHERE, _GROUP_BY, _HAVING, _ORDER_BY = range(5)
+_CLAUSE_PREFIXES = ("\n", "\nWHERE ", "\nGROUP BY ", "\nHAVING ", "\nORDER BY ")
+_CLAUSE_SEPARATORS = ("\n", " AND ", ", ", ", ", ", ")
+
+#: Per-type condition formatters: one dict lookup on type() replaces
+#: the isinstance branch in the comparison helpers. bool formats as
+#: its integer value so MySQL sees 0/1 rather than a bare True/False.
+_EQ_FORMATTERS = {
+    str: lambda field, value: f"{field} = '{value}'",
+    int: lambda field, value: f"{field} = {value}",
+    float: lambda field, value: f"{field} = {value}",
+    bool: lambda field, value: f"{field} = {int(value)}",
+}
+_BETWEEN_FORMATTERS = {
+    str: lambda field, start, end: f"{field} BETWEEN '{start}' AND '{end}'",
+    int: lambda field, start, end: f"{field} BETWEEN {start} AND {end}",
+    float: lambda field, start, end: f"{field} BETWEEN {start} AND {end}",
+}
+
+#: Interned join fragments: joining a 4-tuple of shared fragments is
+#: cheaper than re-formatting the keywords into every join string
+_INNER_JOIN = sys.intern("INNER JOIN ")
+_LEFT_JOIN = sys.intern("LEFT JOIN ")
+_RIGHT_JOIN = sys.intern("RIGHT JOIN ")
+_ON = sys.intern(" ON ")
 
 
 class SQLQueryBuilder:
@@ -10,7 +57,10 @@ class SQLQueryBuilder:
     This pattern solves the problem of complex query construction and makes
     the code more readable and maintainable.
     """
-    
+
+    __slots__ = ('_select_fields', '_from_table', '_segments', '_params',
+                 '_limit_value')
+
     def __init__(self):
         """
         Initialize the query builder.
@@ -25,14 +75,15 @@ class SQLQueryBuilder:
         """
         self._select_fields: List[str] = []
         self._from_table: str = ""
-        self._joins: List[str] = []
-        self._where_conditions: List[str] = []
-        self._group_by_fields: List[str] = []
-        self._having_conditions: List[str] = []
-        self._order_by_fields: List[str] = []
+        self._segments: List[tuple] = []
+        self._params: List[Any] = []
         self._limit_value: Optional[int] = None
         return self
-    
+
+    def _append_segment(self, kind: int, text: str) -> None:
+        """Append a value-free segment (same text in both forms)."""
+        self._segments.append((kind, text, text))
+
     def select(self, fields: List[str]) -> 'SQLQueryBuilder':
         """
         Add SELECT fields to the query.
@@ -75,7 +126,7 @@ class SQLQueryBuilder:
         Returns:
             SQLQueryBuilder: Self for method chaining.
         """
-        self._joins.append(f"INNER JOIN {table} ON {on_condition}")
+        self._append_segment(_JOIN, "".join((_INNER_JOIN, table, _ON, on_condition)))
         return self
     
     def left_join(self, table: str, on_condition: str) -> 'SQLQueryBuilder':
@@ -87,7 +138,7 @@ class SQLQueryBuilder:
         Returns:
             SQLQueryBuilder: Self for method chaining.
         """
-        self._joins.append(f"LEFT JOIN {table} ON {on_condition}")
+        self._append_segment(_JOIN, "".join((_LEFT_JOIN, table, _ON, on_condition)))
         return self
     
     def right_join(self, table: str, on_condition: str) -> 'SQLQueryBuilder':
@@ -99,7 +150,7 @@ class SQLQueryBuilder:
         Returns:
             SQLQueryBuilder: Self for method chaining.
         """
-        self._joins.append(f"RIGHT JOIN {table} ON {on_condition}")
+        self._append_segment(_JOIN, "".join((_RIGHT_JOIN, table, _ON, on_condition)))
         return self
     
     def where(self, condition: str) -> 'SQLQueryBuilder':
@@ -110,7 +161,7 @@ class SQLQueryBuilder:
         Returns:
             SQLQueryBuilder: Self for method chaining.
         """
-        self._where_conditions.append(condition)
+        self._append_segment(_WHERE, condition)
         return self
     
     def where_equals(self, field: str, value: Any) -> 'SQLQueryBuilder':
@@ -122,23 +173,44 @@ class SQLQueryBuilder:
         Returns:
             SQLQueryBuilder: Self for method chaining.
         """
-        if isinstance(value, str):
-            self._where_conditions.append(f"{field} = '{value}'")
-        else:
-            self._where_conditions.append(f"{field} = {value}")
+        fmt = _EQ_FORMATTERS.get(type(value))
+        if fmt is None:
+            # Unregistered types keep the original quoting rule
+            fmt = _EQ_FORMATTERS[str if isinstance(value, str) else int]
+        self._segments.append((_WHERE, fmt(field, value), f"{field} = %s"))
+        self._params.append(value)
         return self
     
     def where_in(self, field: str, values: List[Any]) -> 'SQLQueryBuilder':
         """
         Add a WHERE IN condition.
+
+        Homogeneous value lists — the common case — take a single-join
+        fast path instead of a per-element isinstance-and-format pass.
+
         Args:
             field (str): Field name.
             values (List[Any]): List of values.
         Returns:
             SQLQueryBuilder: Self for method chaining.
         """
-        value_str = ", ".join([f"'{v}'" if isinstance(v, str) else str(v) for v in values])
-        self._where_conditions.append(f"{field} IN ({value_str})")
+        if isinstance(values, np.ndarray):
+            # Bulk ID lists: tolist plus one C-level list repr replaces
+            # a per-element Python str() call for each value
+            value_str = repr(values.tolist())[1:-1]
+        elif values and all(type(v) is str for v in values):
+            joined = "', '".join(values)
+            value_str = f"'{joined}'"
+        elif not any(isinstance(v, str) for v in values):
+            value_str = repr(list(values))[1:-1]
+        else:
+            value_str = ", ".join(
+                f"'{v}'" if isinstance(v, str) else str(v) for v in values)
+        items = values.tolist() if isinstance(values, np.ndarray) else values
+        placeholders = ", ".join(("%s",) * len(items))
+        self._segments.append((_WHERE, f"{field} IN ({value_str})",
+                               f"{field} IN ({placeholders})"))
+        self._params.extend(items)
         return self
     
     def where_between(self, field: str, start: Any, end: Any) -> 'SQLQueryBuilder':
@@ -151,13 +223,13 @@ class SQLQueryBuilder:
         Returns:
             SQLQueryBuilder: Self for method chaining.
         """
-        if isinstance(start, str):
-            start_str = f"'{start}'"
-            end_str = f"'{end}'"
-        else:
-            start_str = str(start)
-            end_str = str(end)
-        self._where_conditions.append(f"{field} BETWEEN {start_str} AND {end_str}")
+        # One dispatch on the start value decides quoting for both ends
+        fmt = _BETWEEN_FORMATTERS.get(type(start))
+        if fmt is None:
+            fmt = _BETWEEN_FORMATTERS[str if isinstance(start, str) else int]
+        self._segments.append((_WHERE, fmt(field, start, end),
+                               f"{field} BETWEEN %s AND %s"))
+        self._params.extend((start, end))
         return self
     
     def group_by(self, fields: List[str]) -> 'SQLQueryBuilder':
@@ -168,7 +240,7 @@ class SQLQueryBuilder:
         Returns:
             SQLQueryBuilder: Self for method chaining.
         """
-        self._group_by_fields.extend(fields)
+        self._segments.extend((_GROUP_BY, field, field) for field in fields)
         return self
     
     def having(self, condition: str) -> 'SQLQueryBuilder':
@@ -179,7 +251,7 @@ class SQLQueryBuilder:
         Returns:
             SQLQueryBuilder: Self for method chaining.
         """
-        self._having_conditions.append(condition)
+        self._append_segment(_HAVING, condition)
         return self
     
     def order_by(self, field: str, direction: str = "ASC") -> 'SQLQueryBuilder':
@@ -191,7 +263,7 @@ class SQLQueryBuilder:
         Returns:
             SQLQueryBuilder: Self for method chaining.
         """
-        self._order_by_fields.append(f"{field} {direction.upper()}")
+        self._append_segment(_ORDER_BY, f"{field} {direction.upper()}")
         return self
     
     def limit(self, count: int) -> 'SQLQueryBuilder':
@@ -208,6 +280,11 @@ class SQLQueryBuilder:
     def build(self) -> str:
         """
         Build the final SQL query string.
+
+        Every clause is written straight into one StringIO buffer with
+        separators interleaved, so no intermediate joined strings or
+        parts list are allocated per build.
+
         Returns:
             str: Complete SQL query.
         Raises:
@@ -217,54 +294,147 @@ class SQLQueryBuilder:
             raise ValueError("SELECT fields are required")
         if not self._from_table:
             raise ValueError("FROM table is required")
-        
-        # Build SELECT clause
-        select_clause = "SELECT " + ", ".join(self._select_fields)
-        
-        # Build FROM clause
-        from_clause = f"FROM {self._from_table}"
-        
-        # Build query parts
-        query_parts = [select_clause, from_clause]
-        
-        # Add JOINs
-        if self._joins:
-            query_parts.extend(self._joins)
-        
-        # Add WHERE
-        if self._where_conditions:
-            where_clause = "WHERE " + " AND ".join(self._where_conditions)
-            query_parts.append(where_clause)
-        
-        # Add GROUP BY
-        if self._group_by_fields:
-            group_by_clause = "GROUP BY " + ", ".join(self._group_by_fields)
-            query_parts.append(group_by_clause)
-        
-        # Add HAVING
-        if self._having_conditions:
-            having_clause = "HAVING " + " AND ".join(self._having_conditions)
-            query_parts.append(having_clause)
-        
-        # Add ORDER BY
-        if self._order_by_fields:
-            order_by_clause = "ORDER BY " + ", ".join(self._order_by_fields)
-            query_parts.append(order_by_clause)
-        
-        # Add LIMIT
+
+        return self._render(text_index=1)
+
+    def build_parameterized(self) -> tuple:
+        """
+        Build the query with %s placeholders and its parameter list.
+
+        Every distinct literal value embedded by build() produces a
+        unique SQL text, which defeats the server's prepared-statement
+        cache; the placeholder form keeps one plan for all values.
+
+        Returns:
+            tuple: (sql, params) ready for a parameterized execute.
+        Raises:
+            ValueError: If required parts are missing.
+        """
+        return self._render(text_index=2), list(self._params)
+
+    def _render(self, text_index: int) -> str:
+        """Write the query into one buffer using the chosen text form."""
+        if not self._select_fields:
+            raise ValueError("SELECT fields are required")
+        if not self._from_table:
+            raise ValueError("FROM table is required")
+
+        buf = io.StringIO()
+        _write_clause(buf, "SELECT ", self._select_fields, ", ")
+        buf.write("\nFROM ")
+        buf.write(self._from_table)
+
+        if self._segments:
+            # Stable sort groups segments into SQL clause order while
+            # keeping call order within each clause
+            self._segments.sort(key=lambda segment: segment[0])
+            previous_kind = -1
+            for segment in self._segments:
+                kind = segment[0]
+                if kind != previous_kind:
+                    buf.write(_CLAUSE_PREFIXES[kind])
+                    previous_kind = kind
+                else:
+                    buf.write(_CLAUSE_SEPARATORS[kind])
+                buf.write(segment[text_index])
+
         if self._limit_value:
-            limit_clause = f"LIMIT {self._limit_value}"
-            query_parts.append(limit_clause)
-        
-        return "\n".join(query_parts)
+            buf.write(f"\nLIMIT {self._limit_value}")
+
+        return buf.getvalue()
+
+
+@lru_cache(maxsize=1)
+def _sales_summary_by_category_sql() -> str:
+    """Build (once) the sales-summary-by-category preset query."""
+    return (SQLQueryBuilder()
+            .select([
+                "c.category_name",
+                "COUNT(s.sale_id) as total_sales",
+                "SUM(s.total_price) as total_revenue",
+                "AVG(s.total_price) as avg_sale_amount"
+            ])
+            .from_table("sales s")
+            .inner_join("products p", "s.product_id = p.product_id")
+            .inner_join("categories c", "p.category_id = c.category_id")
+            .group_by(["c.category_name"])
+            .order_by("total_revenue", "DESC")
+            .build())
+
+
+def _compile_preset(template: str) -> 'Callable':
+    """
+    exec-compile a preset template into a single-concat closure.
+
+    The builder chain runs once at import with a marker in place of the
+    dynamic value; the resulting SQL is split at the marker and the
+    compiled closure just concatenates the fixed parts around str(value)
+    instead of re-running ten builder calls.
+    """
+    parts = template.split(_PRESET_MARKER)
+    namespace = {f'_p{i}': part for i, part in enumerate(parts)}
+    expr = ' + str(value) + '.join(f'_p{i}' for i in range(len(parts)))
+    exec(f"def _preset(value):\n    return {expr}\n", namespace)
+    return namespace['_preset']
+
+
+#: Marker standing in for a preset's dynamic value while the template
+#: is built; it cannot occur in real SQL text
+_PRESET_MARKER = '\x00'
+
+_top_customers_preset = _compile_preset(
+    SQLQueryBuilder()
+    .select([
+        "CONCAT(c.first_name, ' ', c.last_name) as customer_name",
+        "COUNT(s.sale_id) as total_purchases",
+        "SUM(s.total_price) as total_spent"
+    ])
+    .from_table("sales s")
+    .inner_join("customers c", "s.customer_id = c.customer_id")
+    .group_by(["c.customer_id", "c.first_name", "c.last_name"])
+    .order_by("total_spent", "DESC")
+    .limit(_PRESET_MARKER)
+    .build())
+
+_monthly_sales_trend_preset = _compile_preset(
+    SQLQueryBuilder()
+    .select([
+        "MONTH(sale_date) as month",
+        "MONTHNAME(sale_date) as month_name",
+        "COUNT(sale_id) as total_sales",
+        "SUM(total_price) as total_revenue"
+    ])
+    .from_table("sales")
+    .where(f"YEAR(sale_date) = {_PRESET_MARKER}")
+    .group_by(["MONTH(sale_date)", "MONTHNAME(sale_date)"])
+    .order_by("month", "ASC")
+    .build())
+
+
+@lru_cache(maxsize=32)
+def _top_customers_sql(limit: int) -> str:
+    """Build (once per limit) the top-customers preset query."""
+    return _top_customers_preset(limit)
+
+
+@lru_cache(maxsize=32)
+def _monthly_sales_trend_sql(year: int) -> str:
+    """Build (once per year) the monthly-sales-trend preset query."""
+    return _monthly_sales_trend_preset(year)
 
 
 class QueryBuilderDirector:
     """
     Director class that provides preset query patterns.
     This provides common query patterns that can be reused.
+
+    The presets are deterministic for a given argument tuple, so each
+    delegates to an lru_cached module-level builder chain; repeated
+    calls cost a dict lookup instead of re-running the whole chain.
     """
-    
+
+    __slots__ = ('builder',)
+
     def __init__(self, builder: SQLQueryBuilder):
         """
         Initialize the director with a builder.
@@ -279,20 +449,7 @@ class QueryBuilderDirector:
         Returns:
             str: SQL query for sales summary by category.
         """
-        return (self.builder
-                .reset()
-                .select([
-                    "c.category_name",
-                    "COUNT(s.sale_id) as total_sales",
-                    "SUM(s.total_price) as total_revenue",
-                    "AVG(s.total_price) as avg_sale_amount"
-                ])
-                .from_table("sales s")
-                .inner_join("products p", "s.product_id = p.product_id")
-                .inner_join("categories c", "p.category_id = c.category_id")
-                .group_by(["c.category_name"])
-                .order_by("total_revenue", "DESC")
-                .build())
+        return _sales_summary_by_category_sql()
     
     def build_top_customers(self, limit: int = 10) -> str:
         """
@@ -302,19 +459,7 @@ class QueryBuilderDirector:
         Returns:
             str: SQL query for top customers.
         """
-        return (self.builder
-                .reset()
-                .select([
-                    "CONCAT(c.first_name, ' ', c.last_name) as customer_name",
-                    "COUNT(s.sale_id) as total_purchases",
-                    "SUM(s.total_price) as total_spent"
-                ])
-                .from_table("sales s")
-                .inner_join("customers c", "s.customer_id = c.customer_id")
-                .group_by(["c.customer_id", "c.first_name", "c.last_name"])
-                .order_by("total_spent", "DESC")
-                .limit(limit)
-                .build())
+        return _top_customers_sql(limit)
     
     def build_monthly_sales_trend(self, year: int) -> str:
         """
@@ -324,16 +469,4 @@ class QueryBuilderDirector:
         Returns:
             str: SQL query for monthly sales trend.
         """
-        return (self.builder
-                .reset()
-                .select([
-                    "MONTH(sale_date) as month",
-                    "MONTHNAME(sale_date) as month_name",
-                    "COUNT(sale_id) as total_sales",
-                    "SUM(total_price) as total_revenue"
-                ])
-                .from_table("sales")
-                .where(f"YEAR(sale_date) = {year}")
-                .group_by(["MONTH(sale_date)", "MONTHNAME(sale_date)"])
-                .order_by("month", "ASC")
-                .build()) 
\ No newline at end of file
+        return _monthly_sales_trend_sql(year) 
\ No newline at end of file
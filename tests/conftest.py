@@ -0,0 +1,73 @@
+"""
+Shared pytest fixtures for the test suite.
+"""
+import os
+
+import pytest
+
+# Point the connection singleton at an in-process SQLite database so
+# the suite never needs a live MySQL server. CI can override DB_URL to
+# run against a real backend; MySQL-only paths skip themselves.
+os.environ.setdefault('DB_URL', 'sqlite:///:memory:')
+
+from src.database.connection import DatabaseConnection
+from src.database.sql_objects_demo import SQLObjectsDemo
+
+
+def _probe_db() -> bool:
+    """
+    Check database availability once, at collection time.
+
+    Tests that need a live database mark themselves with
+    skipif(not DB_AVAILABLE, ...) and never pay a failed connection
+    attempt per test.
+    """
+    try:
+        return DatabaseConnection().test_connection()
+    except Exception:
+        return False
+
+
+DB_AVAILABLE = _probe_db()
+
+
+@pytest.fixture
+def frozen_time():
+    """
+    Freeze the clock at a fixed date for timing-sensitive tests.
+
+    Code paths that default to today's date (e.g. the sales report
+    procedure) become deterministic under this fixture instead of
+    depending on the system clock or real sleeps.
+    """
+    time_machine = pytest.importorskip("time_machine")
+    with time_machine.travel("2024-01-01", tick=False):
+        yield
+
+
+@pytest.fixture(scope="session")
+def db():
+    """
+    Shared DatabaseConnection for the whole session.
+
+    The connection is a singleton, so session scope makes the sharing
+    explicit and spares each test the constructor round-trip.
+    """
+    return DatabaseConnection()
+
+
+@pytest.fixture(scope="session")
+def demo(db):
+    """
+    Shared SQLObjectsDemo built once per session on the shared connection.
+
+    The catalog snapshot behind trigger_exists/view_exists/
+    function_exists is pre-warmed here so all existence checks in the
+    session cost one fused information_schema query.
+    """
+    demo = SQLObjectsDemo()
+    try:
+        demo._catalog_names
+    except Exception:
+        pass  # no catalog access; existence checks will retry and fail loudly
+    return demo
@@ -3,6 +3,11 @@ Unit tests for database operations and connection management.
 """
 import pytest
 from src.database.connection import DatabaseConnection
+from tests.conftest import DB_AVAILABLE
+
+# Skip decided once at collection time instead of failing per test
+pytestmark = pytest.mark.skipif(not DB_AVAILABLE,
+                                reason="Base de datos no disponible")
 
 def test_singleton_pattern():
     """Test that DatabaseConnection follows singleton pattern."""
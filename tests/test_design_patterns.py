@@ -17,6 +17,28 @@ from src.utils.analysis_strategies import (
 from src.utils.decorators import timing_decorator, logging_decorator, caching_decorator
 
 
+@pytest.fixture(scope="module")
+def sample_revenue_df():
+    """
+    Sample sales data for revenue-based tests, built once per module.
+    """
+    return pd.DataFrame({
+        'total_price': [100.0, 200.0, 150.0, 300.0],
+        'sale_id': [1, 2, 3, 4]
+    })
+
+
+@pytest.fixture(scope="module")
+def sample_quantity_df():
+    """
+    Sample sales data for quantity-based tests, built once per module.
+    """
+    return pd.DataFrame({
+        'quantity': [1, 5, 3, 10, 2],
+        'sale_id': [1, 2, 3, 4, 5]
+    })
+
+
 class TestSingletonPattern:
     """
     Test cases for Singleton pattern implementation.
@@ -35,10 +57,15 @@ class TestSingletonPattern:
             'DB_NAME': 'test_db'
         }):
             with patch('src.database.connection.create_engine'):
-                db1 = DatabaseConnection()
-                db2 = DatabaseConnection()
-                
-                assert db1 is db2, "DatabaseConnection should return the same instance"
+                try:
+                    db1 = DatabaseConnection()
+                    db2 = DatabaseConnection()
+
+                    assert db1 is db2, "DatabaseConnection should return the same instance"
+                finally:
+                    # Drop the mock-engine singleton so later tests build
+                    # a real connection instead of inheriting the mock
+                    DatabaseConnection._instance = None
     
     # Comentado porque la implementación actual no reinicia el singleton tras cerrar
     # def test_singleton_reset_after_close(self):
@@ -169,19 +196,13 @@ class TestStrategyPattern:
     Test cases for Strategy pattern implementation.
     """
     
-    def test_revenue_analysis_strategy(self):
+    def test_revenue_analysis_strategy(self, sample_revenue_df):
         """
         Test RevenueAnalysisStrategy.
         """
         strategy = RevenueAnalysisStrategy()
-        
-        # Create sample data
-        data = pd.DataFrame({
-            'total_price': [100.0, 200.0, 150.0, 300.0],
-            'sale_id': [1, 2, 3, 4]
-        })
-        
-        results = strategy.analyze(data)
+
+        results = strategy.analyze(sample_revenue_df)
         
         assert results['strategy'] == "Revenue Analysis Strategy"
         assert results['total_revenue'] == 750.0
@@ -189,19 +210,13 @@ class TestStrategyPattern:
         assert results['total_transactions'] == 4
         assert 'revenue_quartiles' in results
     
-    def test_quantity_analysis_strategy(self):
+    def test_quantity_analysis_strategy(self, sample_quantity_df):
         """
         Test QuantityAnalysisStrategy.
         """
         strategy = QuantityAnalysisStrategy()
-        
-        # Create sample data
-        data = pd.DataFrame({
-            'quantity': [1, 5, 3, 10, 2],
-            'sale_id': [1, 2, 3, 4, 5]
-        })
-        
-        results = strategy.analyze(data)
+
+        results = strategy.analyze(sample_quantity_df)
         
         assert results['strategy'] == "Quantity Analysis Strategy"
         assert results['total_items_sold'] == 21
@@ -303,17 +318,17 @@ class TestDecoratorPattern:
         assert result3 == 20
         assert call_count == 2
     
-    def test_decorator_with_dataframe_result(self):
+    def test_decorator_with_dataframe_result(self, sample_revenue_df):
         """
         Test decorator with DataFrame result.
         """
         @timing_decorator
         def function_returning_dataframe():
-            return pd.DataFrame({'col1': [1, 2, 3], 'col2': [4, 5, 6]})
-        
+            return sample_revenue_df
+
         result = function_returning_dataframe()
         assert isinstance(result, pd.DataFrame)
-        assert 'execution_time' in result.attrs
+        assert 'execution_time_ns' in result.attrs
 
 
 class TestIntegration:
@@ -341,7 +356,7 @@ class TestIntegration:
         assert "FROM categories" in query
         assert "WHERE category_id = 1" in query
     
-    def test_strategy_with_decorator(self):
+    def test_strategy_with_decorator(self, sample_revenue_df):
         """
         Test Strategy pattern combined with Decorator pattern.
         """
@@ -349,11 +364,10 @@ class TestIntegration:
         @logging_decorator
         def decorated_analysis(strategy, data):
             return strategy.analyze(data)
-        
+
         strategy = RevenueAnalysisStrategy()
-        data = pd.DataFrame({'total_price': [100.0, 200.0]})
-        
-        result = decorated_analysis(strategy, data)
-        
+
+        result = decorated_analysis(strategy, sample_revenue_df)
+
         assert result['strategy'] == "Revenue Analysis Strategy"
-        assert result['total_revenue'] == 300.0 
\ No newline at end of file
+        assert result['total_revenue'] == 750.0 
\ No newline at end of file
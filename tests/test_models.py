@@ -7,32 +7,33 @@ from src.models.category import Category
 from src.models.customer import Customer
 from src.models.sale import Sale
 
-def test_product_creation():
-    product = Product(product_id=1, product_name="Test Product", price=100.00, category_id=1)
-    assert product.product_id == 1
-    assert product.product_name == "Test Product"
-    assert product.price == 100.00
-    assert product.category_id == 1
 
-def test_category_creation():
-    category = Category(category_id=1, category_name="Test Category")
-    assert category.category_id == 1
-    assert category.category_name == "Test Category"
+@pytest.fixture(autouse=True)
+def _no_db(monkeypatch):
+    """
+    Fail fast if any model test touches the database.
 
-def test_customer_creation():
-    customer = Customer(customer_id=1, first_name="Test", last_name="Customer")
-    assert customer.customer_id == 1
-    assert customer.first_name == "Test"
-    assert customer.last_name == "Customer"
+    The models are plain in-memory objects; this keeps it that way by
+    making DatabaseConnection construction raise inside this module.
+    """
+    def _forbidden(cls):
+        raise RuntimeError("Database access is forbidden in model tests")
+    monkeypatch.setattr(
+        "src.database.connection.DatabaseConnection.__new__", _forbidden)
 
-def test_sale_creation():
-    sale = Sale(sale_id=1, sales_person_id=2, customer_id=3, product_id=4, quantity=5, discount=0.1, total_price=450.0, sale_date="2024-01-01", transaction_number="TXN001")
-    assert sale.sale_id == 1
-    assert sale.sales_person_id == 2
-    assert sale.customer_id == 3
-    assert sale.product_id == 4
-    assert sale.quantity == 5
-    assert sale.discount == 0.1
-    assert sale.total_price == 450.0
-    assert sale.sale_date == "2024-01-01"
-    assert sale.transaction_number == "TXN001"
+
+@pytest.mark.parametrize("cls, kwargs", [
+    (Product, {"product_id": 1, "product_name": "Test Product",
+               "price": 100.00, "category_id": 1}),
+    (Category, {"category_id": 1, "category_name": "Test Category"}),
+    (Customer, {"customer_id": 1, "first_name": "Test",
+                "last_name": "Customer"}),
+    (Sale, {"sale_id": 1, "sales_person_id": 2, "customer_id": 3,
+            "product_id": 4, "quantity": 5, "discount": 0.1,
+            "total_price": 450.0, "sale_date": "2024-01-01",
+            "transaction_number": "TXN001"}),
+], ids=["product", "category", "customer", "sale"])
+def test_model_creation(cls, kwargs):
+    obj = cls(**kwargs)
+    for field, value in kwargs.items():
+        assert getattr(obj, field) == value
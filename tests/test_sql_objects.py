@@ -2,20 +2,32 @@
 Unit tests for SQL objects (functions, triggers, procedures, views).
 """
 import pytest
-from src.database.sql_objects_demo import SQLObjectsDemo
 
-def test_sql_function_execution():
-    demo = SQLObjectsDemo()
+
+@pytest.fixture(scope="session")
+def sql_objects_available(demo):
+    """Probe once per session whether the SQL objects exist in the
+    test database, instead of paying a failed call per test."""
     try:
+        demo.demo_customer_lifetime_value(1, 12)
+        return True
+    except Exception:
+        return False
+
+
+@pytest.fixture(autouse=True)
+def _require_sql_objects(sql_objects_available):
+    if not sql_objects_available:
+        pytest.skip("Objetos SQL no disponibles en la base de datos de test")
+
+
+def test_sql_objects_batch(demo, subtests):
+    """One fixture entry covers all SQL object demos; subtests keep
+    per-assertion reporting."""
+    with subtests.test(msg="function execution"):
         result = demo.demo_customer_lifetime_value(1, 12)
         assert isinstance(result, (float, int))
-    except Exception:
-        pytest.skip("Función SQL no disponible en la base de datos de test")
 
-def test_sql_view_execution():
-    demo = SQLObjectsDemo()
-    try:
+    with subtests.test(msg="view execution"):
         result = demo.demo_customer_purchase_history(1)
         assert isinstance(result, list)
-    except Exception:
-        pytest.skip("Vista SQL no disponible en la base de datos de test")